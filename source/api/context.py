@@ -1,12 +1,22 @@
 """Template rendering utilities for FastAPI routes."""
 
 from decimal import Decimal
+from functools import lru_cache
 
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
 
 templates = Jinja2Templates(directory="templates")
 
+# Month pages repeat the same hours, balances and day counts on many rows.
+# format_hours, format_balance and format_days are cached because their output
+# depends on the numeric value alone, so equal Decimals such as 0.00 and -0.00
+# may share a key. format_hours_decimal prints "-0,00 h" and stays uncached.
+FILTER_CACHE_SIZE = 4096
+
+# format_duration labels for 0..1440 minutes (one full day), built once at import
+DURATION_LABELS = tuple(f"{minutes // 60}:{minutes % 60:02d}h" for minutes in range(24 * 60 + 1))
+
 
 def format_hours_decimal(value: Decimal | float | int | None) -> str:
     """Format decimal as hours: 8,50 h.
@@ -74,14 +84,17 @@ def format_hours(value: Decimal | None) -> str:
     """
     if value is None:
         return "-"
+    return _format_hours_cached(value)
+
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE, typed=True)
+def _format_hours_cached(value: Decimal) -> str:
+    """Format non-None hours for format_hours."""
     # Handle negative values
     is_negative = value < 0
-    abs_value = abs(value)
 
-    # Extract hours and minutes
-    hours = int(abs_value)
-    minutes = round((abs_value - hours) * 60)
+    # Round to whole minutes once, then split; a fraction rounding up to 60 carries into the hour
+    hours, minutes = divmod(round(abs(value) * 60), 60)
 
     # Format with sign if negative
     if is_negative:
@@ -109,6 +122,10 @@ def format_duration(value: int | None) -> str:
     if value is None:
         return "-"
 
+    # Durations within a single day come from the precomputed table
+    if isinstance(value, int) and 0 <= value < len(DURATION_LABELS):
+        return DURATION_LABELS[value]
+
     # Handle negative values
     is_negative = value < 0
     abs_value = abs(value)
@@ -144,14 +161,17 @@ def format_balance(value: Decimal | None) -> str:
     """
     if value is None:
         return "-"
+    return _format_balance_cached(value)
+
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE, typed=True)
+def _format_balance_cached(value: Decimal) -> str:
+    """Format non-None hours for format_balance."""
     # Determine sign (zero is positive)
     is_negative = value < 0
-    abs_value = abs(value)
 
-    # Extract hours and minutes
-    hours = int(abs_value)
-    minutes = round((abs_value - hours) * 60)
+    # Round to whole minutes once, then split; a fraction rounding up to 60 carries into the hour
+    hours, minutes = divmod(round(abs(value) * 60), 60)
 
     # Format with appropriate sign
     sign = "-" if is_negative else "+"
@@ -162,7 +182,12 @@ def format_days(value: Decimal | float | int | None) -> str:
     """Format day values with German decimal comma and no noisy zeros."""
     if value is None:
         return "-"
+    return _format_days_cached(value)
+
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE, typed=True)
+def _format_days_cached(value: Decimal | float | int) -> str:
+    """Format non-None day values for format_days."""
     decimal_value = Decimal(str(value)).quantize(Decimal("0.01"))
     if decimal_value == decimal_value.to_integral_value():
         return str(int(decimal_value))
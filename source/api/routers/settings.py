@@ -3,7 +3,9 @@
 Routes for user settings including weekday defaults.
 """
 
-from datetime import date
+import re
+from collections import defaultdict
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -19,6 +21,11 @@ from source.database.models import UserSettings
 router = APIRouter(prefix="/settings", tags=["settings"])
 
 EMPLOYEE_ID_SOURCES = {"internal", "custom"}
+# weekday_<n> or weekday_<n>_<field>; the day number is range-checked by the handler
+WEEKDAY_FIELD_PATTERN = re.compile(r"^weekday_(-?\d+)(?:_(.+))?$")
+# DD.MM.YYYY with optional leading zeros, as accepted by strptime("%d.%m.%Y")
+GERMAN_DATE_PATTERN = re.compile(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$")
+TIME_PATTERN = re.compile(r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
 HOLIDAY_STATE_CHOICES = (
     ("", "Bundesweit"),
     ("BW", "Baden-Württemberg"),
@@ -106,15 +113,36 @@ def _parse_optional_date(value: object) -> date | None:
     if not date_str:
         return None
 
-    from datetime import datetime
-
+    # ISO parsing is a C fast path and fails fast on German input
     try:
-        return datetime.strptime(date_str, "%d.%m.%Y").date()
+        return date.fromisoformat(date_str)
     except ValueError:
-        try:
-            return date.fromisoformat(date_str)
-        except ValueError as e:
-            raise HTTPException(status_code=422, detail="Ungültiges Datumsformat") from e
+        pass
+
+    match = GERMAN_DATE_PATTERN.match(date_str)
+    if match is None:
+        raise HTTPException(status_code=422, detail="Ungültiges Datumsformat")
+    day, month, year = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail="Ungültiges Datumsformat") from e
+
+
+def _parse_vacation_days(value: object) -> Decimal | None:
+    """Parse optional non-negative day counts accepting German decimal commas."""
+    days_str = str(value) if value is not None else ""
+    if not days_str:
+        return None
+
+    try:
+        # Convert German decimal format (comma) to standard (dot)
+        days = Decimal(days_str.replace(",", "."))
+        if days < 0:
+            raise HTTPException(status_code=422, detail="Urlaubstage dürfen nicht negativ sein")
+    except InvalidOperation as e:
+        raise HTTPException(status_code=422, detail="Ungültiger Zahlenwert") from e
+    return days
 
 
 def _form_bool(form_data: object, field_name: str, default: bool) -> bool:
@@ -215,8 +243,6 @@ async def update_weekday_defaults(
             )
 
         # Parse updated_at timestamp
-        from datetime import datetime
-
         try:
             sent_updated_at = datetime.fromisoformat(str(updated_at_str))
         except (ValueError, TypeError) as e:
@@ -239,39 +265,31 @@ async def update_weekday_defaults(
 
     weekday_defaults = settings.schedule_json["weekday_defaults"]
 
-    # Validate weekday keys are 0-6
-    for key in form_data.keys():
-        if key.startswith("weekday_"):
-            parts = key.split("_")
-            if len(parts) >= 2:
-                try:
-                    weekday_num = int(parts[1])
-                    if weekday_num < 0 or weekday_num > 6:
-                        raise HTTPException(status_code=422, detail="Ungültiger Wochentag")
-                except ValueError:
-                    pass  # Not a weekday field
-
-    # Process form data for each weekday (0-6)
-    import re
-
-    time_pattern = re.compile(r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$")
-
-    for i in range(7):
-        enabled_key = f"weekday_{i}_enabled"
-        start_key = f"weekday_{i}_start_time"
-        end_key = f"weekday_{i}_end_time"
-        break_key = f"weekday_{i}_break_minutes"
-
+    # Group submitted weekday fields by day and validate weekday keys are 0-6
+    weekday_fields: dict[int, dict[str, str]] = defaultdict(dict)
+    for key, value in form_data.items():
+        match = WEEKDAY_FIELD_PATTERN.match(key)
+        if not match:
+            continue  # Not a weekday field
+        weekday_num = int(match.group(1))
+        if weekday_num < 0 or weekday_num > 6:
+            raise HTTPException(status_code=422, detail="Ungültiger Wochentag")
+        # Only weekday_<i>_* with the plain day number is read; weekday_01_* passes the range check and is ignored
+        if match.group(2) and match.group(1) == str(weekday_num):
+            weekday_fields[weekday_num][match.group(2)] = value
+
+    # Process form data for each submitted weekday
+    for i, fields in sorted(weekday_fields.items()):
         # Check if any data was submitted for this weekday
-        if start_key in form_data or end_key in form_data or break_key in form_data:
-            start_time = form_data.get(start_key, "")
-            end_time = form_data.get(end_key, "")
-            break_minutes_str = form_data.get(break_key, "30")
+        if "start_time" in fields or "end_time" in fields or "break_minutes" in fields:
+            start_time = fields.get("start_time", "")
+            end_time = fields.get("end_time", "")
+            break_minutes_str = fields.get("break_minutes", "30")
 
             # Validate time format if provided
-            if start_time and not time_pattern.match(start_time):
+            if start_time and not TIME_PATTERN.match(start_time):
                 raise HTTPException(status_code=422, detail=f"Ungültige Startzeit für {GERMAN_DAYS[i]}")
-            if end_time and not time_pattern.match(end_time):
+            if end_time and not TIME_PATTERN.match(end_time):
                 raise HTTPException(status_code=422, detail=f"Ungültige Endzeit für {GERMAN_DAYS[i]}")
 
             # Validate end_time is after start_time for enabled work days
@@ -300,9 +318,9 @@ async def update_weekday_defaults(
                 "end_time": end_time,
                 "break_minutes": break_minutes,
             }
-        elif enabled_key in form_data:
+        elif "enabled" in fields:
             # Only enabled checkbox is present, but with value "false" - set to null
-            if form_data.get(enabled_key) == "false":
+            if fields["enabled"] == "false":
                 weekday_defaults[str(i)] = None
 
     # Mark the JSON column as modified to trigger SQLAlchemy change detection
@@ -359,8 +377,6 @@ async def update_tracking_settings(
             )
 
         # Parse updated_at timestamp
-        from datetime import datetime
-
         try:
             sent_updated_at = datetime.fromisoformat(str(updated_at_str))
         except (ValueError, TypeError) as e:
@@ -386,22 +402,8 @@ async def update_tracking_settings(
         except InvalidOperation as e:
             raise HTTPException(status_code=422, detail="Ungültige Wochenstunden") from e
 
-    # Parse tracking_start_date (German format: DD.MM.YYYY)
-    tracking_start_str = form_data.get("tracking_start_date", "")
-    if tracking_start_str:
-        try:
-            # Try German date format DD.MM.YYYY first
-            from datetime import datetime
-
-            settings.tracking_start_date = datetime.strptime(str(tracking_start_str), "%d.%m.%Y").date()
-        except ValueError:
-            # Fallback to ISO format
-            try:
-                settings.tracking_start_date = date.fromisoformat(str(tracking_start_str))
-            except ValueError as e:
-                raise HTTPException(status_code=422, detail="Ungültiges Datumsformat") from e
-    else:
-        settings.tracking_start_date = None
+    # Parse tracking_start_date (ISO or German DD.MM.YYYY)
+    settings.tracking_start_date = _parse_optional_date(form_data.get("tracking_start_date"))
 
     # Parse initial_hours_offset (HH:MM format, e.g., "24:20" or "-5:30")
     offset_str = form_data.get("initial_hours_offset", "")
@@ -493,8 +495,6 @@ async def update_vacation_settings(
             )
 
         # Parse updated_at timestamp
-        from datetime import datetime
-
         try:
             sent_updated_at = datetime.fromisoformat(str(updated_at_str))
         except (ValueError, TypeError) as e:
@@ -507,67 +507,13 @@ async def update_vacation_settings(
                 detail="Einstellungen wurden zwischenzeitlich geändert. Bitte laden Sie die Seite neu.",
             )
 
-    # Parse initial_vacation_days (German format: comma as decimal separator)
-    initial_days_str = form_data.get("initial_vacation_days", "")
-    if initial_days_str:
-        try:
-            # Convert German decimal format (comma) to standard (dot)
-            initial_days_str = str(initial_days_str).replace(",", ".")
-            initial_days = Decimal(initial_days_str)
-            if initial_days < Decimal("0"):
-                raise HTTPException(status_code=422, detail="Urlaubstage dürfen nicht negativ sein")
-            settings.initial_vacation_days = initial_days
-        except InvalidOperation as e:
-            raise HTTPException(status_code=422, detail="Ungültiger Zahlenwert") from e
-    else:
-        settings.initial_vacation_days = None
-
-    # Parse annual_vacation_days (German format)
-    annual_days_str = form_data.get("annual_vacation_days", "")
-    if annual_days_str:
-        try:
-            # Convert German decimal format
-            annual_days_str = str(annual_days_str).replace(",", ".")
-            annual_days = Decimal(annual_days_str)
-            if annual_days < Decimal("0"):
-                raise HTTPException(status_code=422, detail="Urlaubstage dürfen nicht negativ sein")
-            settings.annual_vacation_days = annual_days
-        except InvalidOperation as e:
-            raise HTTPException(status_code=422, detail="Ungültiger Zahlenwert") from e
-    else:
-        settings.annual_vacation_days = None
-
-    # Parse vacation_carryover_days (German format)
-    carryover_days_str = form_data.get("vacation_carryover_days", "")
-    if carryover_days_str:
-        try:
-            # Convert German decimal format
-            carryover_days_str = str(carryover_days_str).replace(",", ".")
-            carryover_days = Decimal(carryover_days_str)
-            if carryover_days < Decimal("0"):
-                raise HTTPException(status_code=422, detail="Urlaubstage dürfen nicht negativ sein")
-            settings.vacation_carryover_days = carryover_days
-        except InvalidOperation as e:
-            raise HTTPException(status_code=422, detail="Ungültiger Zahlenwert") from e
-    else:
-        settings.vacation_carryover_days = None
+    # Parse vacation day counts (German format: comma as decimal separator)
+    settings.initial_vacation_days = _parse_vacation_days(form_data.get("initial_vacation_days"))
+    settings.annual_vacation_days = _parse_vacation_days(form_data.get("annual_vacation_days"))
+    settings.vacation_carryover_days = _parse_vacation_days(form_data.get("vacation_carryover_days"))
 
-    # Parse vacation_carryover_expires (German format: DD.MM.YYYY)
-    carryover_expires_str = form_data.get("vacation_carryover_expires", "")
-    if carryover_expires_str:
-        try:
-            # Try German date format DD.MM.YYYY first
-            from datetime import datetime
-
-            settings.vacation_carryover_expires = datetime.strptime(str(carryover_expires_str), "%d.%m.%Y").date()
-        except ValueError:
-            # Fallback to ISO format
-            try:
-                settings.vacation_carryover_expires = date.fromisoformat(str(carryover_expires_str))
-            except ValueError as e:
-                raise HTTPException(status_code=422, detail="Ungültiges Datumsformat") from e
-    else:
-        settings.vacation_carryover_expires = None
+    # Parse vacation_carryover_expires (ISO or German DD.MM.YYYY)
+    settings.vacation_carryover_expires = _parse_optional_date(form_data.get("vacation_carryover_expires"))
 
     holiday_state = str(form_data.get("holiday_state") or "").strip()
     if holiday_state not in HOLIDAY_STATE_CODES:
@@ -608,8 +554,6 @@ async def update_employee_settings(
                 status_code=422, detail="Zeitstempel (updated_at) ist erforderlich für die Aktualisierung"
             )
 
-        from datetime import datetime
-
         try:
             sent_updated_at = datetime.fromisoformat(str(updated_at_str))
         except (ValueError, TypeError) as e:
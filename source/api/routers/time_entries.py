@@ -158,26 +158,30 @@ def get_balance_trend(db: Session, user_id: int, settings: UserSettings, weeks:
     today = date.today()
     trend_data = []
 
-    # Go back N weeks, iterate from oldest to newest
+    # Week boundaries from oldest to newest
+    week_ranges = []
     for i in range(weeks - 1, -1, -1):
-        # Calculate week boundaries
         days_offset = today.weekday() + (i * 7)
         week_end = today - timedelta(days=days_offset)
-        week_start = week_end - timedelta(days=6)
-
-        # Get entries for that week
-        week_entries = (
-            db.query(TimeEntry)
-            .filter(
-                TimeEntry.user_id == user_id,
-                TimeEntry.work_date >= week_start,
-                TimeEntry.work_date <= week_end,
-            )
-            .all()
+        week_ranges.append((week_end - timedelta(days=6), week_end))
+    if not week_ranges:
+        return trend_data
+
+    # Load the whole trend window once instead of querying week by week
+    trend_entries = (
+        db.query(TimeEntry)
+        .filter(
+            TimeEntry.user_id == user_id,
+            TimeEntry.work_date >= week_ranges[0][0],
+            TimeEntry.work_date <= week_ranges[-1][1],
         )
+        .all()
+    )
 
+    service = TimeCalculationService()
+    for week_start, week_end in week_ranges:
         # Calculate balance for this week
-        service = TimeCalculationService()
+        week_entries = [entry for entry in trend_entries if week_start <= entry.work_date <= week_end]
         weekly = service.weekly_summary(week_entries, settings, week_start)
 
         trend_data.append(
@@ -307,15 +311,6 @@ async def list_time_entries(
 
     # Add monthly view context if month/year are specified
     if month is not None and year is not None:
-        # Get or create UserSettings
-        settings = db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
-        if not settings:
-            # Create default settings if not found (MVP: user_id=1)
-            settings = UserSettings(user_id=user_id, weekly_target_hours=Decimal("40.00"))
-            db.add(settings)
-            db.commit()
-            db.refresh(settings)
-
         # Query ALL historical entries for carryover calculation
         # The monthly_summary method needs all entries to calculate carryover using all_time_balance
         if settings.tracking_start_date:
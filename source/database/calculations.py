@@ -4,14 +4,17 @@ This module provides pure functions for calculating hours, targets, and balances
 without modifying database models.
 """
 
-from datetime import date, datetime
+from datetime import date, time
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 from typing import Literal, overload
 
 from source.core import holidays as holiday_policy
 from source.database.enums import AbsenceType
 from source.database.models import TimeEntry, UserSettings
 
+SECONDS_PER_HOUR = Decimal(3600)
+
 
 @overload
 def is_public_holiday_for_settings(
@@ -104,6 +107,11 @@ def is_non_working_day_for_settings(
     return (False, None) if return_name else False
 
 
+def _seconds_of_day(value: time) -> int:
+    """Return whole seconds elapsed since midnight for a time of day."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
 def actual_hours(entry: TimeEntry) -> Decimal:
     """Calculate actual hours worked for a time entry.
 
@@ -120,26 +128,29 @@ def actual_hours(entry: TimeEntry) -> Decimal:
     if entry.absence_type == AbsenceType.VACATION:
         return Decimal("0.00")
 
-    if entry.start_time is None or entry.end_time is None:
+    # Read each mapped attribute once; ORM attribute access dominates this function's cost
+    start_time, end_time = entry.start_time, entry.end_time
+    if start_time is None or end_time is None:
         return Decimal("0.00")
 
-    # Calculate duration using datetime.combine
-    today = datetime.today().date()
-    start_dt = datetime.combine(today, entry.start_time)
-    end_dt = datetime.combine(today, entry.end_time)
-
-    # Calculate hours as decimal
-    duration_seconds = (end_dt - start_dt).total_seconds()
-    duration_hours = Decimal(str(duration_seconds / 3600))
-
-    # Subtract break time (convert minutes to hours)
-    break_hours = Decimal(str(entry.break_minutes)) / Decimal("60")
-    total_hours = duration_hours - break_hours
+    # Work in integer seconds and convert to Decimal hours once
+    worked_seconds = _seconds_of_day(end_time) - _seconds_of_day(start_time) - entry.break_minutes * 60
+    total_hours = Decimal(worked_seconds) / SECONDS_PER_HOUR
 
     # Round to 2 decimal places
     return total_hours.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
+@lru_cache(maxsize=64, typed=True)
+def _daily_target(weekly_target_hours: Decimal) -> Decimal:
+    """Return the daily target (weekly / 5 workdays) rounded to 2 decimal places.
+
+    Cached because every weekday of every entry divides the same weekly target.
+    """
+    daily_target = weekly_target_hours / Decimal("5")
+    return daily_target.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
 def target_hours(entry: TimeEntry, settings: UserSettings) -> Decimal:
     """Calculate target hours for a specific day.
 
@@ -171,12 +182,8 @@ def target_hours(entry: TimeEntry, settings: UserSettings) -> Decimal:
     if entry.absence_type in (AbsenceType.VACATION, AbsenceType.HOLIDAY):
         return Decimal("0.00")
 
-    # Calculate daily target (weekly / 5 workdays)
     # Note: SICK keeps normal target under the existing paid-absence model.
-    daily_target = settings.weekly_target_hours / Decimal("5")
-
-    # Round to 2 decimal places
-    return daily_target.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return _daily_target(settings.weekly_target_hours)
 
 
 def balance(entry: TimeEntry, settings: UserSettings) -> Decimal:
@@ -206,11 +213,9 @@ def balance(entry: TimeEntry, settings: UserSettings) -> Decimal:
     actual = actual_hours(entry)
     target = target_hours(entry, settings)
 
-    # Return difference
-    balance_value = actual - target
-
-    # Round to 2 decimal places
-    return balance_value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    # Both operands are already rounded to 2 decimal places, so their difference
+    # is exact and needs no further quantize
+    return actual - target
 
 
 __all__ = [
@@ -11,7 +11,7 @@ from decimal import Decimal
 from source.database.enums import AbsenceType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DaySummary:
     """Summary of a single day's time tracking.
 
@@ -32,7 +32,7 @@ class DaySummary:
     has_entry: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeeklySummary:
     """Summary of a week's time tracking.
 
@@ -53,7 +53,7 @@ class WeeklySummary:
     total_balance: Decimal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonthlySummary:
     """Summary of a month's time tracking.
 
@@ -5,6 +5,7 @@ calculation functions and provides period summary capabilities.
 """
 
 import calendar
+from collections import defaultdict
 from datetime import date, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 
@@ -74,19 +75,14 @@ class TimeCalculationService:
         Returns:
             sum(daily_balances for entries up to target_date) + initial_hours_offset
         """
-        # Start with all entries
-        filtered = entries
-
-        # Filter by tracking_start_date if set
-        if settings.tracking_start_date is not None:
-            filtered = [e for e in filtered if e.work_date >= settings.tracking_start_date]
-
-        # Filter by target_date if provided
-        if target_date is not None:
-            filtered = [e for e in filtered if e.work_date <= target_date]
+        # Keep entries within [tracking_start_date, target_date]; open bounds include everything,
+        # and each entry's work_date is read once in a single pass
+        first_date = settings.tracking_start_date or date.min
+        last_date = target_date or date.max
+        filtered = [e for e in entries if first_date <= e.work_date <= last_date]
 
         # Sum daily balances
-        total = sum((self.daily_balance(e, settings) for e in filtered), start=Decimal("0.00"))
+        total = sum((calc_balance(e, settings) for e in filtered), start=Decimal("0.00"))
 
         # Add initial_hours_offset if present
         if settings.initial_hours_offset is not None:
@@ -116,11 +112,12 @@ class TimeCalculationService:
         """
         # Filter entries by tracking start date if specified
         filtered_entries = entries
-        if respect_tracking_start and settings.tracking_start_date is not None:
-            filtered_entries = [e for e in entries if e.work_date >= settings.tracking_start_date]
+        tracking_start_date = settings.tracking_start_date
+        if respect_tracking_start and tracking_start_date is not None:
+            filtered_entries = [e for e in entries if e.work_date >= tracking_start_date]
 
         # Sum daily balances
-        total_balance = sum((self.daily_balance(entry, settings) for entry in filtered_entries), start=Decimal("0.00"))
+        total_balance = sum((calc_balance(entry, settings) for entry in filtered_entries), start=Decimal("0.00"))
 
         # Add initial hours offset if requested and available
         if include_carryover:
@@ -220,13 +217,18 @@ class TimeCalculationService:
         total_target = Decimal("0.00")
         period_balance = Decimal("0.00")
 
+        # Group entries by the Monday of their week in one pass; callers pass the
+        # full history here, so filtering it again for every week is avoided
+        last_week_end = last_day + timedelta(days=6 - last_day.weekday())
+        entries_by_week: defaultdict[date, list[TimeEntry]] = defaultdict(list)
+        for entry in entries:
+            work_date = entry.work_date
+            if week_start <= work_date <= last_week_end:
+                entries_by_week[work_date - timedelta(days=work_date.weekday())].append(entry)
+
         # Generate weekly summaries
         while week_start <= last_day:
-            # Filter entries for this week
-            week_end = week_start + timedelta(days=6)
-            week_entries = [entry for entry in entries if week_start <= entry.work_date <= week_end]
-
-            weekly = self.weekly_summary(week_entries, settings, week_start)
+            weekly = self.weekly_summary(entries_by_week.get(week_start, []), settings, week_start)
             weeks.append(weekly)
 
             # Only count totals for days within this month
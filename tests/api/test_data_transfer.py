@@ -44,7 +44,7 @@ class TestExportEndpoint:
             break_minutes=45,
         )
         db_session.add_all([entry1, entry2])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&user_id=1")
 
@@ -55,7 +55,7 @@ class TestExportEndpoint:
         # Create test entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&user_id=1")
 
@@ -67,7 +67,7 @@ class TestExportEndpoint:
         # Create test entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&user_id=1")
 
@@ -99,7 +99,7 @@ class TestExportEndpoint:
         # Entry from different month (should not be included)
         entry3 = TimeEntryFactory.build(user_id=1, work_date=date(2026, 2, 10))
         db_session.add_all([entry1, entry2, entry3])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&user_id=1")
 
@@ -150,7 +150,7 @@ class TestExportEndpoint:
         # Create entry for user 2 (should not be included)
         entry2 = TimeEntryFactory.build(user_id=2, work_date=date(2026, 1, 15))
         db_session.add_all([entry1, entry2])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026")
 
@@ -163,7 +163,7 @@ class TestExportEndpoint:
         # Create test entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&format=csv")
 
@@ -182,7 +182,7 @@ class TestExportEndpoint:
         # Create test entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&format=pdf")
 
@@ -199,7 +199,7 @@ class TestExportEndpoint:
         # Create test entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&format=pdf")
 
@@ -217,7 +217,7 @@ class TestExportEndpoint:
         # Create test entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&format=pdf")
 
@@ -232,7 +232,7 @@ class TestExportEndpoint:
         # Create test entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/export?month=1&year=2026&format=invalid")
 
@@ -340,7 +340,7 @@ class TestImportEndpoint:
         # Create existing entry
         existing = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(existing)
-        db_session.commit()
+        db_session.flush()
 
         # Try to import duplicate date
         csv_content = b"work_date,start_time,end_time,break_minutes,absence_type,notes\n2026-01-15,08:00,16:00,30,Keine,Test entry"
@@ -361,7 +361,7 @@ class TestImportEndpoint:
         # Create existing entry
         existing = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(existing)
-        db_session.commit()
+        db_session.flush()
 
         # Try to import duplicate date
         csv_content = b"work_date,start_time,end_time,break_minutes,absence_type,notes\n2026-01-15,08:00,16:00,30,Keine,Test entry"
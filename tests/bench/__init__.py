@@ -0,0 +1 @@
+"""Throughput benchmarks, run with pytest -m benchmark."""
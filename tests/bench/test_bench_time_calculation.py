@@ -0,0 +1,47 @@
+"""Throughput benchmarks for TimeCalculationService balance sums.
+
+Skipped in normal runs; select them with ``pytest -m benchmark`` (see
+``make test-bench``). Each case sums balances over 1, 10 and 1000 work days
+so per-entry regressions in the Decimal calculation layer show up as numbers.
+"""
+
+from datetime import date, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from tests.factories import quick_settings, quick_time_entry
+
+pytestmark = pytest.mark.benchmark
+
+ENTRY_COUNTS = [1, 10, 1000]
+
+
+@pytest.fixture(scope="module")
+def settings():
+    """32-hour settings tracked from 2024-01-01 with an initial offset."""
+    return quick_settings(tracking_start_date=date(2024, 1, 1), initial_hours_offset=Decimal("5.00"))
+
+
+@pytest.fixture(scope="module", params=ENTRY_COUNTS, ids=lambda count: f"{count}_entries")
+def entries(request):
+    """Consecutive days worked 7:13-16:01 with a 37 min break, so rounding paths are exercised."""
+    return [
+        quick_time_entry(
+            work_date=date(2024, 1, 1) + timedelta(days=offset),
+            start_time=time(7, 13),
+            end_time=time(16, 1),
+            break_minutes=37,
+        )
+        for offset in range(request.param)
+    ]
+
+
+def test_period_balance_throughput(benchmark, calc_service, entries, settings):
+    """Benchmark period_balance over the entry list."""
+    benchmark(calc_service.period_balance, entries, settings)
+
+
+def test_all_time_balance_throughput(benchmark, calc_service, entries, settings):
+    """Benchmark all_time_balance with a target date past the last entry."""
+    benchmark(calc_service.all_time_balance, entries, settings, target_date=date(2030, 1, 1))
@@ -1,19 +1,28 @@
 """Pytest fixtures for Verk Employee Management tests."""
 
+import os
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from main import app
+from source.api import app as app_module
+from source.api import context as template_context
 from source.api.dependencies import get_db
 from source.database import Base
+from source.database.enums import AbsenceType
+from source.services.time_calculation import TimeCalculationService
+from tests.factories import TimeEntryFactory, UserSettingsFactory, persist
 
-# Test database - in-memory SQLite
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Test database - in-memory SQLite, one named database per pytest-xdist worker
+TEST_DATABASE_URL = "sqlite:///file:memdb_{worker_id}?mode=memory&cache=shared&uri=true"
 
 PDF_EXPORT_TESTS_WITH_FAKE_GENERATOR = {
     "test_export_pdf_passes_monthly_vacation_days_to_template",
@@ -47,7 +56,13 @@ def _requires_playwright_chromium(nodeid: str, test_name: str) -> bool:
 
 
 def pytest_collection_modifyitems(config, items):
-    """Skip Chromium-backed PDF tests when the browser binary is not installed."""
+    """Skip benchmarks unless selected with -m, and Chromium-backed PDF tests without the browser."""
+    if "benchmark" not in config.getoption("markexpr", ""):
+        skip_benchmark = pytest.mark.skip(reason="Benchmark; run with 'pytest -m benchmark'")
+        for item in items:
+            if item.get_closest_marker("benchmark"):
+                item.add_marker(skip_benchmark)
+
     if _playwright_chromium_available():
         return
 
@@ -60,81 +75,324 @@ def pytest_collection_modifyitems(config, items):
 
 
 def _set_sqlite_pragma(dbapi_connection, connection_record):
-    """Enable SQLite foreign key constraints.
+    """Enable SQLite foreign key constraints and driver-level SAVEPOINT support.
 
     Args:
         dbapi_connection: Raw SQLite connection.
         connection_record: SQLAlchemy connection record.
+
+    Note:
+        pysqlite's implicit transaction handling breaks SAVEPOINT, so autocommit
+        mode is enabled here and BEGIN is emitted by _begin_sqlite_transaction.
     """
+    dbapi_connection.isolation_level = None
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
 
-@pytest.fixture(scope="function")
+def _begin_sqlite_transaction(connection):
+    """Emit an explicit BEGIN for SQLAlchemy-managed transactions.
+
+    Args:
+        connection: SQLAlchemy connection starting a transaction.
+    """
+    connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
 def test_engine():
-    """Create test database engine.
+    """Create test database engine shared by the whole test session.
 
     Returns:
         SQLAlchemy engine with in-memory SQLite database.
 
     Note:
-        Creates all tables before yield, drops all after test completes.
-        Enables foreign key constraints for SQLite.
+        Creates all tables once before yield, drops all after the session.
+        Enables foreign key constraints for SQLite. Each xdist worker gets its
+        own database, so `pytest -n auto` needs no further coordination.
     """
     engine = create_engine(
-        TEST_DATABASE_URL,
+        TEST_DATABASE_URL.format(worker_id=os.environ.get("PYTEST_XDIST_WORKER", "master")),
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     event.listen(engine, "connect", _set_sqlite_pragma)
+    event.listen(engine, "begin", _begin_sqlite_transaction)
     Base.metadata.create_all(bind=engine)
     yield engine
     Base.metadata.drop_all(bind=engine)
+    engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def db_session(test_engine):
-    """Create database session for testing.
+@pytest.fixture(scope="session")
+def test_connection(test_engine):
+    """Check out a single connection for the whole test session.
 
     Args:
         test_engine: Test database engine fixture.
 
     Yields:
-        Database session for test execution.
+        Connection reused by every db_session.
+    """
+    with test_engine.connect() as connection:
+        yield connection
 
-    Note:
-        Session is rolled back after test completes to ensure test isolation.
+
+@contextmanager
+def _rolled_back_session(connection):
+    """Open a session whose work is discarded when the block exits.
+
+    Args:
+        connection: Shared test database connection.
+
+    Yields:
+        Session joined to an outer transaction that is rolled back on exit.
     """
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-    session = TestingSessionLocal()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
+        transaction.rollback()
+
+
+@contextmanager
+def _overridden_db(session):
+    """Route the app's get_db dependency to the given session while the block runs.
+
+    Args:
+        session: Session the endpoints should use.
+    """
+
+    def override_get_db():
+        try:
+            yield session
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def db_session(test_connection):
+    """Create database session for testing.
+
+    Args:
+        test_connection: Shared test database connection fixture.
+
+    Yields:
+        Database session for test execution.
+
+    Note:
+        The session runs inside an outer transaction and turns every commit into
+        a SAVEPOINT release, so rolling back the outer transaction after the test
+        restores an empty database.
+        Objects are not expired on commit, so reading attributes written by the
+        test itself needs no reload; values set by the database (updated_at) are
+        still expired at flush and load on first access.
+    """
+    with _rolled_back_session(test_connection) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def calc_service():
+    """Provide one TimeCalculationService for the whole test session.
+
+    Returns:
+        Shared TimeCalculationService instance.
+
+    Note:
+        The service holds no state; every method works only on its arguments.
+    """
+    return TimeCalculationService()
+
+
+@pytest.fixture(scope="function")
+def make_entry(db_session):
+    """Provide a builder for persisted time entries.
+
+    Args:
+        db_session: Test database session fixture.
+
+    Returns:
+        Callable taking an absence_type plus any TimeEntryFactory overrides and
+        returning a flushed entry for user 1 on 2026-01-15 by default.
+    """
+
+    def _make_entry(absence_type: AbsenceType = AbsenceType.NONE, **overrides):
+        overrides.setdefault("user_id", 1)
+        overrides.setdefault("work_date", date(2026, 1, 15))
+        return persist(db_session, TimeEntryFactory.build(absence_type=absence_type, **overrides))
+
+    return _make_entry
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
-    """Create test client with database override.
+def make_settings(db_session):
+    """Provide a builder for persisted user settings.
 
     Args:
         db_session: Test database session fixture.
 
+    Returns:
+        Callable taking any UserSettingsFactory overrides and returning flushed
+        40-hour settings for user 1 by default.
+    """
+
+    def _make_settings(**overrides):
+        overrides.setdefault("user_id", 1)
+        overrides.setdefault("weekly_target_hours", Decimal("40.00"))
+        return persist(db_session, UserSettingsFactory.build(**overrides))
+
+    return _make_settings
+
+
+@pytest.fixture(scope="function")
+def assert_max_queries(db_session):
+    """Provide a context manager that caps the SQL statements run inside it.
+
+    Args:
+        db_session: Test database session fixture.
+
+    Returns:
+        Context manager taking the maximum statement count and yielding the
+        list of captured statements.
+
+    Note:
+        SAVEPOINT bookkeeping emitted by the db_session fixture itself is not
+        counted, so limits reflect what the application issues in production.
+    """
+
+    @contextmanager
+    def _assert_max_queries(limit: int):
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+                statements.append(statement)
+
+        event.listen(db_session.bind, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", _record)
+        assert len(statements) <= limit, f"Expected at most {limit} queries, got {len(statements)}: {statements}"
+
+    return _assert_max_queries
+
+
+@pytest.fixture(scope="session", autouse=True)
+def frozen_templates():
+    """Stop Jinja from re-checking template files on every render.
+
+    Note:
+        Compiled templates are cached in memory either way; with auto_reload
+        off the cache is trusted without a stat() of the source per lookup.
+        Templates do not change while the suite runs.
+    """
+    environments = (template_context.templates.env, app_module.templates.env)
+    for environment in environments:
+        environment.auto_reload = False
+    yield
+    for environment in environments:
+        environment.auto_reload = True
+
+
+@pytest.fixture(scope="session")
+def session_client():
+    """Create one test client for the whole test session.
+
+    Returns:
+        TestClient shared by all tests.
+
+    Note:
+        The app defines no lifespan handlers and sets no cookies, so reusing
+        the client across tests carries no state between them. The database
+        override is installed per test by the client fixture.
+    """
+    return TestClient(app)
+
+
+@pytest.fixture(scope="function")
+def client(db_session, session_client):
+    """Provide the shared test client with database override.
+
+    Args:
+        db_session: Test database session fixture.
+        session_client: Session-scoped TestClient fixture.
+
     Yields:
         TestClient instance configured to use test database.
 
     Note:
         Automatically overrides get_db dependency and clears overrides after test.
     """
+    with _overridden_db(db_session):
+        yield session_client
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
 
-    app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
-    app.dependency_overrides.clear()
+@pytest.fixture(scope="module")
+def render_page(test_connection, session_client):
+    """Provide a renderer for pages that many tests of one module assert against.
+
+    Args:
+        test_connection: Shared test database connection fixture.
+        session_client: Session-scoped TestClient fixture.
+
+    Returns:
+        Callable taking a URL plus built model instances; it persists the
+        instances, GETs the URL and returns the response text.
+
+    Note:
+        Each call runs in its own rolled-back transaction that ends before the
+        text is returned, so module-scoped fixtures can cache the HTML without
+        holding data open alongside the per-test db_session.
+    """
+
+    def _render_page(url: str, *instances) -> str:
+        with _rolled_back_session(test_connection) as session, _overridden_db(session):
+            session.add_all(instances)
+            session.flush()
+            return session_client.get(url).text
+
+    return _render_page
+
+
+@pytest.fixture(scope="module")
+def persist_detached(test_connection):
+    """Provide a helper that creates rows many tests of one module read back.
+
+    Args:
+        test_connection: Shared test database connection fixture.
+
+    Returns:
+        Callable taking model instances; it adds and flushes them, refreshes
+        each one and returns them detached, in the order given.
+
+    Note:
+        Like render_page, each call runs in its own rolled-back transaction, so
+        the returned instances keep their loaded state without holding data
+        open alongside the per-test db_session.
+    """
+
+    def _persist_detached(*instances) -> list:
+        with _rolled_back_session(test_connection) as session:
+            session.add_all(instances)
+            session.flush()
+            for instance in instances:
+                session.refresh(instance)
+        return list(instances)
+
+    return _persist_detached
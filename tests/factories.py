@@ -11,18 +11,54 @@ Usage:
 
     # Build with custom values
     entry = TimeEntryFactory.build(user_id=42, work_date=date(2026, 1, 15))
+
+    # Build settings for the app's user (user_id=1, 32-hour week)
+    settings = UserSettingsFactory.build(current_user=True)
+
+    # Build a Monday-to-Wednesday run of default work days
+    entries = TimeEntryFactory.build_days(date(2026, 1, 12), 3)
+
+    # Construct directly, skipping factory machinery, for pure calculation tests
+    entry = quick_time_entry(work_date=date(2026, 1, 12), end_time=time(17, 0))
+    settings = quick_settings(initial_hours_offset=Decimal("5.00"))
+
+    # Build and persist without committing
+    entry = persist(db_session, TimeEntryFactory.build())
+
+    # Build column values only, for Core-level inserts
+    row = db_session.execute(insert(TimeEntry).returning(TimeEntry.id), [TimeEntryFactory.mapping()]).one()
 """
 
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 
 import factory
+from sqlalchemy.orm import Session
 
 from source.database.enums import AbsenceType, RecordStatus
 from source.database.models import TimeEntry, UserSettings
 
 
-class TimeEntryFactory(factory.Factory):
+class ModelFactory(factory.Factory):
+    """Base factory adding plain-dict output alongside ORM instances."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def mapping(cls, **overrides) -> dict:
+        """Build the factory's column values as a plain dict.
+
+        Args:
+            **overrides: Field values replacing the factory defaults.
+
+        Returns:
+            Dict suitable for insert(Model).values() or executemany parameters.
+        """
+        return factory.build(dict, FACTORY_CLASS=cls, **overrides)
+
+
+class TimeEntryFactory(ModelFactory):
     """Factory for creating TimeEntry test instances.
 
     Creates regular work day entries by default with standard working hours.
@@ -44,6 +80,21 @@ class TimeEntryFactory(factory.Factory):
     created_at = factory.LazyFunction(datetime.now)
     updated_at = factory.LazyFunction(datetime.now)
 
+    @classmethod
+    def build_days(cls, first_day: date, count: int, **overrides) -> list[TimeEntry]:
+        """Build entries on consecutive days in one batch.
+
+        Args:
+            first_day: Work date of the first entry.
+            count: Number of entries, one per day.
+            **overrides: Field values replacing the factory defaults in every entry.
+
+        Returns:
+            Unsaved entries ordered by work_date.
+        """
+        work_dates = [first_day + timedelta(days=offset) for offset in range(count)]
+        return cls.build_batch(count, work_date=factory.Iterator(work_dates, cycle=False), **overrides)
+
 
 class VacationEntryFactory(TimeEntryFactory):
     """Factory for creating vacation time entries.
@@ -82,7 +133,7 @@ class HolidayEntryFactory(TimeEntryFactory):
     break_minutes = 0
 
 
-class UserSettingsFactory(factory.Factory):
+class UserSettingsFactory(ModelFactory):
     """Factory for creating UserSettings test instances.
 
     Creates user settings with default 32-hour weekly target (German part-time standard).
@@ -91,6 +142,10 @@ class UserSettingsFactory(factory.Factory):
     class Meta:
         model = UserSettings
 
+    class Params:
+        # Settings of the app's single user (see get_current_user_id) on a 32-hour week
+        current_user = factory.Trait(user_id=1, weekly_target_hours=Decimal("32.00"))
+
     user_id = factory.Sequence(lambda n: n + 1)
     weekly_target_hours = Decimal("32.00")
     schedule_json = None
@@ -112,10 +167,74 @@ class UserSettingsFactory(factory.Factory):
     updated_at = factory.LazyFunction(datetime.now)
 
 
+# Column defaults for the quick_* builders, mirroring the factories above
+QUICK_TIME_ENTRY_DEFAULTS = {
+    "user_id": 1,
+    "start_time": time(7, 0),
+    "end_time": time(15, 0),
+    "break_minutes": 30,
+    "absence_type": AbsenceType.NONE,
+    "status": RecordStatus.DRAFT,
+}
+QUICK_SETTINGS_DEFAULTS = {
+    "user_id": 1,
+    "weekly_target_hours": Decimal("32.00"),
+}
+
+
+def quick_time_entry(**overrides) -> TimeEntry:
+    """Construct an unsaved TimeEntry directly, without factory declaration resolution.
+
+    Meant for pure calculation tests that build many entries and only read
+    dates, times, breaks and absence type.
+
+    Args:
+        **overrides: Field values replacing QUICK_TIME_ENTRY_DEFAULTS; work_date defaults to today.
+
+    Returns:
+        Unsaved TimeEntry instance.
+    """
+    overrides.setdefault("work_date", date.today())
+    return TimeEntry(**{**QUICK_TIME_ENTRY_DEFAULTS, **overrides})
+
+
+def quick_settings(**overrides) -> UserSettings:
+    """Construct unsaved UserSettings directly, without factory declaration resolution.
+
+    Args:
+        **overrides: Field values replacing QUICK_SETTINGS_DEFAULTS (user 1, 32-hour week).
+
+    Returns:
+        Unsaved UserSettings instance.
+    """
+    return UserSettings(**{**QUICK_SETTINGS_DEFAULTS, **overrides})
+
+
+def persist(db_session: Session, instance: TimeEntry | UserSettings) -> TimeEntry | UserSettings:
+    """Add an instance to the session and flush it.
+
+    Flushing assigns the primary key without committing the test transaction
+    or re-selecting attributes that were just written.
+
+    Args:
+        db_session: Test database session.
+        instance: Built (unsaved) model instance.
+
+    Returns:
+        The same instance, now persistent.
+    """
+    db_session.add(instance)
+    db_session.flush()
+    return instance
+
+
 __all__ = [
     "TimeEntryFactory",
     "VacationEntryFactory",
     "SickEntryFactory",
     "HolidayEntryFactory",
     "UserSettingsFactory",
+    "persist",
+    "quick_settings",
+    "quick_time_entry",
 ]
@@ -0,0 +1,92 @@
+"""Assertion helpers for HTML responses in API tests.
+
+Usage:
+    body = assert_contains_all(response, "Urlaub", "Krank")
+    assert b'name="start_time"' not in body
+
+    parsed = parse_response(response)
+    assert "text/html" in parsed.content_type
+
+    header = html_region(html, "thead")
+    assert 'class="bg-neutral text-white"' in header
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+
+from httpx import Response
+
+
+@dataclass(frozen=True)
+class ParsedResponse:
+    """Response body and content type read once for repeated assertions.
+
+    Attributes:
+        content: Raw response body.
+        content_type: Content-Type header, empty when the header is missing.
+    """
+
+    content: bytes
+    content_type: str
+
+    @cached_property
+    def text(self) -> str:
+        """Decode the body on first access only."""
+        return self.content.decode("utf-8")
+
+
+def parse_response(response: Response) -> ParsedResponse:
+    """Read the body and content type of a response once.
+
+    Args:
+        response: Response returned by the test client.
+
+    Returns:
+        ParsedResponse whose fields can be checked without going back to the
+        header mapping or decoding the body again.
+    """
+    return ParsedResponse(content=response.content, content_type=response.headers.get("content-type", ""))
+
+
+def assert_contains_all(response: Response, *needles: str | bytes) -> bytes:
+    """Assert that every needle occurs in the response body.
+
+    Needles are matched against the raw UTF-8 body, so the response is never
+    decoded to str. Failures report every missing needle at once.
+
+    Args:
+        response: Response returned by the test client.
+        *needles: Substrings expected in the body; str needles are UTF-8 encoded.
+
+    Returns:
+        The raw response body for follow-up assertions.
+    """
+    content = response.content
+    missing = [
+        needle for needle in needles if (needle if isinstance(needle, bytes) else needle.encode("utf-8")) not in content
+    ]
+    assert not missing, f"Missing from response body: {missing}"
+    return content
+
+
+def html_region(html: str, tag: str) -> str:
+    """Cut the first <tag>...</tag> element out of a rendered page.
+
+    Scoping assertions to one region keeps class checks such as "bg-success"
+    from matching markup elsewhere on the page, and keeps failure output short.
+    Regions are sliced by position, so the tag must not nest inside itself.
+
+    Args:
+        html: Rendered page.
+        tag: Element name, e.g. "thead" or "tfoot".
+
+    Returns:
+        The element including its opening and closing tags.
+    """
+    start = html.find(f"<{tag}")
+    end = html.find(f"</{tag}>", start)
+    assert start != -1 and end != -1, f"No <{tag}> element in rendered page"
+    return html[start : end + len(tag) + 3]
+
+
+__all__ = ["ParsedResponse", "assert_contains_all", "html_region", "parse_response"]
@@ -0,0 +1 @@
+"""Integration tests that exercise the app through the shared test client."""
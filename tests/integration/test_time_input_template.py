@@ -0,0 +1,36 @@
+"""
+Integration tests for time input fields in rendered templates.
+
+The formatting rules themselves are specified in tests/test_time_input_formatting.py;
+these tests only check that the inputs the JavaScript binds to are rendered.
+"""
+
+import pytest
+
+# Every test here renders through the app and the test database
+pytestmark = pytest.mark.integration
+
+
+class TestTimeInputTemplateIntegration:
+    """Test that time input fields have proper event listeners attached."""
+
+    def test_edit_row_has_time_inputs(self, client):
+        """Verify that time entry edit rows have time input fields."""
+        response = client.get("/time-entries/new-row")
+        assert response.status_code == 200
+
+        html = response.text
+        # Check that time input fields exist
+        assert 'name="start_time"' in html
+        assert 'name="end_time"' in html
+        assert 'pattern="([01]?[0-9]|2[0-3]):[0-5][0-9]"' in html
+
+    def test_settings_page_has_weekday_inputs(self, client):
+        """Verify that settings page has weekday time input fields."""
+        response = client.get("/settings")
+        assert response.status_code == 200
+
+        html = response.text
+        # Check that weekday time input fields exist
+        assert 'name="weekday_0_start_time"' in html
+        assert 'name="weekday_0_end_time"' in html
@@ -31,9 +31,9 @@ class TestWeeklySummary:
     def test_get_current_week_success(self, client, db_session):
         """GET /summary/week returns current week summary HTML."""
         # Create user settings for current user (id=1)
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/week")
 
@@ -47,9 +47,9 @@ class TestWeeklySummary:
     def test_get_specific_week(self, client, db_session):
         """GET /summary/week?week_start=2026-01-20 returns specific week summary."""
         # Create user settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/week?week_start=2026-01-20")
 
@@ -61,16 +61,16 @@ class TestWeeklySummary:
     def test_week_with_time_entries(self, client, db_session):
         """GET /summary/week includes time entries in weekly summary."""
         # Create user settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create time entry for this week (Monday)
         entry = TimeEntryFactory.build(
             user_id=1, work_date=date(2026, 1, 20), start_time=time(7, 0), end_time=time(15, 0), break_minutes=30
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/week?week_start=2026-01-20")
 
@@ -83,9 +83,9 @@ class TestWeeklySummary:
     def test_week_summary_uses_calculation_service(self, client, db_session):
         """Weekly summary calculates totals correctly using TimeCalculationService."""
         # Create user settings with 32h/week target
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create 5 entries (Mon-Fri) with 7.5h each = 37.5h actual
         for day_offset in range(5):
@@ -97,7 +97,7 @@ class TestWeeklySummary:
                 break_minutes=30,
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/week?week_start=2026-01-20")
 
@@ -113,7 +113,7 @@ class TestWeeklySummary:
         """GET /summary/week?week_start=invalid returns 422."""
         settings = UserSettingsFactory.build(user_id=1)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/week?week_start=not-a-date")
 
@@ -135,9 +135,9 @@ class TestMonthlySummary:
     def test_get_current_month_success(self, client, db_session):
         """GET /summary/month returns current month summary HTML."""
         # Create user settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/month")
 
@@ -151,9 +151,9 @@ class TestMonthlySummary:
     def test_get_specific_month(self, client, db_session):
         """GET /summary/month?year=2026&month=1 returns specific month summary."""
         # Create user settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/month?year=2026&month=1")
 
@@ -174,7 +174,7 @@ class TestMonthlySummary:
             initial_hours_offset=Decimal("10.50"),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/month?year=2026&month=1")
 
@@ -187,9 +187,9 @@ class TestMonthlySummary:
     def test_month_with_time_entries(self, client, db_session):
         """GET /summary/month includes time entries in monthly summary."""
         # Create user settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create entries across multiple weeks in January
         for week_offset in [0, 7, 14, 21]:
@@ -202,7 +202,7 @@ class TestMonthlySummary:
                     break_minutes=30,
                 )
                 db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/month?year=2026&month=1")
 
@@ -222,7 +222,7 @@ class TestMonthlySummary:
             initial_hours_offset=Decimal("0.00"),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create entries totaling 40h actual (Mon-Fri first week, 8h/day)
         for day_offset in range(5):
@@ -234,7 +234,7 @@ class TestMonthlySummary:
                 break_minutes=60,
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/month?year=2026&month=1")
 
@@ -249,7 +249,7 @@ class TestMonthlySummary:
         """GET /summary/month with invalid year/month returns 422."""
         settings = UserSettingsFactory.build(user_id=1)
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/summary/month?year=invalid&month=99")
 
@@ -45,7 +45,7 @@ class TestTimeEntryList:
             user_id=1, work_date=date(2026, 1, 15), start_time=time(8, 0), end_time=time(16, 0)
         )
         db_session.add_all([entry3, entry1, entry2])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -71,7 +71,7 @@ class TestTimeEntryList:
             user_id=1, work_date=date(2026, 1, 15), start_time=time(7, 0), end_time=time(15, 0)
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -86,7 +86,7 @@ class TestTimeEntryList:
         january_entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         february_entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 2, 15))
         db_session.add_all([january_entry, february_entry])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -118,8 +118,7 @@ class TestTimeEntryForms:
             user_id=1, work_date=date(2026, 1, 15), start_time=time(7, 0), end_time=time(15, 0), notes="Test notes"
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/edit")
 
@@ -160,7 +159,7 @@ class TestTimeEntryCreate:
         # Create existing entry
         existing = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(existing)
-        db_session.commit()
+        db_session.flush()
 
         # Attempt to create duplicate
         response = client.post(
@@ -240,8 +239,7 @@ class TestTimeEntryDetail:
         """GET /time-entries/{id} returns 200 with detail HTML."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15), notes="Detail test")
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}")
 
@@ -263,8 +261,7 @@ class TestTimeEntryUpdate:
         """PATCH /time-entries/{id} updates and returns detail HTML."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15), notes="Original notes")
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -285,8 +282,7 @@ class TestTimeEntryUpdate:
         # Create SUBMITTED entry
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15), status=RecordStatus.SUBMITTED)
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -304,8 +300,7 @@ class TestTimeEntryUpdate:
         """PATCH sets HX-Trigger: timeEntryUpdated header."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -336,8 +331,7 @@ class TestTimeEntryUpdate:
             break_minutes=30,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         # Verify entry has times before update
         assert entry.start_time == time(8, 0)
@@ -376,8 +370,7 @@ class TestTimeEntryUpdate:
             absence_type=AbsenceType.NONE,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -403,8 +396,7 @@ class TestTimeEntryUpdate:
             absence_type=AbsenceType.VACATION,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -431,8 +423,7 @@ class TestTimeEntryUpdate:
             absence_type=AbsenceType.VACATION,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -460,8 +451,7 @@ class TestTimeEntryDelete:
         """DELETE /time-entries/{id} returns 204 No Content."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.delete(f"/time-entries/{entry.id}")
 
@@ -471,8 +461,7 @@ class TestTimeEntryDelete:
         """DELETE sets HX-Trigger: timeEntryDeleted header."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.delete(f"/time-entries/{entry.id}")
 
@@ -512,7 +501,7 @@ class TestMonthlyViewContext:
     def test_context_includes_summary(self, client, db_session):
         """Response context includes MonthlySummary with total_actual, total_target, period_balance."""
         # Create user settings with target hours
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
+        settings = UserSettingsFactory.build(current_user=True)
         db_session.add(settings)
 
         # Create time entry with 8 hours worked
@@ -520,7 +509,7 @@ class TestMonthlyViewContext:
             user_id=1, work_date=date(2026, 1, 15), start_time=time(7, 0), end_time=time(15, 30), break_minutes=30
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -589,7 +578,7 @@ class TestMonthlyViewContext:
         # Create entry on January 15
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -605,7 +594,7 @@ class TestMonthlyViewContext:
         entry2 = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 18))  # Latest
         entry3 = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 5))
         db_session.add_all([entry1, entry2, entry3])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -630,7 +619,7 @@ class TestHTMXResponseDetection:
         # Create test entry for monthly view
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -646,7 +635,7 @@ class TestHTMXResponseDetection:
         # Create test entry for monthly view
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         # Simulate HTMX request with HX-Request header
         response = client.get("/time-entries?month=1&year=2026", headers={"HX-Request": "true"})
@@ -664,7 +653,7 @@ class TestHTMXResponseDetection:
         # Create test entry for monthly view
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -696,8 +685,7 @@ class TestInlineEditingRoutes:
             notes="Test notes",
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/edit-row")
 
@@ -717,8 +705,7 @@ class TestInlineEditingRoutes:
             notes="Test notes",
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/edit-row")
 
@@ -740,8 +727,7 @@ class TestInlineEditingRoutes:
             notes="Important meeting",
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/edit-row")
 
@@ -756,8 +742,7 @@ class TestInlineEditingRoutes:
         """Editable row contains Save button with PATCH action."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/edit-row")
 
@@ -773,8 +758,7 @@ class TestInlineEditingRoutes:
         """Editable row contains Cancel button to restore read-only row."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/edit-row")
 
@@ -800,8 +784,7 @@ class TestInlineEditingRoutes:
             notes="Test notes",
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
 
@@ -821,8 +804,7 @@ class TestInlineEditingRoutes:
             notes="Read-only test",
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
 
@@ -839,8 +821,7 @@ class TestInlineEditingRoutes:
         """Read-only row is clickable to switch to edit mode."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
 
@@ -918,8 +899,7 @@ class TestInlineEditingRoutes:
         """Edit row preserves the row's id attribute for HTMX swapping."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/edit-row")
 
@@ -931,8 +911,7 @@ class TestInlineEditingRoutes:
         """Read-only row preserves the row's id attribute for HTMX swapping."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
 
@@ -957,7 +936,7 @@ class TestNewRowWeekdayDefaults:
             },
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Request new row for a Monday (2026-01-19 is a Monday)
         response = client.get("/time-entries/new-row?date=2026-01-19")
@@ -1077,7 +1056,7 @@ class TestGetDailyTargetHours:
         # Create settings with 40h/week
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         from source.api.routers.time_entries import get_daily_target_hours
 
@@ -1090,7 +1069,7 @@ class TestGetDailyTargetHours:
         # Create settings with 35h/week
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("35.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         from source.api.routers.time_entries import get_daily_target_hours
 
@@ -1103,7 +1082,7 @@ class TestGetDailyTargetHours:
         # Create settings with 37.5h/week (should be 7.50 daily)
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("37.50"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         from source.api.routers.time_entries import get_daily_target_hours
 
@@ -1125,7 +1104,7 @@ class TestWeeklySummaryEndpoint:
         # Create settings with 40h/week target
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         week_start = date.today() - timedelta(days=date.today().weekday())
 
@@ -1141,7 +1120,7 @@ class TestWeeklySummaryEndpoint:
             break_minutes=0,
         )
         db_session.add_all([entry1, entry2])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/summary/week")
 
@@ -1158,7 +1137,7 @@ class TestWeeklySummaryEndpoint:
         """Weekly summary calculates Monday-Sunday of current week."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         week_start = date.today() - timedelta(days=date.today().weekday())
 
@@ -1173,7 +1152,7 @@ class TestWeeklySummaryEndpoint:
                 break_minutes=0,
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/summary/week")
 
@@ -1191,7 +1170,7 @@ class TestWeeklySummaryEndpoint:
         """Weekly summary shows negative balance when under target."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         week_start = date.today() - timedelta(days=date.today().weekday())
 
@@ -1207,7 +1186,7 @@ class TestWeeklySummaryEndpoint:
             break_minutes=0,
         )
         db_session.add_all([entry1, entry2])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/summary/week")
 
@@ -1225,7 +1204,7 @@ class TestWeeklySummaryEndpoint:
         """Weekly summary shows positive balance when over target."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         week_start = date.today() - timedelta(days=date.today().weekday())
 
@@ -1239,7 +1218,7 @@ class TestWeeklySummaryEndpoint:
                 break_minutes=0,
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/summary/week")
 
@@ -1257,14 +1236,14 @@ class TestWeeklySummaryEndpoint:
         """GET /time-entries/summary/week?date=2026-01-15 calculates for that week."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create entry for different week (2026-01-13 is a Monday)
         entry = TimeEntryFactory.build(
             user_id=1, work_date=date(2026, 1, 13), start_time=time(8, 0), end_time=time(16, 0), break_minutes=0
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         # Request week containing 2026-01-15
         response = client.get("/time-entries/summary/week?date=2026-01-15")
@@ -1286,14 +1265,14 @@ class TestWeeklySummaryDisplay:
         """Browser view includes weekly summary card."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create entries for current week (2026-01-26 is Monday)
         entry = TimeEntryFactory.build(
             user_id=1, work_date=date(2026, 1, 26), start_time=time(8, 0), end_time=time(16, 0), break_minutes=0
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1305,7 +1284,7 @@ class TestWeeklySummaryDisplay:
         """Weekly summary displays actual, target, and balance hours."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create 3 days with 8h each = 24h actual, 40h target, -16h balance
         for day_offset in range(3):
@@ -1317,7 +1296,7 @@ class TestWeeklySummaryDisplay:
                 break_minutes=0,
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1331,7 +1310,7 @@ class TestWeeklySummaryDisplay:
         """Weekly summary displays positive balance in green color."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create 5 days with 10h each = 50h actual, +10h balance
         for day_offset in range(5):
@@ -1343,7 +1322,7 @@ class TestWeeklySummaryDisplay:
                 break_minutes=0,
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1355,7 +1334,7 @@ class TestWeeklySummaryDisplay:
         """Weekly summary displays negative balance in red color."""
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create only 2 days = 16h actual, -24h balance
         for day_offset in range(2):
@@ -1367,7 +1346,7 @@ class TestWeeklySummaryDisplay:
                 break_minutes=0,
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1384,14 +1363,14 @@ class TestDailyTargetHoursIntegration:
         # Create custom settings (35h/week = 7h daily)
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("35.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create entry with 7 hours work
         entry = TimeEntryFactory.build(
             user_id=1, work_date=date(2026, 1, 15), start_time=time(8, 0), end_time=time(15, 0), break_minutes=0
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1414,7 +1393,7 @@ class TestDailyTargetHoursIntegration:
             absence_type=AbsenceType.VACATION,
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1428,7 +1407,7 @@ class TestDailyTargetHoursIntegration:
         # Create custom settings (35h/week = 7h daily)
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("35.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             "/time-entries",
@@ -1452,15 +1431,14 @@ class TestDailyTargetHoursIntegration:
         # Create custom settings (35h/week = 7h daily)
         settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("35.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create entry
         entry = TimeEntryFactory.build(
             user_id=1, work_date=date(2026, 1, 15), start_time=time(8, 0), end_time=time(15, 0), break_minutes=0
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -1501,7 +1479,7 @@ class TestCopyLastEntry:
             break_minutes=45,
         )
         db_session.add_all([older_entry, latest_entry])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/last")
 
@@ -1540,9 +1518,9 @@ class TestCopyLastEntry:
             break_minutes=30,
         )
         db_session.add(latest_work_date)
-        db_session.commit()
+        db_session.flush()
         db_session.add(older_work_date)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/last")
 
@@ -1564,7 +1542,7 @@ class TestCopyLastEntry:
             notes="Sensitive project work",
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/last")
 
@@ -1590,7 +1568,7 @@ class TestCopyLastEntry:
             break_minutes=0,
         )
         db_session.add(absence_entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/last")
 
@@ -1612,7 +1590,7 @@ class TestCopyLastEntry:
             absence_type=AbsenceType.VACATION,
         )
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries/last")
 
@@ -1626,6 +1604,20 @@ class TestCopyLastEntry:
 class TestBalanceTrend:
     """Test balance trend sparkline functionality."""
 
+    def test_balance_trend_loads_entries_in_one_query(self, client, assert_max_queries, make_settings, make_entry):
+        """Monthly view issues a fixed number of queries, not one per sparkline week."""
+        make_settings()
+        today = date.today()
+        for weeks_ago in range(8):
+            make_entry(work_date=today - timedelta(weeks=weeks_ago, days=today.weekday()))
+
+        # Month entries, settings, weekly summary, balance trend and vacation entries
+        with assert_max_queries(5):
+            response = client.get(f"/time-entries?month={today.month}&year={today.year}")
+
+        assert response.status_code == 200
+        assert "<polyline" in response.text
+
     def test_balance_trend_in_context(self, client, db_session):
         """GET /time-entries includes balance_trend data in context."""
         # Create user settings
@@ -1644,7 +1636,7 @@ class TestBalanceTrend:
             )
             db_session.add(entry)
 
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1672,7 +1664,7 @@ class TestBalanceTrend:
             )
             db_session.add(entry)
 
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1698,7 +1690,7 @@ class TestBalanceTrend:
             )
             db_session.add(entry)
 
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -1732,7 +1724,7 @@ class TestWeeklySummaryContext:
             user_id=1, work_date=today, start_time=time(9, 0), end_time=time(17, 0), break_minutes=0
         )
         db_session.add(current_week_entry)
-        db_session.commit()
+        db_session.flush()
 
         # Request March 2025 view
         response = client.get("/time-entries?month=3&year=2025")
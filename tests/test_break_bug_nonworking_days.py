@@ -43,7 +43,7 @@ class TestBreakMinutesNonWorkingDays:
             },
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Saturday, 2026-01-31
         saturday = date(2026, 1, 31)
@@ -77,7 +77,7 @@ class TestBreakMinutesNonWorkingDays:
             },
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Sunday, 2026-02-01
         sunday = date(2026, 2, 1)
@@ -110,7 +110,7 @@ class TestBreakMinutesNonWorkingDays:
             },
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Use Tag der Deutschen Einheit (October 3) - always a German holiday
         holiday = date(2026, 10, 3)
@@ -147,7 +147,7 @@ class TestBreakMinutesNonWorkingDays:
             },
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Wednesday, 2026-01-28
         wednesday = date(2026, 1, 28)
@@ -180,7 +180,7 @@ class TestBreakMinutesNonWorkingDays:
             },
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Monday, 2026-02-02
         monday = date(2026, 2, 2)
@@ -208,6 +208,17 @@ class TestTargetHours:
         )
         assert target_hours(entry, settings) == Decimal("6.40")
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("weekly_hours", "expected"),
+        [("32.00", "6.40"), ("40.00", "8.00"), ("38.50", "7.70"), ("20.00", "4.00"), ("12.34", "2.47")],
+    )
+    def test_target_hours_follows_weekly_target(self, weekly_hours, expected):
+        """Cached daily targets stay keyed by the weekly target (12.34 / 5 = 2.468 rounds up)."""
+        entry = TimeEntry(work_date=date(2026, 1, 14), absence_type=AbsenceType.NONE)
+        settings = UserSettings(user_id=1, weekly_target_hours=Decimal(weekly_hours))
+        assert target_hours(entry, settings) == Decimal(expected)
+
 
 class TestBalance:
     @pytest.mark.unit
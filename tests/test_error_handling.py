@@ -149,7 +149,7 @@ class TestExportValidationErrors:
         # Create a time entry so month/year are valid
         entry = TimeEntryFactory.build(user_id=1)
         db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         # format=invalid is not 'csv' or 'pdf'
         response = client.get(
@@ -111,7 +111,7 @@ class TestIssueM7SkipAllDuplicates:
                 notes="Existing entry",
             )
             db_session.add(entry)
-        db_session.commit()
+        db_session.flush()
 
         # CSV content with same dates
         csv_content = b"""work_date,start_time,end_time,break_minutes,absence_type,notes
@@ -150,7 +150,7 @@ class TestIssueM7SkipAllDuplicates:
             notes="Existing entry",
         )
         db_session.add(existing_entry)
-        db_session.commit()
+        db_session.flush()
 
         # CSV content with one duplicate and one new entry
         csv_content = b"""work_date,start_time,end_time,break_minutes,absence_type,notes
@@ -186,7 +186,7 @@ class TestIssueM7SkipAllDuplicates:
             notes="Existing entry",
         )
         db_session.add(existing_entry)
-        db_session.commit()
+        db_session.flush()
 
         # CSV content with duplicate date
         csv_content = b"""work_date,start_time,end_time,break_minutes,absence_type,notes
@@ -12,7 +12,7 @@ def test_time_entries_container_does_not_embed_stale_create_refresh_url(client,
     """The full page wrapper must not keep an initial month-specific refresh URL."""
     entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 3, 15))
     db_session.add(entry)
-    db_session.commit()
+    db_session.flush()
 
     response = client.get("/time-entries?month=3&year=2026")
 
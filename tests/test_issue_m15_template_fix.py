@@ -18,7 +18,7 @@ class TestAbsenceDayActualHoursDisplay:
         # Create settings
         settings = UserSettings(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create vacation day with existing times (08:00-16:00, 30min break = 7.5h work)
         entry = TimeEntryFactory.build(
@@ -30,8 +30,7 @@ class TestAbsenceDayActualHoursDisplay:
             absence_type=AbsenceType.VACATION,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         # Get row HTML
         response = client.get(f"/time-entries/{entry.id}/row")
@@ -48,7 +47,7 @@ class TestAbsenceDayActualHoursDisplay:
         """Sick day should show credited hours."""
         settings = UserSettings(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         entry = TimeEntryFactory.build(
             user_id=1,
@@ -59,8 +58,7 @@ class TestAbsenceDayActualHoursDisplay:
             absence_type=AbsenceType.SICK,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
         assert response.status_code == 200
@@ -73,7 +71,7 @@ class TestAbsenceDayActualHoursDisplay:
         """Holiday should show 0:00h (target for holidays is 0)."""
         settings = UserSettings(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         entry = TimeEntryFactory.build(
             user_id=1,
@@ -84,8 +82,7 @@ class TestAbsenceDayActualHoursDisplay:
             absence_type=AbsenceType.HOLIDAY,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
         assert response.status_code == 200
@@ -98,7 +95,7 @@ class TestAbsenceDayActualHoursDisplay:
         """Flex time (taking time off) should show target hours."""
         settings = UserSettings(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         entry = TimeEntryFactory.build(
             user_id=1,
@@ -109,8 +106,7 @@ class TestAbsenceDayActualHoursDisplay:
             absence_type=AbsenceType.FLEX_TIME,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
         assert response.status_code == 200
@@ -122,7 +118,7 @@ class TestAbsenceDayActualHoursDisplay:
         """Normal work day (no absence) should still show actual work hours."""
         settings = UserSettings(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         entry = TimeEntryFactory.build(
             user_id=1,
@@ -133,8 +129,7 @@ class TestAbsenceDayActualHoursDisplay:
             absence_type=AbsenceType.NONE,  # Normal work day
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
         assert response.status_code == 200
@@ -147,7 +142,7 @@ class TestAbsenceDayActualHoursDisplay:
         """Vacation day without times should show zero actual and target hours."""
         settings = UserSettings(user_id=1, weekly_target_hours=Decimal("40.00"))
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         entry = TimeEntryFactory.build(
             user_id=1,
@@ -158,8 +153,7 @@ class TestAbsenceDayActualHoursDisplay:
             absence_type=AbsenceType.VACATION,
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.get(f"/time-entries/{entry.id}/row")
         assert response.status_code == 200
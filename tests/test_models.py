@@ -12,25 +12,107 @@ from source.database.enums import AbsenceType, RecordStatus
 from source.database.models import TimeEntry, UserSettings
 from tests.factories import HolidayEntryFactory, SickEntryFactory, TimeEntryFactory, VacationEntryFactory
 
+WORK_DATE_JAN27 = date(2026, 1, 27)
+WORK_DATE_JAN28 = date(2026, 1, 28)
+T_09_00 = time(9, 0)
+T_17_30 = time(17, 30)
+TRACKING_START_DATE = date(2026, 1, 1)
+EMPLOYMENT_START_DATE = date(2026, 2, 1)
+
+
+SCHEDULE = {
+    "monday": {"start": "07:00", "end": "15:00"},
+    "tuesday": {"start": "07:00", "end": "15:00"},
+    "wednesday": {"start": "07:00", "end": "15:00"},
+}
+
+# Seed rows are created in this order; seeded_rows returns them in the same order.
+ENTRY_MINIMAL = 0
+ENTRY_FULL = 1
+ENTRY_VACATION = 2
+ENTRY_VACATION_HALF_DAY = 3
+
+SETTINGS_MINIMAL = 4
+SETTINGS_SCHEDULE = 5
+SETTINGS_TRACKING = 6
+SETTINGS_VACATION_POLICY = 7
+
+TIME_ENTRY_SEED = [
+    {"user_id": 1, "work_date": WORK_DATE_JAN27, "status": RecordStatus.DRAFT},
+    {
+        "user_id": 2,
+        "work_date": WORK_DATE_JAN27,
+        "start_time": T_09_00,
+        "end_time": T_17_30,
+        "break_minutes": 45,
+        "notes": "Worked on time tracking feature",
+        "absence_type": AbsenceType.NONE,
+        "status": RecordStatus.DRAFT,
+    },
+    {
+        "user_id": 3,
+        "work_date": WORK_DATE_JAN27,
+        "absence_type": AbsenceType.VACATION,
+        "status": RecordStatus.DRAFT,
+        "start_time": None,
+        "end_time": None,
+    },
+    {
+        "user_id": 4,
+        "work_date": WORK_DATE_JAN28,
+        "absence_type": AbsenceType.VACATION,
+        "status": RecordStatus.DRAFT,
+        "vacation_days": Decimal("0.50"),
+    },
+]
+
+USER_SETTINGS_SEED = [
+    {"user_id": 1, "weekly_target_hours": Decimal("32.00")},
+    {"user_id": 2, "weekly_target_hours": Decimal("32.00"), "schedule_json": SCHEDULE},
+    {
+        "user_id": 3,
+        "weekly_target_hours": Decimal("40.00"),
+        "tracking_start_date": TRACKING_START_DATE,
+        "initial_hours_offset": Decimal("10.50"),
+    },
+    {
+        "user_id": 4,
+        "weekly_target_hours": Decimal("40.00"),
+        "holiday_state": "BE",
+        "employment_start_date": EMPLOYMENT_START_DATE,
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def seeded_rows(persist_detached):
+    """Provide the rows that read-only model tests assert against.
+
+    Args:
+        persist_detached: Module-scoped fixture that flushes instances and detaches them.
+
+    Returns:
+        TimeEntry instances for TIME_ENTRY_SEED followed by UserSettings
+        instances for USER_SETTINGS_SEED, created once per module through
+        session.add and flush so column defaults are applied by the ORM.
+    """
+    return persist_detached(
+        *(TimeEntry(**row) for row in TIME_ENTRY_SEED),
+        *(UserSettings(**row) for row in USER_SETTINGS_SEED),
+    )
+
 
 class TestTimeEntryModel:
     """Tests for TimeEntry model."""
 
     @pytest.mark.database
-    def test_create_time_entry_minimal(self, db_session):
+    def test_create_time_entry_minimal(self, seeded_rows):
         """Test creating time entry with required fields only."""
-        entry = TimeEntry(
-            user_id=1,
-            work_date=date(2026, 1, 27),
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = seeded_rows[ENTRY_MINIMAL]
 
         assert entry.id is not None
         assert entry.user_id == 1
-        assert entry.work_date == date(2026, 1, 27)
+        assert entry.work_date == WORK_DATE_JAN27
         assert entry.status == RecordStatus.DRAFT
         assert entry.absence_type == AbsenceType.NONE  # Default
         assert entry.break_minutes == 0  # Default
@@ -40,58 +122,32 @@ class TestTimeEntryModel:
         assert entry.vacation_days is None
 
     @pytest.mark.database
-    def test_create_time_entry_full(self, db_session):
+    def test_create_time_entry_full(self, seeded_rows):
         """Test creating time entry with all fields."""
-        entry = TimeEntry(
-            user_id=1,
-            work_date=date(2026, 1, 27),
-            start_time=time(9, 0),
-            end_time=time(17, 30),
-            break_minutes=45,
-            notes="Worked on time tracking feature",
-            absence_type=AbsenceType.NONE,
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = seeded_rows[ENTRY_FULL]
 
         assert entry.id is not None
-        assert entry.user_id == 1
-        assert entry.work_date == date(2026, 1, 27)
-        assert entry.start_time == time(9, 0)
-        assert entry.end_time == time(17, 30)
+        assert entry.user_id == 2
+        assert entry.work_date == WORK_DATE_JAN27
+        assert entry.start_time == T_09_00
+        assert entry.end_time == T_17_30
         assert entry.break_minutes == 45
         assert entry.notes == "Worked on time tracking feature"
         assert entry.absence_type == AbsenceType.NONE
         assert entry.status == RecordStatus.DRAFT
 
     @pytest.mark.database
-    def test_time_entry_has_created_at(self, db_session):
+    def test_time_entry_has_created_at(self, seeded_rows):
         """Test time entry gets created_at timestamp."""
-        entry = TimeEntry(
-            user_id=1,
-            work_date=date(2026, 1, 27),
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = seeded_rows[ENTRY_MINIMAL]
 
         assert entry.created_at is not None
         assert isinstance(entry.created_at, type(entry.created_at))
 
     @pytest.mark.database
-    def test_time_entry_has_updated_at(self, db_session):
+    def test_time_entry_has_updated_at(self, seeded_rows):
         """Test time entry gets updated_at timestamp."""
-        entry = TimeEntry(
-            user_id=1,
-            work_date=date(2026, 1, 27),
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = seeded_rows[ENTRY_MINIMAL]
 
         assert entry.updated_at is not None
         assert isinstance(entry.updated_at, type(entry.updated_at))
@@ -101,7 +157,7 @@ class TestTimeEntryModel:
         """Test unique constraint prevents duplicate user_id + work_date."""
         entry1 = TimeEntry(
             user_id=1,
-            work_date=date(2026, 1, 27),
+            work_date=WORK_DATE_JAN27,
             status=RecordStatus.DRAFT,
         )
         db_session.add(entry1)
@@ -109,7 +165,7 @@ class TestTimeEntryModel:
 
         entry2 = TimeEntry(
             user_id=1,
-            work_date=date(2026, 1, 27),
+            work_date=WORK_DATE_JAN27,
             status=RecordStatus.DRAFT,
         )
         db_session.add(entry2)
@@ -122,7 +178,7 @@ class TestTimeEntryModel:
         """Test same date allowed for different users."""
         entry1 = TimeEntry(
             user_id=1,
-            work_date=date(2026, 1, 27),
+            work_date=WORK_DATE_JAN27,
             status=RecordStatus.DRAFT,
         )
         db_session.add(entry1)
@@ -130,7 +186,7 @@ class TestTimeEntryModel:
 
         entry2 = TimeEntry(
             user_id=2,
-            work_date=date(2026, 1, 27),
+            work_date=WORK_DATE_JAN27,
             status=RecordStatus.DRAFT,
         )
         db_session.add(entry2)
@@ -141,19 +197,9 @@ class TestTimeEntryModel:
         assert entry2.user_id == 2
 
     @pytest.mark.database
-    def test_time_entry_vacation_nullable_times(self, db_session):
+    def test_time_entry_vacation_nullable_times(self, seeded_rows):
         """Test vacation entry doesn't require start/end times."""
-        entry = TimeEntry(
-            user_id=1,
-            work_date=date(2026, 1, 27),
-            absence_type=AbsenceType.VACATION,
-            status=RecordStatus.DRAFT,
-            start_time=None,
-            end_time=None,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = seeded_rows[ENTRY_VACATION]
 
         assert entry.id is not None
         assert entry.absence_type == AbsenceType.VACATION
@@ -161,18 +207,9 @@ class TestTimeEntryModel:
         assert entry.end_time is None
 
     @pytest.mark.database
-    def test_time_entry_vacation_days_persists_decimal(self, db_session):
+    def test_time_entry_vacation_days_persists_decimal(self, seeded_rows):
         """Test vacation_days stores fractional vacation day values."""
-        entry = TimeEntry(
-            user_id=1,
-            work_date=date(2026, 1, 28),
-            absence_type=AbsenceType.VACATION,
-            status=RecordStatus.DRAFT,
-            vacation_days=Decimal("0.50"),
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = seeded_rows[ENTRY_VACATION_HALF_DAY]
 
         assert entry.vacation_days == Decimal("0.50")
 
@@ -181,15 +218,9 @@ class TestUserSettingsModel:
     """Tests for UserSettings model."""
 
     @pytest.mark.database
-    def test_create_user_settings_minimal(self, db_session):
+    def test_create_user_settings_minimal(self, seeded_rows):
         """Test creating user settings with required fields."""
-        settings = UserSettings(
-            user_id=1,
-            weekly_target_hours=Decimal("32.00"),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = seeded_rows[SETTINGS_MINIMAL]
 
         assert settings.id is not None
         assert settings.user_id == 1
@@ -199,21 +230,9 @@ class TestUserSettingsModel:
         assert settings.employment_start_date is None
 
     @pytest.mark.database
-    def test_create_user_settings_with_schedule(self, db_session):
+    def test_create_user_settings_with_schedule(self, seeded_rows):
         """Test creating user settings with JSON schedule."""
-        schedule = {
-            "monday": {"start": "07:00", "end": "15:00"},
-            "tuesday": {"start": "07:00", "end": "15:00"},
-            "wednesday": {"start": "07:00", "end": "15:00"},
-        }
-        settings = UserSettings(
-            user_id=1,
-            weekly_target_hours=Decimal("32.00"),
-            schedule_json=schedule,
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = seeded_rows[SETTINGS_SCHEDULE]
 
         assert settings.id is not None
         assert settings.schedule_json is not None
@@ -241,15 +260,9 @@ class TestUserSettingsModel:
             db_session.commit()
 
     @pytest.mark.database
-    def test_user_settings_timestamps(self, db_session):
+    def test_user_settings_timestamps(self, seeded_rows):
         """Test user settings gets timestamps."""
-        settings = UserSettings(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = seeded_rows[SETTINGS_MINIMAL]
 
         assert settings.created_at is not None
         assert settings.updated_at is not None
@@ -257,52 +270,30 @@ class TestUserSettingsModel:
         assert isinstance(settings.updated_at, type(settings.updated_at))
 
     @pytest.mark.database
-    def test_user_settings_with_tracking_configuration(self, db_session):
+    def test_user_settings_with_tracking_configuration(self, seeded_rows):
         """Test creating user settings with tracking start date and initial offset."""
-        settings = UserSettings(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-            tracking_start_date=date(2026, 1, 1),
-            initial_hours_offset=Decimal("10.50"),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = seeded_rows[SETTINGS_TRACKING]
 
         assert settings.id is not None
-        assert settings.user_id == 1
-        assert settings.tracking_start_date == date(2026, 1, 1)
+        assert settings.user_id == 3
+        assert settings.tracking_start_date == TRACKING_START_DATE
         assert settings.initial_hours_offset == Decimal("10.50")
 
     @pytest.mark.database
-    def test_user_settings_tracking_fields_default_none(self, db_session):
+    def test_user_settings_tracking_fields_default_none(self, seeded_rows):
         """Test tracking configuration fields default to None."""
-        settings = UserSettings(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = seeded_rows[SETTINGS_MINIMAL]
 
         assert settings.tracking_start_date is None
         assert settings.initial_hours_offset is None
 
     @pytest.mark.database
-    def test_user_settings_with_vacation_policy_fields(self, db_session):
+    def test_user_settings_with_vacation_policy_fields(self, seeded_rows):
         """Test creating user settings with vacation policy fields."""
-        settings = UserSettings(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-            holiday_state="BE",
-            employment_start_date=date(2026, 2, 1),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = seeded_rows[SETTINGS_VACATION_POLICY]
 
         assert settings.holiday_state == "BE"
-        assert settings.employment_start_date == date(2026, 2, 1)
+        assert settings.employment_start_date == EMPLOYMENT_START_DATE
 
 
 class TestTimeEntryVacationDaysSchema:
@@ -311,7 +302,7 @@ class TestTimeEntryVacationDaysSchema:
     def test_time_entry_schema_accepts_optional_vacation_days(self):
         """Test vacation_days is optional and accepts fractional day values."""
         update_schema = TimeEntryUpdate()
-        create_schema = TimeEntryCreate(work_date=date(2026, 1, 27), vacation_days=Decimal("0.50"))
+        create_schema = TimeEntryCreate(work_date=WORK_DATE_JAN27, vacation_days=Decimal("0.50"))
 
         assert update_schema.vacation_days is None
         assert create_schema.vacation_days == Decimal("0.50")
@@ -339,7 +330,7 @@ class TestTimeEntryVacationDaysSchema:
         entry = TimeEntryFactory.build(
             id=1,
             user_id=42,
-            work_date=date(2026, 1, 27),
+            work_date=WORK_DATE_JAN27,
             vacation_days=Decimal("0.50"),
         )
 
@@ -10,42 +10,109 @@ Issues:
 TDD RED phase: Tests should fail until optimistic locking is implemented.
 """
 
+from dataclasses import dataclass
 from datetime import date, time
 from decimal import Decimal
 
+import pytest
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, select, update
+
 from source.database.enums import RecordStatus
+from source.database.models import TimeEntry, UserSettings
 from tests.factories import TimeEntryFactory, UserSettingsFactory
 
+WORK_DATE_JAN15 = date(2026, 1, 15)
+T_08_00 = time(8, 0)
+T_16_00 = time(16, 0)
 
-class TestTimeEntryOptimisticLocking:
-    """Test optimistic locking for TimeEntry updates (Issue C11)."""
 
-    def test_update_with_current_timestamp_succeeds(self, client, db_session):
-        """Update with current updated_at timestamp succeeds."""
-        # Create entry
-        entry = TimeEntryFactory.build(
+@dataclass(frozen=True)
+class Seed:
+    """Persisted row with its optimistic-locking token serialized once.
+
+    Attributes:
+        id: Primary key of the persisted row.
+        updated_at_iso: Current updated_at as sent by the edit forms.
+        stale_iso: updated_at from before a simulated concurrent edit, if any.
+    """
+
+    id: int
+    updated_at_iso: str
+    stale_iso: str | None = None
+
+
+def _insert_seed(db_session, model: type[TimeEntry] | type[UserSettings], mapping: dict) -> Seed:
+    """Insert one row and read back only the columns the tests need."""
+    row = db_session.execute(insert(model).returning(model.id, model.updated_at), [mapping]).one()
+    db_session.commit()
+    return Seed(id=row.id, updated_at_iso=jsonable_encoder(row.updated_at))
+
+
+def _simulate_concurrent_edit(db_session, model: type[TimeEntry] | type[UserSettings], seed: Seed, **changes) -> Seed:
+    """Apply an out-of-band edit so the seed's token becomes stale."""
+    updated_at = db_session.execute(
+        update(model).where(model.id == seed.id).values(**changes).returning(model.updated_at)
+    ).scalar_one()
+    db_session.commit()
+    return Seed(id=seed.id, updated_at_iso=jsonable_encoder(updated_at), stale_iso=seed.updated_at_iso)
+
+
+@pytest.fixture
+def seeded_entry(db_session) -> Seed:
+    """Persist a draft work entry for user 1 without going through the ORM."""
+    return _insert_seed(
+        db_session,
+        TimeEntry,
+        TimeEntryFactory.mapping(
             user_id=1,
-            work_date=date(2026, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
+            work_date=WORK_DATE_JAN15,
+            start_time=T_08_00,
+            end_time=T_16_00,
             break_minutes=30,
             status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        ),
+    )
+
+
+@pytest.fixture
+def stale_entry(db_session, seeded_entry) -> Seed:
+    """Seeded entry that was modified after its token was read."""
+    return _simulate_concurrent_edit(db_session, TimeEntry, seeded_entry, break_minutes=60)
+
+
+@pytest.fixture
+def seeded_settings(db_session) -> Seed:
+    """Persist settings for user 1 with an empty weekday defaults schedule."""
+    return _insert_seed(
+        db_session,
+        UserSettings,
+        UserSettingsFactory.mapping(
+            user_id=1,
+            weekly_target_hours=Decimal("40.00"),
+            schedule_json={"weekday_defaults": {}},
+        ),
+    )
 
-        # Store current updated_at
-        current_updated_at = entry.updated_at
 
-        # Update with current timestamp
+@pytest.fixture
+def stale_settings(db_session, seeded_settings) -> Seed:
+    """Seeded settings that were modified after their token was read."""
+    return _simulate_concurrent_edit(db_session, UserSettings, seeded_settings, weekly_target_hours=Decimal("35.00"))
+
+
+class TestTimeEntryOptimisticLocking:
+    """Test optimistic locking for TimeEntry updates (Issue C11)."""
+
+    def test_update_with_current_timestamp_succeeds(self, client, seeded_entry):
+        """Update with current updated_at timestamp succeeds."""
         response = client.patch(
-            f"/time-entries/{entry.id}",
+            f"/time-entries/{seeded_entry.id}",
             data={
                 "start_time": "09:00",
                 "end_time": "17:00",
                 "break_minutes": 45,
-                "updated_at": current_updated_at.isoformat(),
+                "updated_at": seeded_entry.updated_at_iso,
             },
         )
 
@@ -53,59 +120,25 @@ class TestTimeEntryOptimisticLocking:
         assert "09:00" in response.text
         assert "17:00" in response.text
 
-    def test_update_with_stale_timestamp_fails_409(self, client, db_session):
+    def test_update_with_stale_timestamp_fails_409(self, client, stale_entry):
         """Update with stale updated_at timestamp fails with 409 Conflict."""
-        # Create entry
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
-            break_minutes=30,
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        # Store original timestamp
-        original_updated_at = entry.updated_at
-
-        # Simulate concurrent update (modify entry directly in DB)
-        entry.break_minutes = 60
-        db_session.commit()
-        db_session.refresh(entry)
-
-        # Attempt update with stale timestamp
         response = client.patch(
-            f"/time-entries/{entry.id}",
+            f"/time-entries/{stale_entry.id}",
             data={
                 "start_time": "09:00",
                 "end_time": "17:00",
                 "break_minutes": 45,
-                "updated_at": original_updated_at.isoformat(),
+                "updated_at": stale_entry.stale_iso,
             },
         )
 
         assert response.status_code == 409
         assert "zwischenzeitlich geändert" in response.text.lower()
 
-    def test_update_without_timestamp_fails_422(self, client, db_session):
+    def test_update_without_timestamp_fails_422(self, client, seeded_entry):
         """Update without updated_at timestamp fails with 422 Unprocessable Entity."""
-        # Create entry
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-
-        # Attempt update without timestamp
         response = client.patch(
-            f"/time-entries/{entry.id}",
+            f"/time-entries/{seeded_entry.id}",
             data={
                 "start_time": "09:00",
                 "end_time": "17:00",
@@ -115,77 +148,46 @@ class TestTimeEntryOptimisticLocking:
         assert response.status_code == 422
         assert "updated_at" in response.text.lower() or "zeitstempel" in response.text.lower()
 
-    def test_concurrent_updates_second_fails(self, client, db_session):
+    def test_concurrent_updates_second_fails(self, client, db_session, seeded_entry):
         """Simulate two concurrent updates - second update fails with 409."""
-        # Create entry
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
-            break_minutes=30,
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
         # Both users fetch entry at same time
-        user1_timestamp = entry.updated_at
-        user2_timestamp = entry.updated_at
+        user1_timestamp = seeded_entry.updated_at_iso
+        user2_timestamp = seeded_entry.updated_at_iso
 
         # User 1 updates successfully
         response1 = client.patch(
-            f"/time-entries/{entry.id}",
+            f"/time-entries/{seeded_entry.id}",
             data={
                 "break_minutes": 45,
-                "updated_at": user1_timestamp.isoformat(),
+                "updated_at": user1_timestamp,
             },
         )
         assert response1.status_code == 200
 
         # User 2 attempts update with stale timestamp
         response2 = client.patch(
-            f"/time-entries/{entry.id}",
+            f"/time-entries/{seeded_entry.id}",
             data={
                 "break_minutes": 60,
-                "updated_at": user2_timestamp.isoformat(),
+                "updated_at": user2_timestamp,
             },
         )
         assert response2.status_code == 409
         assert "zwischenzeitlich geändert" in response2.text.lower()
 
         # Verify first user's change persisted
-        db_session.refresh(entry)
-        assert entry.break_minutes == 45
+        break_minutes = db_session.execute(
+            select(TimeEntry.break_minutes).where(TimeEntry.id == seeded_entry.id)
+        ).scalar_one()
+        assert break_minutes == 45
 
-    def test_error_message_in_german(self, client, db_session):
+    def test_error_message_in_german(self, client, stale_entry):
         """409 error message is in German."""
-        # Create entry
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
-            status=RecordStatus.DRAFT,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        # Store original timestamp
-        original_updated_at = entry.updated_at
-
-        # Modify entry
-        entry.break_minutes = 60
-        db_session.commit()
-
-        # Attempt update with stale timestamp
         response = client.patch(
-            f"/time-entries/{entry.id}",
+            f"/time-entries/{stale_entry.id}",
             data={
                 "break_minutes": 45,
-                "updated_at": original_updated_at.isoformat(),
+                "updated_at": stale_entry.stale_iso,
             },
         )
 
@@ -198,140 +200,66 @@ class TestTimeEntryOptimisticLocking:
 class TestSettingsOptimisticLocking:
     """Test optimistic locking for Settings updates (Issue C12)."""
 
-    def test_weekday_defaults_update_with_current_timestamp_succeeds(self, client, db_session):
+    def test_weekday_defaults_update_with_current_timestamp_succeeds(self, client, seeded_settings):
         """Update weekday defaults with current timestamp succeeds."""
-        # Create settings
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-            schedule_json={"weekday_defaults": {}},
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        current_updated_at = settings.updated_at
-
-        # Update with current timestamp
         response = client.patch(
             "/settings/weekday-defaults",
             data={
                 "weekday_0_start_time": "08:00",
                 "weekday_0_end_time": "16:00",
                 "weekday_0_break_minutes": "30",
-                "updated_at": current_updated_at.isoformat(),
+                "updated_at": seeded_settings.updated_at_iso,
             },
         )
 
         assert response.status_code == 200
 
-    def test_weekday_defaults_update_with_stale_timestamp_fails_409(self, client, db_session):
+    def test_weekday_defaults_update_with_stale_timestamp_fails_409(self, client, stale_settings):
         """Update weekday defaults with stale timestamp fails with 409."""
-        # Create settings
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-            schedule_json={"weekday_defaults": {}},
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        original_updated_at = settings.updated_at
-
-        # Simulate concurrent update
-        settings.schedule_json = {"weekday_defaults": {"0": {"start_time": "07:00"}}}
-        db_session.commit()
-
-        # Attempt update with stale timestamp
         response = client.patch(
             "/settings/weekday-defaults",
             data={
                 "weekday_0_start_time": "08:00",
                 "weekday_0_end_time": "16:00",
-                "updated_at": original_updated_at.isoformat(),
+                "updated_at": stale_settings.stale_iso,
             },
         )
 
         assert response.status_code == 409
         assert "zwischenzeitlich geändert" in response.text.lower()
 
-    def test_tracking_settings_update_with_current_timestamp_succeeds(self, client, db_session):
+    def test_tracking_settings_update_with_current_timestamp_succeeds(self, client, seeded_settings):
         """Update tracking settings with current timestamp succeeds."""
-        # Create settings
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        current_updated_at = settings.updated_at
-
-        # Update with current timestamp
         response = client.patch(
             "/settings/tracking",
             data={
                 "weekly_target_hours": "38.5",
-                "updated_at": current_updated_at.isoformat(),
+                "updated_at": seeded_settings.updated_at_iso,
             },
         )
 
         assert response.status_code == 200
 
-    def test_tracking_settings_update_with_stale_timestamp_fails_409(self, client, db_session):
+    def test_tracking_settings_update_with_stale_timestamp_fails_409(self, client, stale_settings):
         """Update tracking settings with stale timestamp fails with 409."""
-        # Create settings
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        original_updated_at = settings.updated_at
-
-        # Simulate concurrent update
-        settings.weekly_target_hours = Decimal("35.00")
-        db_session.commit()
-
-        # Attempt update with stale timestamp
         response = client.patch(
             "/settings/tracking",
             data={
                 "weekly_target_hours": "38.5",
-                "updated_at": original_updated_at.isoformat(),
+                "updated_at": stale_settings.stale_iso,
             },
         )
 
         assert response.status_code == 409
         assert "zwischenzeitlich geändert" in response.text.lower()
 
-    def test_settings_error_message_in_german(self, client, db_session):
+    def test_settings_error_message_in_german(self, client, stale_settings):
         """409 error message for settings is in German."""
-        # Create settings
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-        )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        original_updated_at = settings.updated_at
-
-        # Modify settings
-        settings.weekly_target_hours = Decimal("35.00")
-        db_session.commit()
-
-        # Attempt update with stale timestamp
         response = client.patch(
             "/settings/tracking",
             data={
                 "weekly_target_hours": "38.5",
-                "updated_at": original_updated_at.isoformat(),
+                "updated_at": stale_settings.stale_iso,
             },
         )
 
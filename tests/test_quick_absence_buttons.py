@@ -11,160 +11,105 @@ Feature requirements:
 5. Clicking same type that's already set toggles back to "none"
 """
 
-from datetime import date, time
+from datetime import time
+
+import pytest
 
 from source.database.enums import AbsenceType
-from tests.factories import TimeEntryFactory
+from source.database.models import TimeEntry
+from tests.factories import UserSettingsFactory, persist
+from tests.helpers import assert_contains_all, parse_response
+
+# Entry lookup plus settings lookup; anything more is an N+1 regression in the row partial.
+ROW_QUERY_LIMIT = 2
+
+LABELS = (b"Urlaub", b"Krank", b"Feiertag", b"Gleitzeit")
+ARIA_LABELS = {
+    AbsenceType.VACATION: b'aria-label="Urlaub"',
+    AbsenceType.SICK: b'aria-label="Krank"',
+    AbsenceType.HOLIDAY: b'aria-label="Feiertag"',
+    AbsenceType.FLEX_TIME: b'aria-label="Gleitzeit"',
+}
+ACTIVE_CLASSES = {
+    AbsenceType.VACATION: (b"!bg-primary/30", b"!border-primary"),
+    AbsenceType.SICK: (b"!bg-error/30", b"!border-error"),
+    AbsenceType.HOLIDAY: (b"!bg-warning/30", b"!border-warning"),
+    AbsenceType.FLEX_TIME: (b"!bg-info/30", b"!border-info"),
+}
+TOGGLE_TO_NONE = b'"absence_type": "none"'
+
+
+def assert_db_absence(db_session, entry_id: int, expected: AbsenceType) -> None:
+    """Reload one entry from the database and check its stored absence type."""
+    stored = db_session.get(TimeEntry, entry_id, populate_existing=True)
+    assert stored.absence_type == expected
+
+
+@pytest.fixture(autouse=True)
+def user_settings(db_session):
+    """Persist settings for user 1 so row renders take the steady-state path."""
+    return persist(db_session, UserSettingsFactory.build(user_id=1))
 
 
 class TestQuickAbsenceButtonsDisplay:
     """Test that quick absence buttons are present in read-only rows."""
 
-    def test_row_contains_absence_buttons(self, client, db_session):
+    def test_row_contains_absence_buttons(self, client, assert_max_queries, make_entry):
         """Read-only row contains quick absence buttons for all absence types."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
-            absence_type=AbsenceType.NONE,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry(start_time=time(8, 0), end_time=time(16, 0))
 
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
 
         assert response.status_code == 200
         # Should contain quick absence buttons for each type
         # Using aria-label for accessibility and testing
-        assert 'aria-label="Urlaub"' in response.text or "Urlaub" in response.text
-        assert 'aria-label="Krank"' in response.text or "Krank" in response.text
-        assert 'aria-label="Feiertag"' in response.text or "Feiertag" in response.text
-        assert 'aria-label="Gleitzeit"' in response.text or "Gleitzeit" in response.text
+        assert_contains_all(response, *LABELS)
 
-    def test_buttons_have_patch_actions(self, client, db_session):
+    def test_buttons_have_patch_actions(self, client, assert_max_queries, make_entry):
         """Each quick absence button has PATCH action to toggle absence type."""
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
 
         assert response.status_code == 200
-        # Should have PATCH actions for each absence type
-        assert f'hx-patch="/time-entries/{entry.id}"' in response.text
-        # Should include absence_type in hx-vals
-        assert '"absence_type"' in response.text
+        # Should have PATCH actions for each absence type, with absence_type in hx-vals
+        assert_contains_all(response, f'hx-patch="/time-entries/{entry.id}"', '"absence_type"')
 
-    def test_buttons_stop_propagation(self, client, db_session):
+    def test_buttons_stop_propagation(self, client, assert_max_queries, make_entry):
         """Quick absence buttons prevent row click event (don't enter edit mode)."""
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
 
         assert response.status_code == 200
         # Buttons should have onclick="event.stopPropagation()" to prevent row click
-        assert "event.stopPropagation()" in response.text
+        assert b"event.stopPropagation()" in response.content
 
 
 class TestQuickAbsenceButtonVisualState:
     """Test visual indicators showing current absence type."""
 
-    def test_vacation_button_highlighted_when_active(self, client, db_session):
-        """Vacation button is visually highlighted when absence_type is vacation."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.VACATION,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        response = client.get(f"/time-entries/{entry.id}/row")
-
-        assert response.status_code == 200
-        # Vacation button should have active/highlighted styling (!bg-primary/30 !border-primary)
-        # and hx-vals should toggle to "none"
-        assert 'aria-label="Urlaub"' in response.text
-        assert "!bg-primary/30" in response.text
-        assert "!border-primary" in response.text
-        assert '"absence_type": "none"' in response.text
-
-    def test_sick_button_highlighted_when_active(self, client, db_session):
-        """Sick button is visually highlighted when absence_type is sick."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.SICK,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        response = client.get(f"/time-entries/{entry.id}/row")
-
-        assert response.status_code == 200
-        # Sick button should have active styling (!bg-error/30 !border-error)
-        assert 'aria-label="Krank"' in response.text
-        assert "!bg-error/30" in response.text
-        assert "!border-error" in response.text
-
-    def test_holiday_button_highlighted_when_active(self, client, db_session):
-        """Holiday button is visually highlighted when absence_type is holiday."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.HOLIDAY,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        response = client.get(f"/time-entries/{entry.id}/row")
+    @pytest.mark.parametrize("absence_type", list(ACTIVE_CLASSES), ids=lambda absence_type: absence_type.value)
+    def test_button_highlighted_when_active(self, client, assert_max_queries, make_entry, absence_type):
+        """Matching button is visually highlighted and toggles back to none when active."""
+        entry = make_entry(absence_type)
 
-        assert response.status_code == 200
-        # Holiday button should have active styling (!bg-warning/30 !border-warning)
-        assert 'aria-label="Feiertag"' in response.text
-        assert "!bg-warning/30" in response.text
-        assert "!border-warning" in response.text
-
-    def test_flex_time_button_highlighted_when_active(self, client, db_session):
-        """Flex time button is visually highlighted when absence_type is flex_time."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.FLEX_TIME,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
 
         assert response.status_code == 200
-        # Flex time button should have active styling (!bg-info/30 !border-info)
-        assert 'aria-label="Gleitzeit"' in response.text
-        assert "!bg-info/30" in response.text
-        assert "!border-info" in response.text
+        # Active button has highlighted styling and its hx-vals toggle to "none"
+        assert_contains_all(response, ARIA_LABELS[absence_type], *ACTIVE_CLASSES[absence_type], TOGGLE_TO_NONE)
 
-    def test_no_buttons_highlighted_for_regular_work(self, client, db_session):
+    def test_no_buttons_highlighted_for_regular_work(self, client, assert_max_queries, make_entry):
         """No absence buttons are highlighted when absence_type is none."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.NONE,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
 
         assert response.status_code == 200
         # Should contain absence buttons but none should be in active state
@@ -175,16 +120,9 @@ class TestQuickAbsenceButtonVisualState:
 class TestQuickAbsenceButtonInteraction:
     """Test PATCH interactions for toggling absence types."""
 
-    def test_click_vacation_button_sets_vacation(self, client, db_session):
+    def test_click_vacation_button_sets_vacation(self, client, db_session, make_entry):
         """Clicking vacation button on regular entry sets absence_type to vacation."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.NONE,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -193,21 +131,12 @@ class TestQuickAbsenceButtonInteraction:
 
         assert response.status_code == 200
         # Response should show updated row with vacation highlighted
-        assert "!bg-primary/30" in response.text
-        assert "!border-primary" in response.text
-        db_session.refresh(entry)
-        assert entry.absence_type == AbsenceType.VACATION
+        assert_contains_all(response, *ACTIVE_CLASSES[AbsenceType.VACATION])
+        assert_db_absence(db_session, entry.id, AbsenceType.VACATION)
 
-    def test_click_same_button_toggles_to_none(self, client, db_session):
+    def test_click_same_button_toggles_to_none(self, client, db_session, make_entry):
         """Clicking vacation button when already vacation toggles back to none."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.VACATION,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry(AbsenceType.VACATION)
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -216,19 +145,11 @@ class TestQuickAbsenceButtonInteraction:
 
         assert response.status_code == 200
         # Entry should now be regular work (absence_type=none)
-        db_session.refresh(entry)
-        assert entry.absence_type == AbsenceType.NONE
+        assert_db_absence(db_session, entry.id, AbsenceType.NONE)
 
-    def test_click_different_button_switches_type(self, client, db_session):
+    def test_click_different_button_switches_type(self, client, db_session, make_entry):
         """Clicking sick button when vacation is active switches to sick."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.VACATION,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry(AbsenceType.VACATION)
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -236,19 +157,11 @@ class TestQuickAbsenceButtonInteraction:
         )
 
         assert response.status_code == 200
-        db_session.refresh(entry)
-        assert entry.absence_type == AbsenceType.SICK
+        assert_db_absence(db_session, entry.id, AbsenceType.SICK)
 
-    def test_quick_button_returns_updated_row(self, client, db_session):
+    def test_quick_button_returns_updated_row(self, client, make_entry):
         """PATCH from quick button returns updated read-only row."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.NONE,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -257,101 +170,75 @@ class TestQuickAbsenceButtonInteraction:
 
         assert response.status_code == 200
         # Should return updated row HTML with sick button highlighted
-        assert "text/html" in response.headers["content-type"]
-        assert f'id="time-entry-row-{entry.id}"' in response.text
+        parsed = parse_response(response)
+        assert "text/html" in parsed.content_type
+        assert f'id="time-entry-row-{entry.id}"'.encode() in parsed.content
 
 
 class TestQuickAbsenceButtonsInBrowserView:
     """Test that quick absence buttons appear in browser list view."""
 
-    def test_browser_view_shows_quick_buttons(self, client, db_session):
+    def test_browser_view_shows_quick_buttons(self, client, make_entry):
         """Browser view (monthly table) shows quick absence buttons in each row."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.NONE,
-        )
-        db_session.add(entry)
-        db_session.commit()
+        entry = make_entry()
 
         response = client.get("/time-entries?month=1&year=2026")
 
         assert response.status_code == 200
-        # Should contain quick absence buttons in the table
-        assert 'aria-label="Urlaub"' in response.text or "Urlaub" in response.text
-        assert 'aria-label="Krank"' in response.text or "Krank" in response.text
+        # Should contain quick absence buttons in the entry's row of the table
+        assert_contains_all(response, *LABELS[:2], f'hx-patch="/time-entries/{entry.id}"')
 
-    def test_buttons_work_without_entering_edit_mode(self, client, db_session):
+    def test_buttons_work_without_entering_edit_mode(self, client, assert_max_queries, make_entry):
         """Quick buttons toggle absence without switching to edit mode."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.NONE,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
         # Get row view (read-only)
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
         assert response.status_code == 200
 
-        # Should NOT contain edit form inputs (still read-only)
-        assert 'name="start_time"' not in response.text
-        assert 'name="end_time"' not in response.text
+        # Should have PATCH buttons for quick absence
+        body = assert_contains_all(response, f'hx-patch="/time-entries/{entry.id}"')
 
-        # But should have PATCH buttons for quick absence
-        assert f'hx-patch="/time-entries/{entry.id}"' in response.text
+        # Should NOT contain edit form inputs (still read-only)
+        assert b'name="start_time"' not in body
+        assert b'name="end_time"' not in body
 
 
 class TestQuickAbsenceButtonsStyling:
     """Test button styling and layout."""
 
-    def test_buttons_are_small_and_subtle(self, client, db_session):
+    def test_buttons_are_small_and_subtle(self, client, assert_max_queries, make_entry):
         """Quick absence buttons are small and subtle (not prominent)."""
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
 
         assert response.status_code == 200
         # Buttons should be small (w-6 h-6 or btn-xs, etc.)
         # Could check for opacity classes or size classes
         # This is a softer assertion - just verify buttons exist with some sizing
-        assert 'hx-patch="/time-entries/' in response.text
+        assert b'hx-patch="/time-entries/' in response.content
 
-    def test_buttons_have_tooltips(self, client, db_session):
+    def test_buttons_have_tooltips(self, client, assert_max_queries, make_entry):
         """Quick absence buttons have German tooltips on hover."""
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry()
 
-        response = client.get(f"/time-entries/{entry.id}/row")
+        with assert_max_queries(ROW_QUERY_LIMIT):
+            response = client.get(f"/time-entries/{entry.id}/row")
 
         assert response.status_code == 200
         # Should have German labels/tooltips
-        assert "Urlaub" in response.text
-        assert "Krank" in response.text
-        assert "Feiertag" in response.text
-        assert "Gleitzeit" in response.text
+        assert_contains_all(response, *LABELS)
 
 
 class TestBackendAbsenceToggleLogic:
     """Test backend logic for toggling absence types."""
 
-    def test_patch_with_same_type_toggles_to_none(self, client, db_session):
+    def test_patch_with_same_type_toggles_to_none(self, client, db_session, make_entry):
         """Backend correctly toggles to 'none' when same type is clicked."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            absence_type=AbsenceType.VACATION,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry(AbsenceType.VACATION)
 
         # Frontend sends "none" when clicking active button
         response = client.patch(
@@ -360,22 +247,11 @@ class TestBackendAbsenceToggleLogic:
         )
 
         assert response.status_code == 200
-        db_session.refresh(entry)
-        assert entry.absence_type == AbsenceType.NONE
+        assert_db_absence(db_session, entry.id, AbsenceType.NONE)
 
-    def test_patch_preserves_time_fields(self, client, db_session):
+    def test_patch_preserves_time_fields(self, client, db_session, make_entry):
         """Changing absence_type preserves start_time, end_time, break_minutes."""
-        entry = TimeEntryFactory.build(
-            user_id=1,
-            work_date=date(2026, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
-            break_minutes=30,
-            absence_type=AbsenceType.NONE,
-        )
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        entry = make_entry(start_time=time(8, 0), end_time=time(16, 0), break_minutes=30)
         original_start = entry.start_time
         original_end = entry.end_time
         original_break = entry.break_minutes
@@ -386,7 +262,7 @@ class TestBackendAbsenceToggleLogic:
         )
 
         assert response.status_code == 200
-        db_session.refresh(entry)
+        entry = db_session.get(TimeEntry, entry.id, populate_existing=True)
         # Time fields should be unchanged
         assert entry.start_time == original_start
         assert entry.end_time == original_end
@@ -394,21 +270,16 @@ class TestBackendAbsenceToggleLogic:
         # But absence type should be updated
         assert entry.absence_type == AbsenceType.SICK
 
-    def test_all_absence_types_supported(self, client, db_session):
+    def test_all_absence_types_supported(self, client, db_session, make_entry):
         """All absence types (vacation, sick, holiday, flex_time) can be set via PATCH."""
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        # Test each absence type
-        absence_types = ["vacation", "sick", "holiday", "flex_time"]
-        for absence_type in absence_types:
-            db_session.refresh(entry)  # Refresh to get latest updated_at
+        entry = make_entry()
+
+        # Test each absence type. The endpoint shares db_session and refreshes
+        # `entry` after its commit, so updated_at always holds the latest value.
+        for absence_type in ["vacation", "sick", "holiday", "flex_time"]:
             response = client.patch(
                 f"/time-entries/{entry.id}",
                 data={"absence_type": absence_type, "updated_at": entry.updated_at.isoformat()},
             )
             assert response.status_code == 200, f"Failed to set {absence_type}"
-            db_session.refresh(entry)
-            assert entry.absence_type.value == absence_type
+            assert_db_absence(db_session, entry.id, AbsenceType(absence_type))
@@ -11,8 +11,29 @@ Routes tested:
 from datetime import date as date_type
 from decimal import Decimal
 
+import pytest
+from httpx import Response
+
 from source.database.models import UserSettings
-from tests.factories import UserSettingsFactory
+from tests.helpers import assert_contains_all
+
+INITIAL_HOURS_OFFSET = Decimal("15.50")
+INITIAL_VACATION_DAYS = Decimal("15.5")
+ANNUAL_VACATION_DAYS = Decimal("30.0")
+CARRYOVER_DAYS = Decimal("5.0")
+GERMAN_DAY_NAMES = (b"Montag", b"Dienstag", b"Mittwoch", b"Donnerstag", b"Freitag", b"Samstag", b"Sonntag")
+
+
+def assert_settings_updated(response: Response) -> None:
+    """Assert a settings PATCH succeeded and told HTMX to refresh dependent views."""
+    assert response.status_code == 200
+    assert response.headers.get("HX-Trigger") == "settingsUpdated"
+
+
+@pytest.fixture
+def settings(make_settings):
+    """Persist 40-hour settings for user 1, rolled back with the test transaction."""
+    return make_settings()
 
 
 class TestSettingsPage:
@@ -40,20 +61,12 @@ class TestSettingsPage:
 
         assert response.status_code == 200
         # All seven German day names
-        assert "Montag" in response.text
-        assert "Dienstag" in response.text
-        assert "Mittwoch" in response.text
-        assert "Donnerstag" in response.text
-        assert "Freitag" in response.text
-        assert "Samstag" in response.text
-        assert "Sonntag" in response.text
+        assert_contains_all(response, *GERMAN_DAY_NAMES)
 
-    def test_settings_page_prepopulates_existing_values(self, client, db_session):
+    def test_settings_page_prepopulates_existing_values(self, client, db_session, make_settings):
         """Settings page shows existing weekday defaults."""
         # Create settings with custom weekday defaults
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        make_settings(
             schedule_json={
                 "weekday_defaults": {
                     "0": {"start_time": "09:00", "end_time": "17:00", "break_minutes": 45},
@@ -61,8 +74,6 @@ class TestSettingsPage:
                 }
             },
         )
-        db_session.add(settings)
-        db_session.commit()
 
         response = client.get("/settings")
 
@@ -79,12 +90,22 @@ class TestSettingsPage:
         assert "08:00" in response.text
         assert "16:30" in response.text
 
-    def test_settings_page_shows_null_for_weekends(self, client, db_session):
+    def test_settings_page_renders_saved_settings_after_default_page(self, client, make_settings):
+        """Settings saved after a default-only render are shown on the next page load."""
+        default_response = client.get("/settings")
+        make_settings(schedule_json={"weekday_defaults": {"0": {"start_time": "06:45", "end_time": "15:15"}}})
+
+        response = client.get("/settings")
+
+        assert default_response.status_code == 200
+        assert response.status_code == 200
+        assert b"06:45" not in default_response.content
+        assert_contains_all(response, "06:45", "15:15")
+
+    def test_settings_page_shows_null_for_weekends(self, client, db_session, make_settings):
         """Settings page shows weekends as non-working days."""
         # Create settings with Saturday/Sunday as null (no work)
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        make_settings(
             schedule_json={
                 "weekday_defaults": {
                     "0": {"start_time": "08:00", "end_time": "16:30", "break_minutes": 30},
@@ -97,8 +118,6 @@ class TestSettingsPage:
                 }
             },
         )
-        db_session.add(settings)
-        db_session.commit()
 
         response = client.get("/settings")
 
@@ -144,14 +163,8 @@ class TestSettingsPage:
 class TestWeekdayDefaultsUpdate:
     """Test PATCH /settings/weekday-defaults endpoint."""
 
-    def test_update_weekday_defaults_success(self, client, db_session):
+    def test_update_weekday_defaults_success(self, client, db_session, settings):
         """PATCH updates weekday defaults successfully."""
-        # Create initial settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/weekday-defaults",
             data={
@@ -165,13 +178,8 @@ class TestWeekdayDefaultsUpdate:
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_update_sets_hx_trigger(self, client, db_session):
+    def test_update_sets_hx_trigger(self, client, db_session, settings):
         """PATCH sets HX-Trigger: settingsUpdated header."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/weekday-defaults",
             data={
@@ -182,18 +190,10 @@ class TestWeekdayDefaultsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
-    def test_update_persists_to_database(self, client, db_session):
+    def test_update_persists_to_database(self, client, db_session, settings):
         """PATCH persists changes to database."""
-        # Create initial settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         client.patch(
             "/settings/weekday-defaults",
             data={
@@ -213,12 +213,10 @@ class TestWeekdayDefaultsUpdate:
         assert settings.schedule_json["weekday_defaults"]["0"]["end_time"] == "17:00"
         assert settings.schedule_json["weekday_defaults"]["0"]["break_minutes"] == 45
 
-    def test_update_handles_partial_updates(self, client, db_session):
+    def test_update_handles_partial_updates(self, client, db_session, make_settings):
         """PATCH handles partial updates (only update provided weekdays)."""
         # Create settings with multiple weekdays configured
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        settings = make_settings(
             schedule_json={
                 "weekday_defaults": {
                     "0": {"start_time": "08:00", "end_time": "16:30", "break_minutes": 30},
@@ -226,9 +224,6 @@ class TestWeekdayDefaultsUpdate:
                 }
             },
         )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
 
         # Update only Monday (weekday 0)
         response = client.patch(
@@ -250,13 +245,8 @@ class TestWeekdayDefaultsUpdate:
         # Tuesday should remain unchanged
         assert settings.schedule_json["weekday_defaults"]["1"]["start_time"] == "08:00"
 
-    def test_update_multiple_weekdays_at_once(self, client, db_session):
+    def test_update_multiple_weekdays_at_once(self, client, db_session, settings):
         """PATCH updates multiple weekdays in single request."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/weekday-defaults",
             data={
@@ -281,13 +271,8 @@ class TestWeekdayDefaultsUpdate:
         assert settings.schedule_json["weekday_defaults"]["1"] is not None
         assert settings.schedule_json["weekday_defaults"]["2"] is not None
 
-    def test_update_validates_time_format(self, client, db_session):
+    def test_update_validates_time_format(self, client, db_session, settings):
         """PATCH validates time format (HH:MM)."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/weekday-defaults",
             data={
@@ -300,13 +285,8 @@ class TestWeekdayDefaultsUpdate:
 
         assert response.status_code == 422  # Validation error
 
-    def test_update_validates_break_minutes_range(self, client, db_session):
+    def test_update_validates_break_minutes_range(self, client, db_session, settings):
         """PATCH validates break_minutes is within valid range."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/weekday-defaults",
             data={
@@ -319,13 +299,8 @@ class TestWeekdayDefaultsUpdate:
 
         assert response.status_code == 422  # Validation error
 
-    def test_update_returns_updated_form_partial(self, client, db_session):
+    def test_update_returns_updated_form_partial(self, client, db_session, settings):
         """PATCH returns updated form partial with new values."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/weekday-defaults",
             data={
@@ -341,20 +316,15 @@ class TestWeekdayDefaultsUpdate:
         assert "09:30" in response.text
         assert "18:00" in response.text
 
-    def test_update_weekday_to_null_for_non_working_day(self, client, db_session):
+    def test_update_weekday_to_null_for_non_working_day(self, client, db_session, make_settings):
         """PATCH can set weekday to null (non-working day)."""
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        settings = make_settings(
             schedule_json={
                 "weekday_defaults": {
                     "5": {"start_time": "08:00", "end_time": "16:30", "break_minutes": 30},  # Saturday working
                 }
             },
         )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
 
         # Update to make Saturday non-working by omitting data or sending empty values
         response = client.patch(
@@ -384,15 +354,10 @@ class TestWeekdayDefaultsUpdate:
         )
 
         # May return 200 or 201 depending on implementation
-        assert response.status_code in [200, 201]
+        assert response.status_code in (200, 201)
 
-    def test_update_requires_valid_weekday_keys(self, client, db_session):
+    def test_update_requires_valid_weekday_keys(self, client, db_session, settings):
         """PATCH validates weekday keys are 0-6."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/weekday-defaults",
             data={
@@ -405,100 +370,79 @@ class TestWeekdayDefaultsUpdate:
 
         assert response.status_code == 422  # Validation error
 
-
-class TestTrackingSettingsUpdate:
-    """Test PATCH /settings/tracking endpoint."""
-
-    def test_patch_tracking_settings_updates_tracking_start_date(self, client, db_session):
-        """PATCH updates tracking_start_date successfully."""
-        # Create initial settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
+    def test_update_ignores_zero_padded_weekday_keys(self, client, db_session, settings):
+        """PATCH reads only weekday_<i>_* keys; zero-padded day numbers are not merged or validated."""
         response = client.patch(
-            "/settings/tracking",
+            "/settings/weekday-defaults",
             data={
-                "tracking_start_date": "2026-01-15",
+                "weekday_1_start_time": "08:00",
+                "weekday_1_end_time": "16:30",
+                "weekday_01_start_time": "25:00",
+                "weekday_01_break_minutes": "999",
                 "updated_at": settings.updated_at.isoformat(),
             },
         )
 
         assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
-
-        # Verify database update
         db_session.refresh(settings)
-        from datetime import date as date_type
+        assert settings.schedule_json["weekday_defaults"]["1"] == {
+            "start_time": "08:00",
+            "end_time": "16:30",
+            "break_minutes": 30,
+        }
 
-        assert settings.tracking_start_date == date_type(2026, 1, 15)
 
-    def test_patch_tracking_settings_updates_initial_hours_offset(self, client, db_session):
-        """PATCH updates initial_hours_offset successfully."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+class TestTrackingSettingsUpdate:
+    """Test PATCH /settings/tracking endpoint."""
 
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            ({"tracking_start_date": "2026-01-15"}, {"tracking_start_date": date_type(2026, 1, 15)}),
+            ({"initial_hours_offset": "15.50"}, {"initial_hours_offset": INITIAL_HOURS_OFFSET}),
+            (
+                {"tracking_start_date": "2026-01-15", "initial_hours_offset": "15.50"},
+                {"tracking_start_date": date_type(2026, 1, 15), "initial_hours_offset": INITIAL_HOURS_OFFSET},
+            ),
+            ({"initial_hours_offset": "-15.50"}, {"initial_hours_offset": Decimal("-15.50")}),
+            # 24:20 = 24 + 20/60 = 24.3333... → quantized to 24.33
+            ({"initial_hours_offset": "24:20"}, {"initial_hours_offset": Decimal("24.33")}),
+            ({"initial_hours_offset": "-5:30"}, {"initial_hours_offset": Decimal("-5.50")}),
+            ({"tracking_start_date": "15.01.2026"}, {"tracking_start_date": date_type(2026, 1, 15)}),
+            ({"tracking_start_date": "5.1.2026"}, {"tracking_start_date": date_type(2026, 1, 5)}),
+        ],
+        ids=[
+            "tracking_start_date",
+            "initial_hours_offset",
+            "both_fields",
+            "negative_offset",
+            "hhmm",
+            "hhmm_negative",
+            "german_date",
+            "german_date_without_leading_zeros",
+        ],
+    )
+    def test_patch_tracking_settings_updates_fields(self, client, db_session, settings, payload, expected):
+        """PATCH stores valid tracking fields, including negative and HH:MM offsets."""
         response = client.patch(
             "/settings/tracking",
-            data={
-                "initial_hours_offset": "15.50",
-                "updated_at": settings.updated_at.isoformat(),
-            },
+            data={**payload, "updated_at": settings.updated_at.isoformat()},
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify database update
         db_session.refresh(settings)
-        assert settings.initial_hours_offset == Decimal("15.50")
+        for field, value in expected.items():
+            assert getattr(settings, field) == value
 
-    def test_patch_tracking_settings_both_fields(self, client, db_session):
-        """PATCH updates both tracking_start_date and initial_hours_offset."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        response = client.patch(
-            "/settings/tracking",
-            data={
-                "tracking_start_date": "2026-01-15",
-                "initial_hours_offset": "15.50",
-                "updated_at": settings.updated_at.isoformat(),
-            },
-        )
-
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
-
-        # Verify both fields updated
-        db_session.refresh(settings)
-        from datetime import date as date_type
-
-        assert settings.tracking_start_date == date_type(2026, 1, 15)
-        assert settings.initial_hours_offset == Decimal("15.50")
-
-    def test_patch_tracking_settings_clears_values_with_empty_string(self, client, db_session):
+    def test_patch_tracking_settings_clears_values_with_empty_string(self, client, db_session, make_settings):
         """PATCH clears tracking fields when empty strings provided."""
         # Create settings with existing values
-        from datetime import date as date_type
-
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        settings = make_settings(
             tracking_start_date=date_type(2026, 1, 1),
             initial_hours_offset=Decimal("10.00"),
         )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
 
         response = client.patch(
             "/settings/tracking",
@@ -509,104 +453,47 @@ class TestTrackingSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify fields cleared
         db_session.refresh(settings)
         assert settings.tracking_start_date is None
         assert settings.initial_hours_offset is None
 
-    def test_patch_tracking_settings_invalid_date_format(self, client, db_session):
-        """PATCH rejects invalid date format with German error message."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        response = client.patch(
-            "/settings/tracking",
-            data={
-                "tracking_start_date": "invalid-date",
-                "updated_at": settings.updated_at.isoformat(),
-            },
-        )
-
-        assert response.status_code == 422
-        # Should contain German error message
-        assert "Ungültiges Datumsformat" in response.text
-
-    def test_patch_tracking_settings_invalid_offset_value(self, client, db_session):
-        """PATCH rejects non-numeric offset with German error message."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        response = client.patch(
-            "/settings/tracking",
-            data={
-                "initial_hours_offset": "not-a-number",
-                "updated_at": settings.updated_at.isoformat(),
-            },
-        )
-
-        assert response.status_code == 422
-        # Should contain German validation error
-        assert response.text  # Contains error message
-
-    def test_patch_tracking_settings_offset_out_of_range_high(self, client, db_session):
-        """PATCH rejects offset > 999.99 with German error message."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
+    @pytest.mark.parametrize(
+        ("payload", "message"),
+        [
+            ({"tracking_start_date": "invalid-date"}, "Ungültiges Datumsformat"),
+            ({"tracking_start_date": "31.02.2026"}, "Ungültiges Datumsformat"),
+            ({"initial_hours_offset": "not-a-number"}, "Ungültiges Format. Bitte HH:MM verwenden (z.B. 24:20)"),
+            ({"initial_hours_offset": "1000.00"}, "Saldo muss zwischen -999:59 und 999:59 liegen"),
+            ({"initial_hours_offset": "-1000.00"}, "Saldo muss zwischen -999:59 und 999:59 liegen"),
+        ],
+        ids=[
+            "invalid_date_format",
+            "impossible_german_date",
+            "invalid_offset_value",
+            "offset_out_of_range_high",
+            "offset_out_of_range_low",
+        ],
+    )
+    def test_patch_tracking_settings_rejects_invalid_input(self, client, db_session, settings, payload, message):
+        """PATCH rejects malformed dates and offsets outside -999.99..999.99 with an error message."""
         response = client.patch(
             "/settings/tracking",
-            data={
-                "initial_hours_offset": "1000.00",
-                "updated_at": settings.updated_at.isoformat(),
-            },
+            data={**payload, "updated_at": settings.updated_at.isoformat()},
         )
 
         assert response.status_code == 422
-        # Should contain validation error about range
-        assert response.text
-
-    def test_patch_tracking_settings_offset_out_of_range_low(self, client, db_session):
-        """PATCH rejects offset < -999.99 with German error message."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        response = client.patch(
-            "/settings/tracking",
-            data={
-                "initial_hours_offset": "-1000.00",
-                "updated_at": settings.updated_at.isoformat(),
-            },
-        )
+        assert response.json()["detail"] == message
 
-        assert response.status_code == 422
-        # Should contain validation error about range
-        assert response.text
-
-    def test_get_settings_includes_tracking_fields(self, client, db_session):
+    def test_get_settings_includes_tracking_fields(self, client, db_session, make_settings):
         """GET /settings renders tracking_start_date and initial_hours_offset in German format."""
-        from datetime import date as date_type
-
         # Create settings with tracking fields
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        make_settings(
             tracking_start_date=date_type(2026, 1, 15),
-            initial_hours_offset=Decimal("15.50"),
+            initial_hours_offset=INITIAL_HOURS_OFFSET,
         )
-        db_session.add(settings)
-        db_session.commit()
 
         response = client.get("/settings")
 
@@ -618,70 +505,6 @@ class TestTrackingSettingsUpdate:
         # Should render weekly_target_hours in German format
         assert "40,00" in response.text
 
-    def test_patch_tracking_settings_negative_offset(self, client, db_session):
-        """PATCH accepts negative offset within valid range."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        response = client.patch(
-            "/settings/tracking",
-            data={
-                "initial_hours_offset": "-15.50",
-                "updated_at": settings.updated_at.isoformat(),
-            },
-        )
-
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
-
-        # Verify negative offset accepted
-        db_session.refresh(settings)
-        assert settings.initial_hours_offset == Decimal("-15.50")
-
-    def test_patch_tracking_settings_hhmm_format(self, client, db_session):
-        """PATCH accepts HH:MM format for initial_hours_offset."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        # Test 24:20 (24 hours 20 minutes = 24.333... hours)
-        response = client.patch(
-            "/settings/tracking",
-            data={
-                "initial_hours_offset": "24:20",
-                "updated_at": settings.updated_at.isoformat(),
-            },
-        )
-
-        assert response.status_code == 200
-        db_session.refresh(settings)
-        # 24:20 = 24 + 20/60 = 24.3333... → quantized to 24.33
-        assert settings.initial_hours_offset == Decimal("24.33")
-
-    def test_patch_tracking_settings_hhmm_negative_format(self, client, db_session):
-        """PATCH accepts negative HH:MM format for initial_hours_offset."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
-        # Test -5:30 (negative 5 hours 30 minutes = -5.5 hours)
-        response = client.patch(
-            "/settings/tracking",
-            data={
-                "initial_hours_offset": "-5:30",
-                "updated_at": settings.updated_at.isoformat(),
-            },
-        )
-
-        assert response.status_code == 200
-        db_session.refresh(settings)
-        assert settings.initial_hours_offset == Decimal("-5.50")
-
     def test_patch_tracking_settings_creates_settings_if_not_exist(self, client, db_session):
         """PATCH creates settings record if none exists for user."""
         # No existing settings - should create one
@@ -694,20 +517,14 @@ class TestTrackingSettingsUpdate:
         )
 
         # May return 200 or 201 depending on implementation
-        assert response.status_code in [200, 201]
+        assert response.status_code in (200, 201)
 
 
 class TestVacationSettingsUpdate:
     """Test PATCH /settings/vacation endpoint."""
 
-    def test_patch_vacation_settings_updates_initial_days(self, client, db_session):
+    def test_patch_vacation_settings_updates_initial_days(self, client, db_session, settings):
         """PATCH updates initial_vacation_days successfully."""
-        # Create initial settings
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -716,21 +533,14 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify database update
         db_session.refresh(settings)
-        assert settings.initial_vacation_days == Decimal("15.5")
+        assert settings.initial_vacation_days == INITIAL_VACATION_DAYS
 
-    def test_patch_vacation_settings_updates_annual_days(self, client, db_session):
+    def test_patch_vacation_settings_updates_annual_days(self, client, db_session, settings):
         """PATCH updates annual_vacation_days successfully."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -739,21 +549,14 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify database update
         db_session.refresh(settings)
-        assert settings.annual_vacation_days == Decimal("30.0")
+        assert settings.annual_vacation_days == ANNUAL_VACATION_DAYS
 
-    def test_patch_vacation_settings_updates_carryover(self, client, db_session):
+    def test_patch_vacation_settings_updates_carryover(self, client, db_session, settings):
         """PATCH updates carryover days and expiry successfully."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -763,24 +566,15 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify database update
         db_session.refresh(settings)
-        from datetime import date as date_type
-
-        assert settings.vacation_carryover_days == Decimal("5.0")
+        assert settings.vacation_carryover_days == CARRYOVER_DAYS
         assert settings.vacation_carryover_expires == date_type(2026, 3, 31)
 
-    def test_patch_vacation_settings_all_fields(self, client, db_session):
+    def test_patch_vacation_settings_all_fields(self, client, db_session, settings):
         """PATCH updates all four vacation fields at once."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -792,35 +586,24 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify all fields updated
         db_session.refresh(settings)
-        from datetime import date as date_type
-
-        assert settings.initial_vacation_days == Decimal("15.5")
-        assert settings.annual_vacation_days == Decimal("30.0")
-        assert settings.vacation_carryover_days == Decimal("5.0")
+        assert settings.initial_vacation_days == INITIAL_VACATION_DAYS
+        assert settings.annual_vacation_days == ANNUAL_VACATION_DAYS
+        assert settings.vacation_carryover_days == CARRYOVER_DAYS
         assert settings.vacation_carryover_expires == date_type(2026, 3, 31)
 
-    def test_patch_vacation_settings_clears_with_empty_string(self, client, db_session):
+    def test_patch_vacation_settings_clears_with_empty_string(self, client, db_session, make_settings):
         """PATCH clears vacation fields when empty strings provided."""
         # Create settings with existing values
-        from datetime import date as date_type
-
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-            initial_vacation_days=Decimal("15.5"),
-            annual_vacation_days=Decimal("30.0"),
-            vacation_carryover_days=Decimal("5.0"),
+        settings = make_settings(
+            initial_vacation_days=INITIAL_VACATION_DAYS,
+            annual_vacation_days=ANNUAL_VACATION_DAYS,
+            vacation_carryover_days=CARRYOVER_DAYS,
             vacation_carryover_expires=date_type(2026, 3, 31),
         )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
 
         response = client.patch(
             "/settings/vacation",
@@ -833,9 +616,7 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify fields cleared
         db_session.refresh(settings)
@@ -844,13 +625,8 @@ class TestVacationSettingsUpdate:
         assert settings.vacation_carryover_days is None
         assert settings.vacation_carryover_expires is None
 
-    def test_patch_vacation_settings_invalid_number_format(self, client, db_session):
+    def test_patch_vacation_settings_invalid_number_format(self, client, db_session, settings):
         """PATCH rejects non-numeric vacation days with German error message."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -863,13 +639,8 @@ class TestVacationSettingsUpdate:
         # Should contain German validation error
         assert response.text
 
-    def test_patch_vacation_settings_invalid_date_format(self, client, db_session):
+    def test_patch_vacation_settings_invalid_date_format(self, client, db_session, settings):
         """PATCH rejects invalid date format with German error message."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -882,13 +653,8 @@ class TestVacationSettingsUpdate:
         # Should contain German error message
         assert "Ungültiges Datumsformat" in response.text
 
-    def test_patch_vacation_settings_negative_days_rejected(self, client, db_session):
+    def test_patch_vacation_settings_negative_days_rejected(self, client, db_session, settings):
         """PATCH rejects negative vacation days with German error message."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -901,13 +667,8 @@ class TestVacationSettingsUpdate:
         # Should contain validation error about negative values
         assert response.text
 
-    def test_patch_vacation_settings_german_number_format(self, client, db_session):
+    def test_patch_vacation_settings_german_number_format(self, client, db_session, settings):
         """PATCH accepts German number format (comma decimal)."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -916,21 +677,14 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify German format converted correctly
         db_session.refresh(settings)
-        assert settings.initial_vacation_days == Decimal("15.5")
+        assert settings.initial_vacation_days == INITIAL_VACATION_DAYS
 
-    def test_patch_vacation_settings_german_date_format(self, client, db_session):
+    def test_patch_vacation_settings_german_date_format(self, client, db_session, settings):
         """PATCH accepts German date format (DD.MM.YYYY)."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -939,23 +693,14 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         # Verify German format converted correctly
         db_session.refresh(settings)
-        from datetime import date as date_type
-
         assert settings.vacation_carryover_expires == date_type(2026, 3, 31)
 
-    def test_patch_vacation_settings_updates_holiday_state_and_employment_start(self, client, db_session):
+    def test_patch_vacation_settings_updates_holiday_state_and_employment_start(self, client, db_session, settings):
         """PATCH updates holiday_state and employment_start_date successfully."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -965,24 +710,18 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         db_session.refresh(settings)
         assert settings.holiday_state == "NW"
         assert settings.employment_start_date == date_type(2026, 1, 15)
 
-    def test_patch_vacation_settings_clears_holiday_state_and_employment_start(self, client, db_session):
+    def test_patch_vacation_settings_clears_holiday_state_and_employment_start(self, client, db_session, make_settings):
         """PATCH clears holiday_state and employment_start_date when empty strings are provided."""
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        settings = make_settings(
             holiday_state="NW",
             employment_start_date=date_type(2026, 1, 15),
         )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
 
         response = client.patch(
             "/settings/vacation",
@@ -999,13 +738,8 @@ class TestVacationSettingsUpdate:
         assert settings.holiday_state is None
         assert settings.employment_start_date is None
 
-    def test_patch_vacation_settings_rejects_invalid_holiday_state(self, client, db_session):
+    def test_patch_vacation_settings_rejects_invalid_holiday_state(self, client, db_session, settings):
         """PATCH rejects unsupported holiday_state codes."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -1017,12 +751,9 @@ class TestVacationSettingsUpdate:
         assert response.status_code == 422
         assert "Ungültiges Bundesland" in response.text
 
-    def test_patch_vacation_settings_applies_default_company_closures(self, client, db_session):
+    def test_patch_vacation_settings_applies_default_company_closures(self, client, db_session, make_settings):
         """PATCH applies default recurring company closures when none exist yet."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"), schedule_json={})
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = make_settings(schedule_json={})
 
         response = client.patch(
             "/settings/vacation",
@@ -1042,12 +773,9 @@ class TestVacationSettingsUpdate:
         assert closures["12-31"]["recurring"] is True
         assert closures["12-31"]["counts_as_vacation"] is False
 
-    def test_patch_vacation_settings_can_disable_default_company_closures(self, client, db_session):
+    def test_patch_vacation_settings_can_disable_default_company_closures(self, client, db_session, make_settings):
         """PATCH can disable default recurring company closures through checkbox fields."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"), schedule_json={})
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
+        settings = make_settings(schedule_json={})
 
         response = client.patch(
             "/settings/vacation",
@@ -1067,11 +795,9 @@ class TestVacationSettingsUpdate:
         assert closures["12-31"]["enabled"] is False
         assert closures["12-31"]["counts_as_vacation"] is False
 
-    def test_get_settings_includes_saved_vacation_schedule_fields(self, client, db_session):
+    def test_get_settings_includes_saved_vacation_schedule_fields(self, client, db_session, make_settings):
         """GET /settings renders saved holiday_state, employment_start_date, and company closures."""
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        make_settings(
             holiday_state="NW",
             employment_start_date=date_type(2026, 1, 15),
             schedule_json={
@@ -1095,8 +821,6 @@ class TestVacationSettingsUpdate:
                 }
             },
         )
-        db_session.add(settings)
-        db_session.commit()
 
         response = client.get("/settings")
 
@@ -1107,13 +831,8 @@ class TestVacationSettingsUpdate:
         assert "24.12 Heiligabend" in response.text
         assert "31.12 Silvester" in response.text
 
-    def test_patch_vacation_settings_sets_hx_trigger(self, client, db_session):
+    def test_patch_vacation_settings_sets_hx_trigger(self, client, db_session, settings):
         """PATCH sets HX-Trigger: settingsUpdated header."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/vacation",
             data={
@@ -1122,9 +841,7 @@ class TestVacationSettingsUpdate:
             },
         )
 
-        assert response.status_code == 200
-        assert "HX-Trigger" in response.headers
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
     def test_patch_vacation_settings_creates_if_not_exist(self, client, db_session):
         """PATCH creates settings record if none exists for user."""
@@ -1138,33 +855,24 @@ class TestVacationSettingsUpdate:
         )
 
         # May return 200 or 201 depending on implementation
-        assert response.status_code in [200, 201]
+        assert response.status_code in (200, 201)
 
-    def test_get_settings_includes_vacation_fields(self, client, db_session):
+    def test_get_settings_includes_vacation_fields(self, client, db_session, make_settings):
         """GET /settings renders vacation fields in German format."""
-        from datetime import date as date_type
-
         # Create settings with vacation fields
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
-            initial_vacation_days=Decimal("15.5"),
-            annual_vacation_days=Decimal("30.0"),
-            vacation_carryover_days=Decimal("5.0"),
+        make_settings(
+            initial_vacation_days=INITIAL_VACATION_DAYS,
+            annual_vacation_days=ANNUAL_VACATION_DAYS,
+            vacation_carryover_days=CARRYOVER_DAYS,
             vacation_carryover_expires=date_type(2026, 3, 31),
         )
-        db_session.add(settings)
-        db_session.commit()
 
         response = client.get("/settings")
 
         assert response.status_code == 200
         # Should render vacation_carryover_expires in German format (DD.MM.YYYY)
-        assert "31.03.2026" in response.text
-        # Should render vacation days in German format (comma decimal)
-        assert "15,5" in response.text
-        assert "30,0" in response.text
-        assert "5,0" in response.text
+        # and vacation days in German format (comma decimal)
+        assert_contains_all(response, "31.03.2026", "15,5", "30,0", "5,0")
 
 
 class TestEmployeeSettings:
@@ -1181,13 +889,8 @@ class TestEmployeeSettings:
         assert 'name="employee_job_role"' in response.text
         assert 'name="employee_number"' in response.text
 
-    def test_patch_employee_settings_updates_profile_fields(self, client, db_session):
+    def test_patch_employee_settings_updates_profile_fields(self, client, db_session, settings):
         """PATCH saves optional employee profile fields."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/employee",
             data={
@@ -1201,8 +904,7 @@ class TestEmployeeSettings:
             },
         )
 
-        assert response.status_code == 200
-        assert response.headers["HX-Trigger"] == "settingsUpdated"
+        assert_settings_updated(response)
 
         db_session.refresh(settings)
         assert settings.employee_first_name == "Erika"
@@ -1212,11 +914,9 @@ class TestEmployeeSettings:
         assert settings.show_employee_id is True
         assert settings.employee_id_source == "custom"
 
-    def test_patch_employee_settings_clears_optional_fields(self, client, db_session):
+    def test_patch_employee_settings_clears_optional_fields(self, client, db_session, make_settings):
         """PATCH clears optional employee profile fields with empty strings."""
-        settings = UserSettingsFactory.build(
-            user_id=1,
-            weekly_target_hours=Decimal("40.00"),
+        settings = make_settings(
             employee_first_name="Erika",
             employee_last_name="Mustermann",
             employee_job_role="Buchhaltung",
@@ -1224,9 +924,6 @@ class TestEmployeeSettings:
             show_employee_id=True,
             employee_id_source="custom",
         )
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
 
         response = client.patch(
             "/settings/employee",
@@ -1249,13 +946,8 @@ class TestEmployeeSettings:
         assert settings.employee_number is None
         assert settings.show_employee_id is False
 
-    def test_patch_employee_settings_rejects_invalid_id_source(self, client, db_session):
+    def test_patch_employee_settings_rejects_invalid_id_source(self, client, db_session, settings):
         """PATCH rejects unknown employee ID source values."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("40.00"))
-        db_session.add(settings)
-        db_session.commit()
-        db_session.refresh(settings)
-
         response = client.patch(
             "/settings/employee",
             data={
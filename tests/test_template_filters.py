@@ -2,7 +2,9 @@
 
 from decimal import Decimal
 
-from source.api.context import format_balance, format_days, format_duration, format_hours
+import pytest
+
+from source.api.context import format_balance, format_days, format_duration, format_hours, format_hours_decimal
 
 
 class TestFormatHoursFilter:
@@ -42,6 +44,10 @@ class TestFormatHoursFilter:
         """None returns dash placeholder."""
         assert format_hours(None) == "-"
 
+    def test_format_hours_minutes_round_up_into_next_hour(self):
+        """Fractions that round to 60 minutes carry into the hour."""
+        assert format_hours(Decimal("8.9999")) == "9:00h"
+
     def test_format_hours_negative_value(self):
         """Negative hours format correctly (edge case)."""
         # Should handle negative values without sign in display
@@ -83,6 +89,11 @@ class TestFormatDurationFilter:
         """Single minute formats correctly."""
         assert format_duration(1) == "0:01h"
 
+    def test_format_duration_full_day_and_beyond(self):
+        """Values at and past one full day format the same way as shorter ones."""
+        assert format_duration(1440) == "24:00h"
+        assert format_duration(1441) == "24:01h"
+
     def test_format_duration_none(self):
         """None returns dash placeholder."""
         assert format_duration(None) == "-"
@@ -143,6 +154,10 @@ class TestFormatBalanceFilter:
         """Very large negative balance formats correctly."""
         assert format_balance(Decimal("-100.5")) == "-100:30"
 
+    def test_format_balance_minutes_round_up_into_next_hour(self):
+        """Fractions that round to 60 minutes carry into the hour."""
+        assert format_balance(Decimal("-1.9999")) == "-2:00"
+
 
 class TestFormatDaysFilter:
     """Tests for vacation day formatting."""
@@ -162,3 +177,29 @@ class TestFormatDaysFilter:
     def test_format_days_none(self):
         """None returns dash placeholder."""
         assert format_days(None) == "-"
+
+
+class TestFilterSignedZero:
+    """Decimal("0.00") and Decimal("-0.00") compare equal, so filters must not share results between them."""
+
+    @pytest.mark.parametrize(
+        ("format_filter", "zero_output", "negative_zero_output"),
+        [
+            pytest.param(format_hours_decimal, "0,00 h", "-0,00 h", id="format_hours_decimal"),
+            pytest.param(format_hours, "0:00h", "0:00h", id="format_hours"),
+            pytest.param(format_balance, "+0:00", "+0:00", id="format_balance"),
+            pytest.param(format_days, "0", "0", id="format_days"),
+        ],
+    )
+    @pytest.mark.parametrize("negative_zero_first", [False, True], ids=["zero_first", "negative_zero_first"])
+    def test_signed_zero_output_does_not_depend_on_call_order(
+        self, format_filter, zero_output, negative_zero_output, negative_zero_first
+    ):
+        """Formatting -0.00 after 0.00 (and the reverse) gives each value its own output."""
+        values = [Decimal("0.00"), Decimal("-0.00")]
+        if negative_zero_first:
+            values.reverse()
+
+        outputs = {str(value): format_filter(value) for value in values}
+
+        assert outputs == {"0.00": zero_output, "-0.00": negative_zero_output}
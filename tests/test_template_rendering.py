@@ -8,348 +8,202 @@ Design spec: docs/specs/zeiterfassung-monthly-view-spec.md
 Template: templates/partials/_browser_time_entries.html
 """
 
+import re
 from datetime import date, time
-from decimal import Decimal
 
+import pytest
+
+from source.api.context import templates
 from source.database.enums import AbsenceType
 from tests.factories import TimeEntryFactory, UserSettingsFactory
+from tests.helpers import html_region
+
+# Every test here renders through the app and the test database
+pytestmark = pytest.mark.integration
 
 CURRENT_MONTH_DATE = date.today().replace(day=15)
 CURRENT_MONTH_QUERY = f"month={CURRENT_MONTH_DATE.month}&year={CURRENT_MONTH_DATE.year}"
-
-
-class TestTableHeaderStructure:
-    """Verify table header matches spec section 5.2-5.3."""
-
-    def test_table_header_has_all_columns(self, client, db_session):
-        """Table header has all required columns in correct order per spec 5.3."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # All column headers must be present (now with Quick Absence Buttons column)
-        expected_headers = [
-            "Tag",
-            "Ankunft",
-            "Ende",
-            "Pausen",
-            "Arbeitsstunden Real",
-            "Arbeitsstunden Soll",
-            "+/-",
-            "Abwesenheit / Bemerkung",
-            "Abwesenheit",  # Quick absence buttons column
-        ]
-
-        for header in expected_headers:
-            assert header in html, f"Missing column header: {header}"
-
-    def test_table_header_has_dark_background(self, client, db_session):
-        """Table header has dark background styling per spec 5.2."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Header row should have dark background and white text
-        assert 'class="bg-neutral text-white"' in html or ("bg-neutral" in html and "text-white" in html)
-
-
-class TestColumnStyling:
-    """Verify column-specific styling matches spec section 5.3-5.6."""
-
-    def test_arbeitsstunden_real_column_has_blue_background(self, client, db_session):
-        """'Arbeitsstunden Real' body cells have light blue background per spec 5.3."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(
-            user_id=1, work_date=date(2026, 1, 15), start_time=time(7, 0), end_time=time(15, 0), break_minutes=30
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Body cells in Arbeitsstunden Real column should have bg-info/10
-        assert "bg-info/10" in html
-
-    def test_balance_column_uses_color_coding(self, client, db_session):
-        """Balance (+/-) column uses green/red color coding per spec 5.6."""
-        settings = UserSettingsFactory.build(user_id=1)
-        # Create entry with positive balance (8 hours worked vs 6.4 target)
-        entry = TimeEntryFactory.build(
-            user_id=1, work_date=date(2026, 1, 15), start_time=time(7, 0), end_time=time(15, 30), break_minutes=30
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Balance should use success or error color classes
-        assert "text-success" in html or "text-error" in html
-
-
-class TestFooterStructure:
-    """Verify footer structure matches spec section 7."""
-
-    def test_footer_exists_with_summary_rows(self, client, db_session):
-        """Footer has summary rows when data exists per spec 7."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
-        entry = TimeEntryFactory.build(
-            user_id=1, work_date=CURRENT_MONTH_DATE, start_time=time(7, 0), end_time=time(15, 0), break_minutes=30
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get(f"/time-entries?{CURRENT_MONTH_QUERY}")
-        html = response.text
-
-        # Footer should contain Monatssaldo and Zeitkonto labels
-        assert "Monatssaldo:" in html
-        assert "Aktuelles Zeitkonto:" in html
-
-    def test_footer_has_green_background_tinting(self, client, db_session):
-        """Footer rows have green background tinting per spec 7.4."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(
-            user_id=1, work_date=date(2026, 1, 15), start_time=time(7, 0), end_time=time(15, 0)
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Footer should have success color variations
-        assert "bg-success" in html
-
-    def test_footer_has_two_rows(self, client, db_session):
-        """Footer contains exactly 2 summary rows per spec 7.2-7.3."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(
-            user_id=1, work_date=CURRENT_MONTH_DATE, start_time=time(7, 0), end_time=time(15, 0)
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get(f"/time-entries?{CURRENT_MONTH_QUERY}")
-        html = response.text
-
-        # Both summary row labels should exist
-        assert "Monatssaldo:" in html
-        assert "Aktuelles Zeitkonto:" in html
-
-
-class TestAddNextDayRow:
-    """Verify 'Add Next Day' row matches spec section 6."""
-
-    def test_add_row_has_orange_tint(self, client, db_session):
-        """'Add Next Day' row has orange/yellow tint per spec 6.2."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Add row should have warning color tint
-        assert "bg-warning/10" in html
-
-    def test_add_row_contains_german_text(self, client, db_session):
-        """'Add Next Day' row contains German text per spec 6.1."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Should contain German "add next day" text
-        assert "Nächsten Tag hinzufügen" in html
-
-
-class TestMonthNavigation:
-    """Verify month navigation matches spec section 3."""
-
-    def test_month_navigation_displays_german_month_names(self, client, db_session):
-        """Month navigation displays German month names per spec 3.3."""
-        settings = UserSettingsFactory.build(user_id=1)
-        db_session.add(settings)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Januar should be displayed
-        assert "Januar" in html
-
-    def test_month_navigation_has_chevron_buttons(self, client, db_session):
-        """Month navigation has left and right chevron buttons per spec 3.1."""
-        settings = UserSettingsFactory.build(user_id=1)
-        db_session.add(settings)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Should have HTMX navigation links for prev/next month
-        assert "hx-get=" in html
-        # Navigation should target the main content area
-        assert "hx-target=" in html
-
-
-class TestSummaryCards:
-    """Verify summary cards match spec section 4."""
-
-    def test_summary_cards_exist_when_data_present(self, client, db_session):
-        """Summary cards are displayed when entries exist per spec 4."""
-        settings = UserSettingsFactory.build(user_id=1, weekly_target_hours=Decimal("32.00"))
-        entry = TimeEntryFactory.build(
+JANUARY_QUERY = "month=1&year=2026"
+EDIT_ROW_TEMPLATE = "partials/_row_time_entry_edit.html"
+ENTRY_PATCH_PATTERN = re.compile(r'hx-patch="/time-entries/\d+"')
+
+
+@pytest.fixture(scope="module")
+def january_html(render_page):
+    """January 2026 view with one regular work day (07:00-15:30, 30 min break) on a 32-hour week."""
+    return render_page(
+        f"/time-entries?{JANUARY_QUERY}",
+        UserSettingsFactory.build(current_user=True),
+        TimeEntryFactory.build(
+            user_id=1,
+            work_date=date(2026, 1, 15),
+            start_time=time(7, 0),
+            end_time=time(15, 30),
+            break_minutes=30,
+            absence_type=AbsenceType.NONE,
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def current_month_html(render_page):
+    """Current month view with one work day, so summary cards and footer rows are shown."""
+    return render_page(
+        f"/time-entries?{CURRENT_MONTH_QUERY}",
+        UserSettingsFactory.build(current_user=True),
+        TimeEntryFactory.build(
             user_id=1, work_date=CURRENT_MONTH_DATE, start_time=time(7, 0), end_time=time(15, 0), break_minutes=30
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get(f"/time-entries?{CURRENT_MONTH_QUERY}")
-        html = response.text
-
-        # All three card labels should exist
-        assert "Monatssaldo" in html
-        assert "Sollstunden" in html
-        assert "Aktuelles Zeitkonto" in html
-
-    def test_summary_cards_have_subtitles(self, client, db_session):
-        """Summary cards have German subtitles per spec 4.3."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(
-            user_id=1, work_date=CURRENT_MONTH_DATE, start_time=time(7, 0), end_time=time(15, 0)
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get(f"/time-entries?{CURRENT_MONTH_QUERY}")
-        html = response.text
-
-        # Card subtitles should exist
-        assert "Ist-Stunden" in html
-        assert "Pro Monat" in html
-        assert "Überstunden" in html
-
-
-class TestQuickAbsenceButtons:
-    """Verify quick absence buttons column (replaces checkboxes)."""
-
-    def test_absence_column_exists(self, client, db_session):
-        """Abwesenheit column with quick buttons exists."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15), absence_type=AbsenceType.NONE)
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Should have Abwesenheit header
-        assert "Abwesenheit" in html
-        # Should have quick action buttons (not checkboxes)
-        assert 'aria-label="Urlaub"' in html
-        assert 'aria-label="Krank"' in html
-        assert 'aria-label="Feiertag"' in html
-        assert 'aria-label="Gleitzeit"' in html
-
-    def test_absence_buttons_use_htmx_patch(self, client, db_session):
-        """Quick absence buttons use HTMX PATCH for updates."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Buttons should use hx-patch
-        assert "hx-patch=" in html
-        # Should target the specific entry ID
-        assert f"/time-entries/{entry.id}" in html
-
-
-class TestDateFormatting:
-    """Verify date formatting matches spec section 5.3."""
-
-    def test_dates_use_german_format(self, client, db_session):
-        """Dates are formatted as DD.MM.YY per spec 5.3."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
-
-        # Date should appear in DD.MM.YY format
-        assert "15.01.26" in html
-
-
-class TestTimeFormatting:
-    """Verify time formatting matches spec section 5.3."""
-
-    def test_times_use_24hour_format(self, client, db_session):
-        """Times are formatted as HH:MM per spec 5.3."""
-        settings = UserSettingsFactory.build(user_id=1)
-        entry = TimeEntryFactory.build(
-            user_id=1, work_date=date(2026, 1, 15), start_time=time(7, 0), end_time=time(15, 30)
-        )
-        db_session.add(settings)
-        db_session.add(entry)
-        db_session.commit()
-
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def january_thead(january_html):
+    """Table header of the January view."""
+    return html_region(january_html, "thead")
+
+
+@pytest.fixture(scope="module")
+def january_tbody(january_html):
+    """Table body (entry rows and add row) of the January view."""
+    return html_region(january_html, "tbody")
+
+
+@pytest.fixture(scope="module")
+def current_month_tfoot(current_month_html):
+    """Summary footer of the current month view."""
+    return html_region(current_month_html, "tfoot")
+
+
+@pytest.fixture(scope="module")
+def empty_month_html(render_page):
+    """January 2026 view without settings or entries."""
+    return render_page(f"/time-entries?{JANUARY_QUERY}")
+
+
+@pytest.fixture(scope="module")
+def edit_row_source():
+    """Jinja source of the edit row partial, read through the app's template loader."""
+    source, _filename, _uptodate = templates.env.loader.get_source(templates.env, EDIT_ROW_TEMPLATE)
+    return source
+
+
+class TestMonthViewContent:
+    """Verify the monthly view renders the markup required by the spec.
+
+    Each expected substring is its own test case against the cached page, so a
+    failure names the spec requirement without re-rendering per check. Table
+    checks only look at the thead/tbody/tfoot region they concern.
+    """
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            # Spec 5.3: all column headers, including the quick absence buttons column
+            pytest.param(">Tag<", id="5.3-header-tag"),
+            pytest.param(">Ankunft<", id="5.3-header-ankunft"),
+            pytest.param(">Ende<", id="5.3-header-ende"),
+            pytest.param(">Pausen<", id="5.3-header-pausen"),
+            pytest.param(">Arbeitsstunden Real<", id="5.3-header-real"),
+            pytest.param(">Arbeitsstunden Soll<", id="5.3-header-soll"),
+            pytest.param(">+/-<", id="5.3-header-balance"),
+            pytest.param(">Abwesenheit / Bemerkung<", id="5.3-header-bemerkung"),
+            pytest.param(">Abwesenheit<", id="5.3-header-abwesenheit"),
+            # Spec 5.2: dark header row with white text
+            pytest.param('class="bg-neutral text-white"', id="5.2-header-dark-background"),
+        ],
+    )
+    def test_table_header_contains(self, january_thead, needle):
+        """Table header has every column and the dark styling."""
+        assert needle in january_thead
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            # Spec 5.3: light blue 'Arbeitsstunden Real' cells, DD.MM.YY dates, HH:MM times
+            pytest.param("bg-info/10", id="5.3-real-hours-blue"),
+            pytest.param("15.01.26", id="5.3-german-date"),
+            pytest.param("07:00", id="5.3-start-time"),
+            pytest.param("15:30", id="5.3-end-time"),
+            # Spec 6.1-6.2: 'Add Next Day' row with German text and orange tint
+            pytest.param("bg-warning/10", id="6.2-add-row-tint"),
+            pytest.param("Nächsten Tag hinzufügen", id="6.1-add-row-text"),
+            # Quick absence buttons (replace checkboxes) using HTMX PATCH
+            pytest.param('aria-label="Urlaub"', id="absence-button-urlaub"),
+            pytest.param('aria-label="Krank"', id="absence-button-krank"),
+            pytest.param('aria-label="Feiertag"', id="absence-button-feiertag"),
+            pytest.param('aria-label="Gleitzeit"', id="absence-button-gleitzeit"),
+            pytest.param("hx-patch=", id="absence-button-hx-patch"),
+        ],
+    )
+    def test_table_body_contains(self, january_tbody, needle):
+        """Entry row and add row carry the expected formatting and controls."""
+        assert needle in january_tbody
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            # Spec 3.1, 3.3: HTMX month navigation showing German month names
+            pytest.param("Januar", id="3.3-german-month-name"),
+            pytest.param("hx-get=", id="3.1-navigation-hx-get"),
+            pytest.param("hx-target=", id="3.1-navigation-hx-target"),
+        ],
+    )
+    def test_month_navigation_contains(self, empty_month_html, needle):
+        """Month navigation is rendered even for a month without entries."""
+        assert needle in empty_month_html
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            # Spec 4: summary cards with German subtitles (4.3)
+            pytest.param("Monatssaldo", id="4-card-monatssaldo"),
+            pytest.param("Sollstunden", id="4-card-sollstunden"),
+            pytest.param("Aktuelles Zeitkonto", id="4-card-zeitkonto"),
+            pytest.param("Ist-Stunden", id="4.3-subtitle-ist-stunden"),
+            pytest.param("Pro Monat", id="4.3-subtitle-pro-monat"),
+            pytest.param("Überstunden", id="4.3-subtitle-ueberstunden"),
+        ],
+    )
+    def test_current_month_view_contains(self, current_month_html, needle):
+        """Current month view shows summary cards once data exists."""
+        assert needle in current_month_html
+
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            # Spec 7.2-7.3: both footer summary rows, tinted green (7.4)
+            pytest.param("Monatssaldo:", id="7.2-footer-monatssaldo"),
+            pytest.param("Aktuelles Zeitkonto:", id="7.3-footer-zeitkonto"),
+            pytest.param("bg-success", id="7.4-footer-tint"),
+        ],
+    )
+    def test_footer_contains(self, current_month_tfoot, needle):
+        """Footer has both summary rows with green tinting."""
+        assert needle in current_month_tfoot
+
+    def test_balance_column_uses_color_coding(self, january_tbody):
+        """Balance (+/-) column uses green/red color coding per spec 5.6."""
+        assert "text-success" in january_tbody or "text-error" in january_tbody
 
-        # Times should appear in HH:MM format
-        assert "07:00" in html
-        assert "15:30" in html
+    def test_absence_buttons_target_entry(self, january_tbody):
+        """Quick absence buttons PATCH the specific entry they belong to."""
+        assert ENTRY_PATCH_PATTERN.search(january_tbody)
 
 
 class TestEmptyState:
     """Verify empty state display when no entries exist."""
 
-    def test_empty_state_displays_message(self, client, db_session):
+    def test_empty_state_displays_message(self, empty_month_html):
         """Empty state shows German message when no entries exist."""
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
+        html = empty_month_html
 
         # Should show empty state message
         assert "Keine Zeiteinträge" in html or "keine" in html.lower()
 
-    def test_empty_state_shows_table_with_add_button(self, client, db_session):
+    def test_empty_state_shows_table_with_add_button(self, empty_month_html):
         """Empty state shows table structure with add button for HTMX functionality."""
-        response = client.get("/time-entries?month=1&year=2026")
-        html = response.text
+        html = empty_month_html
 
         # Should show empty state message within the table structure
         assert "Keine Zeiteinträge" in html
@@ -362,25 +216,24 @@ class TestEmptyState:
 class TestCopyLastEntryButton:
     """Test copy-last-entry button appears in edit row."""
 
-    def test_copy_button_exists_in_new_row(self, client, db_session):
+    def test_copy_button_uses_clipboard_icon(self, edit_row_source):
+        """Copy Last button draws the clipboard icon from the shared icon macro."""
+        assert 'icon("clipboard"' in edit_row_source
+
+    def test_copy_button_exists_in_new_row(self, client):
         """Copy Last button exists in new entry row."""
         response = client.get("/time-entries/new-row")
         html = response.text
 
         # Should contain Copy Last button with correct title
-        assert "Letzte kopieren" in html
+        assert 'aria-label="Letzte kopieren"' in html
         # Should have onclick handler
-        assert "copyLastEntry" in html
-        # Should use clipboard icon (check for SVG clipboard path)
-        assert 'width="8" height="4" x="8" y="2"' in html  # Clipboard SVG rect
+        assert "copyLastEntry(this)" in html
 
-    def test_copy_button_exists_in_edit_row(self, client, db_session):
+    def test_copy_button_exists_in_edit_row(self, client, make_entry):
         """Copy Last button exists when editing existing entry."""
-        # Create entry to edit
-        entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
-        db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        # Create entry to edit (flushed only; the render just needs its id)
+        entry = make_entry()
 
         response = client.get(f"/time-entries/{entry.id}/edit-row")
         html = response.text
@@ -4,573 +4,367 @@ This module tests the TimeCalculationService which wraps the standalone calculat
 functions from source.database.calculations into a service interface.
 """
 
-from datetime import date, time
+from datetime import date, time, timedelta
 from decimal import Decimal
 
 import pytest
 
 from source.database.enums import AbsenceType
-from source.services.time_calculation import TimeCalculationService
-from tests.factories import TimeEntryFactory, UserSettingsFactory, VacationEntryFactory
+from tests.factories import TimeEntryFactory, VacationEntryFactory, quick_settings, quick_time_entry
+
+# Pure calculations on unsaved factory objects; no database or client
+pytestmark = pytest.mark.unit
+
+# 32h/week part-time standard (6.4h per weekday) used by most tests, and the neutral balance
+WEEKLY_TARGET_HOURS = Decimal("32.00")
+ZERO_HOURS = Decimal("0.00")
+# Actual hours of the default work day: 7:00-15:00 with a 30 min break
+DEFAULT_DAY_HOURS = Decimal("7.50")
+# Dates reused across test bodies; parametrize tables keep their literals, which are built once at import
+WEDNESDAY = date(2026, 1, 14)
+JULY_TRACKING_START = date(2025, 7, 1)
+
+
+@pytest.fixture(scope="module")
+def default_settings():
+    """Unsaved 32-hour settings shared by tests that only read them."""
+    return quick_settings(weekly_target_hours=WEEKLY_TARGET_HOURS)
+
+
+def _worked(work_date: date, start_hour: int, end_hour: int, break_minutes: int):
+    """Build an unsaved entry on work_date working from start_hour to end_hour."""
+    return quick_time_entry(
+        work_date=work_date, start_time=time(start_hour, 0), end_time=time(end_hour, 0), break_minutes=break_minutes
+    )
 
 
 class TestTimeCalculationServiceWrapper:
     """Tests for TimeCalculationService wrapper methods."""
 
-    @pytest.mark.unit
-    def test_actual_hours_delegates_to_calculation(self):
+    def test_actual_hours_delegates_to_calculation(self, calc_service):
         """Service actual_hours returns same result as standalone function."""
         # Create entry with 7:00-15:00 = 8 hours
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),
-            start_time=time(7, 0),
-            end_time=time(15, 0),
-            break_minutes=0,
-        )
-        service = TimeCalculationService()
-        assert service.actual_hours(entry) == Decimal("8.00")
+        entry = _worked(WEDNESDAY, 7, 15, 0)
+        assert calc_service.actual_hours(entry) == Decimal("8.00")
 
-    @pytest.mark.unit
-    def test_target_hours_delegates_to_calculation(self):
+    def test_target_hours_delegates_to_calculation(self, calc_service, default_settings):
         """Service target_hours returns same result as standalone function."""
-        entry = TimeEntryFactory.build(work_date=date(2026, 1, 14))  # Wednesday
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        assert service.target_hours(entry, settings) == Decimal("6.40")
+        entry = quick_time_entry(work_date=WEDNESDAY)
+        assert calc_service.target_hours(entry, default_settings) == Decimal("6.40")
 
-    @pytest.mark.unit
-    def test_daily_balance_delegates_to_calculation(self):
+    def test_daily_balance_delegates_to_calculation(self, calc_service, default_settings):
         """Service daily_balance returns same result as standalone balance function."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),  # Wednesday
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10 hours
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
+        entry = _worked(WEDNESDAY, 7, 17, 0)  # 10 hours
         # 10h actual - 6.4h target = +3.6 balance
-        assert service.daily_balance(entry, settings) == Decimal("3.60")
+        assert calc_service.daily_balance(entry, default_settings) == Decimal("3.60")
 
 
 class TestPeriodBalance:
     """Tests for TimeCalculationService.period_balance method."""
 
-    @pytest.mark.unit
-    def test_period_balance_single_entry(self):
-        """Single entry balance equals daily balance."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),  # Wednesday
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10 hours
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        # 10h - 6.4h = +3.6
-        assert service.period_balance([entry], settings) == Decimal("3.60")
-
-    @pytest.mark.unit
-    def test_period_balance_multiple_entries(self):
-        """Multiple entries sum their balances."""
+    # Entries are (work_date, end_time) pairs worked from 7:00 without a break; 32h/week = 6.4h/day target
+    @pytest.mark.parametrize(
+        ("entries_spec", "settings_overrides", "include_carryover", "expected"),
+        [
+            # 10h - 6.4h = +3.6
+            pytest.param([(date(2026, 1, 14), time(17, 0))], {}, True, Decimal("3.60"), id="single_entry"),
+            # +3.6 + (-2.4) = +1.2
+            pytest.param(
+                [(date(2026, 1, 13), time(17, 0)), (date(2026, 1, 14), time(11, 0))],
+                {},
+                True,
+                Decimal("1.20"),
+                id="multiple_entries",
+            ),
+            # +3.6 + 5.0 = +8.6
+            pytest.param(
+                [(date(2026, 1, 14), time(17, 0))],
+                {"initial_hours_offset": Decimal("5.00")},
+                True,
+                Decimal("8.60"),
+                id="with_initial_offset",
+            ),
+            # Just daily balance, no initial offset
+            pytest.param(
+                [(date(2026, 1, 14), time(17, 0))],
+                {"initial_hours_offset": Decimal("5.00")},
+                False,
+                Decimal("3.60"),
+                id="without_initial_offset",
+            ),
+            pytest.param([], {"initial_hours_offset": Decimal("2.50")}, False, Decimal("0.00"), id="empty_entries"),
+            pytest.param(
+                [], {"initial_hours_offset": Decimal("2.50")}, True, Decimal("2.50"), id="empty_entries_with_offset"
+            ),
+            # Jan 6 is before tracking start and ignored: -2.4 (Jan 12) + 1.6 (Jan 14) = -0.8
+            pytest.param(
+                [
+                    (date(2026, 1, 6), time(17, 0)),
+                    (date(2026, 1, 12), time(11, 0)),
+                    (date(2026, 1, 14), time(15, 0)),
+                ],
+                {"tracking_start_date": date(2026, 1, 12)},
+                False,
+                Decimal("-0.80"),
+                id="ignores_entries_before_tracking_start",
+            ),
+            # No tracking start filter, both entries count: 3.6 + (-2.4) = 1.2
+            pytest.param(
+                [(date(2026, 1, 5), time(17, 0)), (date(2026, 1, 15), time(11, 0))],
+                {"tracking_start_date": None},
+                False,
+                Decimal("1.20"),
+                id="no_tracking_start_includes_all",
+            ),
+            # Only the entry after tracking start: 1.6 + initial_offset: 10.0 = 11.6
+            pytest.param(
+                [(date(2026, 1, 5), time(17, 0)), (date(2026, 1, 12), time(15, 0))],
+                {"tracking_start_date": date(2026, 1, 10), "initial_hours_offset": Decimal("10.00")},
+                True,
+                Decimal("11.60"),
+                id="tracking_start_and_initial_offset_combined",
+            ),
+        ],
+    )
+    def test_period_balance(self, calc_service, entries_spec, settings_overrides, include_carryover, expected):
+        """Period balance sums daily balances after tracking start, plus the initial offset on request."""
         entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),  # Tuesday
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # Wednesday
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
+            quick_time_entry(work_date=work_date, start_time=time(7, 0), end_time=end_time, break_minutes=0)
+            for work_date, end_time in entries_spec
         ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        # +3.6 + (-2.4) = +1.2
-        assert service.period_balance(entries, settings) == Decimal("1.20")
-
-    @pytest.mark.unit
-    def test_period_balance_with_initial_offset(self):
-        """Include initial_hours_offset from user settings when flag is True."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10h = +3.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("5.00"),  # Initial offset from tracking start
-        )
-        service = TimeCalculationService()
-        # +3.6 + 5.0 = +8.6
-        assert service.period_balance([entry], settings, include_carryover=True) == Decimal("8.60")
-
-    @pytest.mark.unit
-    def test_period_balance_without_initial_offset(self):
-        """Exclude initial offset when flag is False."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10h = +3.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("5.00"),
-        )
-        service = TimeCalculationService()
-        # Just daily balance, no initial offset
-        assert service.period_balance([entry], settings, include_carryover=False) == Decimal("3.60")
-
-    @pytest.mark.unit
-    def test_period_balance_empty_entries(self):
-        """Empty entry list returns 0 (or initial offset if included)."""
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("2.50"),
-        )
-        service = TimeCalculationService()
-        assert service.period_balance([], settings, include_carryover=False) == Decimal("0.00")
-        assert service.period_balance([], settings, include_carryover=True) == Decimal("2.50")
-
-    @pytest.mark.unit
-    def test_period_balance_ignores_entries_before_tracking_start(self):
-        """Entries before tracking_start_date should be ignored in balance calculation."""
-        # Use weekdays only (Jan 6=Tue, Jan 12=Mon, Jan 14=Wed)
-        tracking_start = date(2026, 1, 12)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 6),  # Tuesday - Before tracking start
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6 (should be ignored)
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # Monday - On tracking start date
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h, target 6.4h = -2.4
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # Wednesday - After tracking start
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h, target 6.4h = +1.6
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=tracking_start,
-        )
-        service = TimeCalculationService()
-        # Only entries on/after 2026-01-12 should count: -2.4 + 1.6 = -0.8
-        assert service.period_balance(entries, settings, include_carryover=False) == Decimal("-0.80")
-
-    @pytest.mark.unit
-    def test_period_balance_includes_initial_offset(self):
-        """Initial hours offset should be added to period balance."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10h = +3.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("15.50"),
-        )
-        service = TimeCalculationService()
-        # Period balance: 3.6 + initial_offset: 15.5 = 19.1
-        assert service.period_balance([entry], settings, include_carryover=True) == Decimal("19.10")
+        settings = quick_settings(weekly_target_hours=WEEKLY_TARGET_HOURS, **settings_overrides)
+
+        balance = calc_service.period_balance(entries, settings, include_carryover=include_carryover)
+
+        assert balance == expected
+
+
+# Monday Jan 12, 2026 to Sunday Jan 18, 2026
+WEEK_START = date(2026, 1, 12)
 
-    @pytest.mark.unit
-    def test_period_balance_with_no_tracking_start_includes_all(self):
-        """When tracking_start_date is None, all entries should be included."""
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 5),
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 15),
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=None,  # No tracking start filter
-        )
-        service = TimeCalculationService()
-        # Both entries should count: 3.6 + (-2.4) = 1.2
-        assert service.period_balance(entries, settings, include_carryover=False) == Decimal("1.20")
-
-    @pytest.mark.unit
-    def test_period_balance_tracking_start_and_initial_offset_combined(self):
-        """Test combination of tracking_start_date and initial_hours_offset."""
-        tracking_start = date(2026, 1, 10)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 5),  # Before tracking start - ignored
-                start_time=time(7, 0),
-                end_time=time(17, 0),
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # After tracking start - counted
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=tracking_start,
-            initial_hours_offset=Decimal("10.00"),
-        )
-        service = TimeCalculationService()
-        # Only entry after tracking start: 1.6 + initial_offset: 10.0 = 11.6
-        assert service.period_balance(entries, settings, include_carryover=True) == Decimal("11.60")
+
+def _week_day(day_offset: int, start_hour: int, end_hour: int, break_minutes: int):
+    """Build an unsaved entry on WEEK_START + day_offset working full hours."""
+    return _worked(WEEK_START + timedelta(days=day_offset), start_hour, end_hour, break_minutes)
+
+
+@pytest.fixture(scope="module")
+def vacation_week_summary(calc_service, default_settings):
+    """Weekly summary with a vacation Monday and a default work day on Tuesday."""
+    entries = [VacationEntryFactory.build(work_date=WEEK_START), _week_day(1, 7, 15, 30)]
+    return calc_service.weekly_summary(entries, default_settings, WEEK_START)
 
 
 class TestWeeklySummary:
     """Tests for TimeCalculationService.weekly_summary method."""
 
-    @pytest.mark.unit
-    def test_weekly_summary_full_week(self):
+    def test_weekly_summary_full_week(self, calc_service, default_settings):
         """Generate summary for a full work week with entries."""
-        # Monday Jan 12, 2026 to Sunday Jan 18, 2026
-        week_start = date(2026, 1, 12)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12), start_time=time(7, 0), end_time=time(15, 0), break_minutes=30  # Monday
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13), start_time=time(7, 0), end_time=time(15, 0), break_minutes=30  # Tuesday
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14), start_time=time(7, 0), end_time=time(15, 0), break_minutes=30  # Wednesday
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
+        # Monday to Wednesday, 7:00-15:00 with 30 min break
+        entries = TimeEntryFactory.build_days(
+            WEEK_START, 3, start_time=time(7, 0), end_time=time(15, 0), break_minutes=30
+        )
 
-        summary = service.weekly_summary(entries, settings, week_start)
+        summary = calc_service.weekly_summary(entries, default_settings, WEEK_START)
 
-        assert summary.week_start == date(2026, 1, 12)
+        assert summary.week_start == WEEK_START
         assert summary.week_end == date(2026, 1, 18)
         assert len(summary.days) == 7  # All 7 days
         assert summary.total_actual == Decimal("22.50")  # 7.5h * 3 days
 
-    @pytest.mark.unit
-    def test_weekly_summary_days_without_entries(self):
+    def test_weekly_summary_days_without_entries(self, calc_service, default_settings):
         """Days without entries should have has_entry=False, 0 actual hours."""
-        week_start = date(2026, 1, 12)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # Only Monday
-                start_time=time(7, 0),
-                end_time=time(15, 0),
-                break_minutes=30,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
+        entries = [_week_day(0, 7, 15, 30)]  # Only Monday
 
-        summary = service.weekly_summary(entries, settings, week_start)
+        summary = calc_service.weekly_summary(entries, default_settings, WEEK_START)
 
         # Monday has entry
         assert summary.days[0].has_entry is True
-        assert summary.days[0].actual_hours == Decimal("7.50")
+        assert summary.days[0].actual_hours == DEFAULT_DAY_HOURS
         # Tuesday has no entry
         assert summary.days[1].has_entry is False
-        assert summary.days[1].actual_hours == Decimal("0.00")
+        assert summary.days[1].actual_hours == ZERO_HOURS
 
-    @pytest.mark.unit
-    def test_weekly_summary_with_vacation(self):
+    def test_weekly_summary_with_vacation(self, vacation_week_summary):
         """Vacation days should have 0 actual, 0 target, and 0 balance."""
-        week_start = date(2026, 1, 12)
-        entries = [
-            VacationEntryFactory.build(work_date=date(2026, 1, 12)),  # Monday vacation
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),  # Tuesday work
-                start_time=time(7, 0),
-                end_time=time(15, 0),
-                break_minutes=30,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-
-        summary = service.weekly_summary(entries, settings, week_start)
+        summary = vacation_week_summary
 
         # Monday vacation - balance 0
         assert summary.days[0].absence_type == AbsenceType.VACATION
-        assert summary.days[0].actual_hours == Decimal("0.00")
-        assert summary.days[0].target_hours == Decimal("0.00")
-        assert summary.days[0].balance == Decimal("0.00")
+        assert summary.days[0].actual_hours == ZERO_HOURS
+        assert summary.days[0].target_hours == ZERO_HOURS
+        assert summary.days[0].balance == ZERO_HOURS
         # Tuesday work - balance = 7.5 - 6.4 = 1.1
         assert summary.days[1].balance == Decimal("1.10")
 
-    @pytest.mark.unit
-    def test_weekly_summary_vacation_reduces_total_target(self):
+    def test_weekly_summary_vacation_reduces_total_target(self, vacation_week_summary):
         """Vacation days are excluded from weekly target totals."""
-        week_start = date(2026, 1, 12)
-        entries = [
-            VacationEntryFactory.build(work_date=date(2026, 1, 12)),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),
-                start_time=time(7, 0),
-                end_time=time(15, 0),
-                break_minutes=30,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-
-        summary = service.weekly_summary(entries, settings, week_start)
+        assert vacation_week_summary.total_actual == DEFAULT_DAY_HOURS
+        assert vacation_week_summary.total_target == Decimal("25.60")
 
-        assert summary.total_actual == Decimal("7.50")
-        assert summary.total_target == Decimal("25.60")
-
-    @pytest.mark.unit
-    def test_weekly_summary_totals_calculation(self):
+    def test_weekly_summary_totals_calculation(self, calc_service, default_settings):
         """Verify totals are calculated correctly."""
-        week_start = date(2026, 1, 12)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12), start_time=time(7, 0), end_time=time(17, 0), break_minutes=0  # 10h
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13), start_time=time(7, 0), end_time=time(11, 0), break_minutes=0  # 4h
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
+        entries = [_week_day(0, 7, 17, 0), _week_day(1, 7, 11, 0)]  # 10h Monday, 4h Tuesday
 
-        summary = service.weekly_summary(entries, settings, week_start)
+        summary = calc_service.weekly_summary(entries, default_settings, WEEK_START)
 
         assert summary.total_actual == Decimal("14.00")  # 10 + 4
-        assert summary.total_target == Decimal("32.00")  # 6.4 * 5 weekdays
+        assert summary.total_target == WEEKLY_TARGET_HOURS  # 6.4 * 5 weekdays
         # Balance: (10-6.4) + (4-6.4) + (-6.4*3 for missing days) = 3.6 - 2.4 - 19.2 = -18.0
         assert summary.total_balance == Decimal("-18.00")
 
-    @pytest.mark.unit
-    def test_weekly_summary_missing_day_ignores_vacation_holiday_policy(self):
+    def test_weekly_summary_missing_day_ignores_vacation_holiday_policy(self, calc_service):
         """Vacation policy holidays do not change time-account weekly targets."""
         week_start = date(2026, 6, 1)
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("40.00"), holiday_state="NW")
-        service = TimeCalculationService()
+        settings = quick_settings(weekly_target_hours=Decimal("40.00"), holiday_state="NW")
 
-        summary = service.weekly_summary([], settings, week_start)
+        summary = calc_service.weekly_summary([], settings, week_start)
 
         assert summary.days[3].date == date(2026, 6, 4)
         assert summary.days[3].target_hours == Decimal("8.00")
         assert summary.total_target == Decimal("40.00")
 
 
+# Recurring company closures configured for the vacation policy only
+CHRISTMAS_EVE_CLOSURE = {
+    "day": 24,
+    "month": 12,
+    "name": "Heiligabend",
+    "recurring": True,
+    "enabled": True,
+    "counts_as_vacation": False,
+}
+NEW_YEARS_EVE_CLOSURE = {**CHRISTMAS_EVE_CLOSURE, "day": 31, "name": "Silvester"}
+
+
+@pytest.fixture(scope="module")
+def january_summary(calc_service, default_settings):
+    """Monthly summary for January 2026 with a 7:00-15:00 work day in each of its first two weeks."""
+    entries = [
+        quick_time_entry(work_date=date(2026, 1, 5), start_time=time(7, 0), end_time=time(15, 0)),  # Week 1
+        quick_time_entry(work_date=date(2026, 1, 12), start_time=time(7, 0), end_time=time(15, 0)),  # Week 2
+    ]
+    return calc_service.monthly_summary(entries, default_settings, 2026, 1)
+
+
+@pytest.fixture(scope="module")
+def first_tracked_january_summary(calc_service):
+    """January 2026 summary as the first tracked month: tracking starts Jan 10 with a 15.50h offset."""
+    entries = [
+        _worked(date(2026, 1, 12), 7, 15, 0),  # After tracking start; 8h = +1.6
+    ]
+    settings = quick_settings(
+        weekly_target_hours=WEEKLY_TARGET_HOURS,
+        tracking_start_date=date(2026, 1, 10),
+        initial_hours_offset=Decimal("15.50"),
+    )
+    return calc_service.monthly_summary(entries, settings, 2026, 1)
+
+
 class TestMonthlySummary:
     """Tests for TimeCalculationService.monthly_summary method."""
 
-    @pytest.mark.unit
-    def test_monthly_summary_basic(self):
+    @pytest.mark.parametrize(("field", "expected"), [("year", 2026), ("month", 1)])
+    def test_monthly_summary_basic(self, january_summary, field, expected):
         """Generate monthly summary for January 2026."""
+        assert getattr(january_summary, field) == expected
+
+    def test_monthly_summary_covers_all_weeks(self, january_summary):
+        """Summary includes every week that overlaps the month."""
+        assert len(january_summary.weeks) >= 4  # January 2026 has 5 weeks partially
+
+    def test_monthly_summary_places_neighbouring_month_entries_in_edge_weeks(self, calc_service, default_settings):
+        """Entries from overlapping weeks of adjacent months show in those weeks but not in month totals."""
         entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 5), start_time=time(7, 0), end_time=time(15, 0), break_minutes=30  # Monday
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 6), start_time=time(7, 0), end_time=time(15, 0), break_minutes=30  # Tuesday
-            ),
+            quick_time_entry(work_date=date(2025, 12, 29)),  # Monday of the week containing Jan 1
+            quick_time_entry(work_date=WEDNESDAY),
+            quick_time_entry(work_date=date(2026, 2, 1)),  # Sunday closing the last January week
+            quick_time_entry(work_date=date(2026, 2, 2)),  # Outside every January week
         ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
 
-        summary = service.monthly_summary(entries, settings, 2026, 1)
+        summary = calc_service.monthly_summary(entries, default_settings, 2026, 1)
 
-        assert summary.year == 2026
-        assert summary.month == 1
-        assert len(summary.weeks) >= 4  # January 2026 has 5 weeks partially
+        assert summary.weeks[0].days[0].has_entry is True
+        assert summary.weeks[-1].days[-1].has_entry is True
+        assert sum(day.has_entry for week in summary.weeks for day in week.days) == 3
+        assert summary.total_actual == DEFAULT_DAY_HOURS  # Only Jan 14 counts
 
-    @pytest.mark.unit
-    def test_monthly_summary_vacation_reduces_total_target(self):
+    def test_monthly_summary_vacation_reduces_total_target(self, calc_service, default_settings):
         """Vacation days are excluded from monthly target totals."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 1, 5)),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 6),
-                start_time=time(7, 0),
-                end_time=time(15, 0),
-                break_minutes=30,
-            ),
+            _worked(date(2026, 1, 6), 7, 15, 30),
         ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
 
-        summary = service.monthly_summary(entries, settings, 2026, 1)
+        summary = calc_service.monthly_summary(entries, default_settings, 2026, 1)
 
-        assert summary.total_actual == Decimal("7.50")
+        assert summary.total_actual == DEFAULT_DAY_HOURS
         assert summary.total_target == Decimal("134.40")
 
-    @pytest.mark.unit
-    def test_monthly_summary_ignores_vacation_company_closures_for_time_balance(self):
-        """Vacation policy company closures do not change monthly time targets."""
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("40.00"),
-            schedule_json={
-                "company_closures": {
-                    "12-24": {
-                        "day": 24,
-                        "month": 12,
-                        "name": "Heiligabend",
-                        "recurring": True,
-                        "enabled": True,
-                        "counts_as_vacation": False,
-                    },
-                    "12-31": {
-                        "day": 31,
-                        "month": 12,
-                        "name": "Silvester",
-                        "recurring": True,
-                        "enabled": True,
-                        "counts_as_vacation": False,
+    @pytest.mark.parametrize(
+        ("settings_overrides", "year", "month", "expected_target"),
+        [
+            pytest.param(
+                {
+                    "weekly_target_hours": Decimal("40.00"),
+                    "schedule_json": {
+                        "company_closures": {"12-24": CHRISTMAS_EVE_CLOSURE, "12-31": NEW_YEARS_EVE_CLOSURE}
                     },
-                }
-            },
-        )
-        service = TimeCalculationService()
-
-        summary = service.monthly_summary([], settings, 2026, 12)
-
-        assert summary.total_target == Decimal("184.00")
-
-    @pytest.mark.unit
-    def test_monthly_summary_keeps_time_balance_independent_from_vacation_holiday_policy(self):
-        """Vacation policy holidays must not rewrite historical time-account balances."""
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("30.00"), holiday_state="NW")
-        service = TimeCalculationService()
-
-        summary = service.monthly_summary([], settings, 2026, 6)
-
-        assert summary.total_target == Decimal("132.00")
-        assert summary.period_balance == Decimal("-132.00")
-
-    @pytest.mark.unit
-    def test_monthly_summary_totals(self):
+                },
+                2026,
+                12,
+                Decimal("184.00"),
+                id="company-closures",
+            ),
+            pytest.param(
+                {"weekly_target_hours": Decimal("30.00"), "holiday_state": "NW"},
+                2026,
+                6,
+                Decimal("132.00"),
+                id="public-holidays",
+            ),
+        ],
+    )
+    def test_monthly_summary_target_ignores_vacation_policy(
+        self, calc_service, settings_overrides, year, month, expected_target
+    ):
+        """Vacation policy closures and holidays do not change monthly time targets or balances."""
+        summary = calc_service.monthly_summary([], quick_settings(**settings_overrides), year, month)
+
+        assert summary.total_target == expected_target
+        assert summary.period_balance == -expected_target
+
+    def test_monthly_summary_totals(self, january_summary):
         """Verify monthly totals are sum of weekly totals."""
-        # Create entries for two different weeks
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 5),  # Week 1 Monday
-                start_time=time(7, 0),
-                end_time=time(15, 0),
-                break_minutes=30,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # Week 2 Monday
-                start_time=time(7, 0),
-                end_time=time(15, 0),
-                break_minutes=30,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-
-        summary = service.monthly_summary(entries, settings, 2026, 1)
-
         # total_actual should be sum of all weeks' total_actual
-        weeks_total_actual = sum(w.total_actual for w in summary.weeks)
-        assert summary.total_actual == weeks_total_actual
+        weeks_total_actual = sum(w.total_actual for w in january_summary.weeks)
+        assert january_summary.total_actual == weeks_total_actual
 
-    @pytest.mark.unit
-    def test_monthly_summary_uses_initial_offset_as_carryover_for_first_month(self):
+    def test_monthly_summary_uses_initial_offset_as_carryover_for_first_month(self, first_tracked_january_summary):
         """For the first tracked month, initial_hours_offset should be used as carryover_in."""
-        tracking_start = date(2026, 1, 10)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # First entry in tracked period
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=tracking_start,
-            initial_hours_offset=Decimal("20.00"),
-        )
-        service = TimeCalculationService()
-
-        summary = service.monthly_summary(entries, settings, 2026, 1)
-
         # For January 2026 (first month with tracking_start_date), use initial_hours_offset
-        assert summary.carryover_in == Decimal("20.00")
+        assert first_tracked_january_summary.carryover_in == Decimal("15.50")
 
-    @pytest.mark.unit
-    def test_monthly_summary_carryover_out_includes_initial_offset(self):
+    def test_monthly_summary_carryover_out_includes_initial_offset(self, first_tracked_january_summary):
         """Carryover out should equal initial_offset + period_balance for first tracked month."""
-        tracking_start = date(2026, 1, 10)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # After tracking start
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=tracking_start,
-            initial_hours_offset=Decimal("15.50"),
-        )
-        service = TimeCalculationService()
-
-        summary = service.monthly_summary(entries, settings, 2026, 1)
-
-        # carryover_in = 15.50 (initial_offset)
-        assert summary.carryover_in == Decimal("15.50")
-        # carryover_out = carryover_in + period_balance
+        summary = first_tracked_january_summary
         assert summary.carryover_out == summary.carryover_in + summary.period_balance
 
-    @pytest.mark.unit
-    def test_monthly_summary_respects_tracking_start_date(self):
+    def test_monthly_summary_respects_tracking_start_date(self, calc_service):
         """Monthly summary should filter entries based on tracking_start_date."""
         tracking_start = date(2026, 1, 15)
         entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 5),  # Before tracking start - ignored
-                start_time=time(7, 0),
-                end_time=time(17, 0),
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 15),  # On tracking start - counted
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 20),  # After tracking start - counted
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
+            _worked(date(2026, 1, 5), 7, 17, 0),  # Before tracking start - ignored
+            _worked(date(2026, 1, 15), 7, 15, 0),  # On tracking start - counted; 8h = +1.6
+            _worked(date(2026, 1, 20), 7, 11, 0),  # After tracking start - counted; 4h = -2.4
         ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
+        settings = quick_settings(
+            weekly_target_hours=WEEKLY_TARGET_HOURS,
             tracking_start_date=tracking_start,
             initial_hours_offset=Decimal("5.00"),
         )
-        service = TimeCalculationService()
 
-        summary = service.monthly_summary(entries, settings, 2026, 1)
+        summary = calc_service.monthly_summary(entries, settings, 2026, 1)
 
         # Only entries on/after 2026-01-15 should be in totals
         # The actual calculation will depend on how weekly_summary filters, but period_balance
@@ -581,311 +375,194 @@ class TestMonthlySummary:
 class TestAllTimeBalance:
     """Tests for TimeCalculationService.all_time_balance method."""
 
-    @pytest.mark.unit
-    def test_all_time_balance_single_entry_no_offset(self):
-        """Single entry with no offset returns daily balance."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),  # Wednesday
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10 hours
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        # 10h - 6.4h = +3.6
-        assert service.all_time_balance([entry], settings) == Decimal("3.60")
-
-    @pytest.mark.unit
-    def test_all_time_balance_multiple_entries_sum(self):
-        """Multiple entries sum their daily balances."""
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),  # Tuesday
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # Wednesday
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 15),  # Thursday
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        # +3.6 + (-2.4) + 1.6 = +2.8
-        assert service.all_time_balance(entries, settings) == Decimal("2.80")
-
-    @pytest.mark.unit
-    def test_all_time_balance_with_initial_hours_offset(self):
-        """Initial hours offset is added to sum of balances."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),  # Wednesday
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10h = +3.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("15.50"),
-        )
-        service = TimeCalculationService()
-        # Balance: 3.6 + initial_offset: 15.5 = 19.1
-        assert service.all_time_balance([entry], settings) == Decimal("19.10")
-
-    @pytest.mark.unit
-    def test_all_time_balance_respects_tracking_start_date(self):
-        """Entries before tracking_start_date are ignored."""
-        tracking_start = date(2026, 1, 12)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 6),  # Tuesday - Before tracking start
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6 (should be ignored)
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # Monday - On tracking start date
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # Wednesday - After tracking start
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=tracking_start,
-        )
-        service = TimeCalculationService()
-        # Only entries on/after 2026-01-12: -2.4 + 1.6 = -0.8
-        assert service.all_time_balance(entries, settings) == Decimal("-0.80")
-
-    @pytest.mark.unit
-    def test_all_time_balance_with_target_date_cutoff(self):
-        """Only entries up to and including target_date are counted."""
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),  # Tuesday
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # Wednesday
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 15),  # Thursday
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6 (should be ignored)
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        # Only entries up to 2026-01-14: +3.6 + (-2.4) = +1.2
-        assert service.all_time_balance(entries, settings, target_date=date(2026, 1, 14)) == Decimal("1.20")
-
-    @pytest.mark.unit
-    def test_all_time_balance_target_date_none_includes_all(self):
-        """When target_date is None, all entries are included."""
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),  # Tuesday
-                start_time=time(7, 0),
-                end_time=time(17, 0),  # 10h = +3.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 20),  # Tuesday (next week)
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        # All entries: +3.6 + (-2.4) = +1.2
-        assert service.all_time_balance(entries, settings, target_date=None) == Decimal("1.20")
-
-    @pytest.mark.unit
-    def test_all_time_balance_empty_entries_with_offset(self):
-        """Empty entries list with offset returns offset only."""
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("10.00"),
-        )
-        service = TimeCalculationService()
-        # No entries, just initial_offset
-        assert service.all_time_balance([], settings) == Decimal("10.00")
-
-    @pytest.mark.unit
-    def test_all_time_balance_empty_entries_no_offset(self):
-        """Empty entries list with no offset returns 0."""
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        assert service.all_time_balance([], settings) == Decimal("0.00")
-
-    @pytest.mark.unit
-    def test_all_time_balance_target_date_before_all_entries(self):
-        """Target date before all entries returns just initial_offset (or 0)."""
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),  # Tuesday
-                start_time=time(7, 0),
-                end_time=time(17, 0),
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # Wednesday
-                start_time=time(7, 0),
-                end_time=time(11, 0),
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("5.00"),
-        )
-        service = TimeCalculationService()
-        # target_date before all entries, no entries counted
-        assert service.all_time_balance(entries, settings, target_date=date(2026, 1, 10)) == Decimal("5.00")
-
-    @pytest.mark.unit
-    def test_all_time_balance_combination_tracking_start_target_date_offset(self):
-        """Test combination of tracking_start_date, target_date, and initial_offset."""
-        tracking_start = date(2026, 1, 10)
+    # Entries are (work_date, end_time) pairs worked from 7:00 without a break; 32h/week = 6.4h/day target
+    @pytest.mark.parametrize(
+        ("entries_spec", "settings_overrides", "target_date", "expected"),
+        [
+            # 10h - 6.4h = +3.6
+            pytest.param([(date(2026, 1, 14), time(17, 0))], {}, None, Decimal("3.60"), id="single_entry_no_offset"),
+            # +3.6 + (-2.4) + 1.6 = +2.8
+            pytest.param(
+                [(date(2026, 1, 13), time(17, 0)), (date(2026, 1, 14), time(11, 0)), (date(2026, 1, 15), time(15, 0))],
+                {},
+                None,
+                Decimal("2.80"),
+                id="multiple_entries_sum",
+            ),
+            # 3.6 + initial_offset: 15.5 = 19.1
+            pytest.param(
+                [(date(2026, 1, 14), time(17, 0))],
+                {"initial_hours_offset": Decimal("15.50")},
+                None,
+                Decimal("19.10"),
+                id="with_initial_hours_offset",
+            ),
+            # Jan 6 is before tracking start and ignored: -2.4 (Jan 12) + 1.6 (Jan 14) = -0.8
+            pytest.param(
+                [(date(2026, 1, 6), time(17, 0)), (date(2026, 1, 12), time(11, 0)), (date(2026, 1, 14), time(15, 0))],
+                {"tracking_start_date": date(2026, 1, 12)},
+                None,
+                Decimal("-0.80"),
+                id="respects_tracking_start_date",
+            ),
+            # Jan 15 is after target_date and ignored: +3.6 + (-2.4) = +1.2
+            pytest.param(
+                [(date(2026, 1, 13), time(17, 0)), (date(2026, 1, 14), time(11, 0)), (date(2026, 1, 15), time(15, 0))],
+                {},
+                date(2026, 1, 14),
+                Decimal("1.20"),
+                id="target_date_cutoff",
+            ),
+            # No target_date, both weeks count: +3.6 + (-2.4) = +1.2
+            pytest.param(
+                [(date(2026, 1, 13), time(17, 0)), (date(2026, 1, 20), time(11, 0))],
+                {},
+                None,
+                Decimal("1.20"),
+                id="target_date_none_includes_all",
+            ),
+            pytest.param(
+                [], {"initial_hours_offset": Decimal("10.00")}, None, Decimal("10.00"), id="empty_entries_with_offset"
+            ),
+            pytest.param([], {}, None, Decimal("0.00"), id="empty_entries_no_offset"),
+            # target_date before all entries: just the initial offset
+            pytest.param(
+                [(date(2026, 1, 13), time(17, 0)), (date(2026, 1, 14), time(11, 0))],
+                {"initial_hours_offset": Decimal("5.00")},
+                date(2026, 1, 10),
+                Decimal("5.00"),
+                id="target_date_before_all_entries",
+            ),
+            # Jan 5 before tracking start, Jan 20 after target_date: 1.6 + (-2.4) + 12.5 = 11.7
+            pytest.param(
+                [
+                    (date(2026, 1, 5), time(17, 0)),
+                    (date(2026, 1, 12), time(15, 0)),
+                    (date(2026, 1, 14), time(11, 0)),
+                    (date(2026, 1, 20), time(17, 0)),
+                ],
+                {"tracking_start_date": date(2026, 1, 10), "initial_hours_offset": Decimal("12.50")},
+                date(2026, 1, 15),
+                Decimal("11.70"),
+                id="tracking_start_target_date_and_offset",
+            ),
+            # 3.6 + (-8.0) = -4.4
+            pytest.param(
+                [(date(2026, 1, 14), time(17, 0))],
+                {"initial_hours_offset": Decimal("-8.00")},
+                None,
+                Decimal("-4.40"),
+                id="negative_offset",
+            ),
+            # Weekend work has 0h target: 8.0 (Saturday) + 4.0 (Sunday) = +12.0
+            pytest.param(
+                [(date(2026, 1, 10), time(15, 0)), (date(2026, 1, 11), time(11, 0))],
+                {},
+                None,
+                Decimal("12.00"),
+                id="weekend_entries",
+            ),
+            # Jan 13 is after target_date; the entry on the tracking start itself counts: +1.6
+            pytest.param(
+                [(date(2026, 1, 12), time(15, 0)), (date(2026, 1, 13), time(17, 0))],
+                {"tracking_start_date": date(2026, 1, 12)},
+                date(2026, 1, 12),
+                Decimal("1.60"),
+                id="target_date_equals_tracking_start",
+            ),
+        ],
+    )
+    def test_all_time_balance(self, calc_service, entries_spec, settings_overrides, target_date, expected):
+        """All-time balance sums daily balances between tracking start and target_date, plus the initial offset."""
         entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 5),  # Before tracking start - ignored
-                start_time=time(7, 0),
-                end_time=time(17, 0),
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # After tracking start - counted
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # After tracking start - counted
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h = -2.4
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 20),  # After target_date - ignored
-                start_time=time(7, 0),
-                end_time=time(17, 0),
-                break_minutes=0,
-            ),
+            quick_time_entry(work_date=work_date, start_time=time(7, 0), end_time=end_time, break_minutes=0)
+            for work_date, end_time in entries_spec
         ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=tracking_start,
-            initial_hours_offset=Decimal("12.50"),
-        )
-        service = TimeCalculationService()
-        # Only entries between tracking_start and target_date: 1.6 + (-2.4) = -0.8
-        # Plus initial_offset: -0.8 + 12.5 = 11.7
-        assert service.all_time_balance(entries, settings, target_date=date(2026, 1, 15)) == Decimal("11.70")
-
-    @pytest.mark.unit
-    def test_all_time_balance_negative_offset(self):
-        """Initial offset can be negative."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2026, 1, 14),  # Wednesday
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10h = +3.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            initial_hours_offset=Decimal("-8.00"),
-        )
-        service = TimeCalculationService()
-        # Balance: 3.6 + (-8.0) = -4.4
-        assert service.all_time_balance([entry], settings) == Decimal("-4.40")
+        settings = quick_settings(weekly_target_hours=WEEKLY_TARGET_HOURS, **settings_overrides)
 
-    @pytest.mark.unit
-    def test_all_time_balance_weekend_entries(self):
-        """Weekend entries count with 0 target hours."""
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 10),  # Saturday
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h, target 0h = +8.0
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 11),  # Sunday
-                start_time=time(7, 0),
-                end_time=time(11, 0),  # 4h, target 0h = +4.0
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
-        # Weekend work: 8.0 + 4.0 = +12.0
-        assert service.all_time_balance(entries, settings) == Decimal("12.00")
+        assert calc_service.all_time_balance(entries, settings, target_date=target_date) == expected
 
-    @pytest.mark.unit
-    def test_all_time_balance_with_vacation_entries(self):
+    def test_all_time_balance_with_vacation_entries(self, calc_service, default_settings):
         """Vacation entries have 0 balance."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 1, 13)),  # Tuesday vacation
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),  # Wednesday work
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
+            _worked(WEDNESDAY, 7, 15, 0),  # Work; 8h = +1.6
         ]
-        settings = UserSettingsFactory.build(weekly_target_hours=Decimal("32.00"))
-        service = TimeCalculationService()
         # Vacation balance = 0, work balance = 1.6
-        assert service.all_time_balance(entries, settings) == Decimal("1.60")
+        assert calc_service.all_time_balance(entries, default_settings) == Decimal("1.60")
+
+
+@pytest.fixture(scope="module")
+def july_entry():
+    """Monday 2025-07-07 worked 7:00-17:00 (10h = +3.6); the services only read it."""
+    return _worked(date(2025, 7, 7), 7, 17, 0)
+
+
+@pytest.fixture(scope="module")
+def august_entry():
+    """Monday 2025-08-04 worked 7:00-15:00 (8h = +1.6); the services only read it."""
+    return _worked(date(2025, 8, 4), 7, 15, 0)
+
+
+@pytest.fixture(scope="module")
+def july_august_entries(july_entry, august_entry):
+    """One Monday in July (10h = +3.6) and one in August (8h = +1.6) 2025."""
+    return [july_entry, august_entry]
 
-    @pytest.mark.unit
-    def test_all_time_balance_target_date_equals_tracking_start(self):
-        """Target date equal to tracking start includes entries on that date."""
-        tracking_start = date(2026, 1, 12)
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 12),  # On both tracking start AND target date
-                start_time=time(7, 0),
-                end_time=time(15, 0),  # 8h = +1.6
-                break_minutes=0,
-            ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),  # After target date - ignored
-                start_time=time(7, 0),
-                end_time=time(17, 0),
-                break_minutes=0,
-            ),
-        ]
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=tracking_start,
-        )
-        service = TimeCalculationService()
-        # Only entry on 2026-01-12: +1.6
-        assert service.all_time_balance(entries, settings, target_date=tracking_start) == Decimal("1.60")
+
+@pytest.fixture(scope="module")
+def july_tracking_settings():
+    """32-hour settings tracked from 2025-07-01 with a 5h initial offset."""
+    return quick_settings(
+        weekly_target_hours=WEEKLY_TARGET_HOURS,
+        tracking_start_date=JULY_TRACKING_START,
+        initial_hours_offset=Decimal("5.00"),
+    )
+
+
+# carryover_in for August = July's balance (3.6) + initial_offset (5.0)
+AUGUST_CARRYOVER_IN = Decimal("8.60")
+
+
+@pytest.fixture(scope="module")
+def august_summary(calc_service, july_august_entries, july_tracking_settings):
+    """August 2025 summary computed with the July history passed in."""
+    return calc_service.monthly_summary(july_august_entries, july_tracking_settings, 2025, 8)
+
+
+@pytest.fixture(scope="module")
+def second_half_2025_entries_by_month():
+    """An entry on every weekday from July to December 2025, cycling 7h/8h/9h, keyed by month.
+
+    With no working day left empty, chaining carryover_out month to month matches
+    the balance summed from history; period_balance counts empty working days as
+    missing target hours, which all_time_balance does not.
+    """
+    entries_by_month: dict[int, list] = {month: [] for month in range(7, 13)}
+    day = JULY_TRACKING_START
+    while day.year == 2025:
+        if day.weekday() < 5:
+            entries_by_month[day.month].append(_worked(day, 7, 14 + day.toordinal() % 3, 0))
+        day += timedelta(days=1)
+    return entries_by_month
+
+
+def _chained_carryovers(calc_service, entries_by_month, settings, year):
+    """Walk months in order, carrying each month's carryover_out into the next.
+
+    Each month is summarised from its own entries only; the first month starts
+    from settings.initial_hours_offset.
+
+    Returns:
+        Dict of month -> (carryover_in, carryover_out)
+    """
+    carryovers = {}
+    carryover = settings.initial_hours_offset
+    for month, month_entries in entries_by_month.items():
+        period_balance = calc_service.monthly_summary(month_entries, settings, year, month).period_balance
+        carryovers[month] = (carryover, carryover + period_balance)
+        carryover += period_balance
+    return carryovers
 
 
 class TestMonthlySummaryCarryover:
@@ -895,302 +572,122 @@ class TestMonthlySummaryCarryover:
     historical balances from previous months instead of using static carryover_hours.
     """
 
-    @pytest.mark.unit
-    def test_monthly_summary_carryover_in_from_historical_data(self):
+    def test_monthly_summary_carryover_in_from_historical_data(self, august_summary):
         """carryover_in for month N equals all_time_balance up to end of month N-1."""
-        # July entry: 10h worked on Monday = +3.6 balance (target 6.4h)
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10 hours
-            break_minutes=0,
-        )
-        # August entry: 8h worked on Monday = +1.6 balance
-        aug_entry = TimeEntryFactory.build(
-            work_date=date(2025, 8, 4),  # Monday
-            start_time=time(7, 0),
-            end_time=time(15, 0),  # 8 hours
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=date(2025, 7, 1),
-            initial_hours_offset=Decimal("5.00"),
-        )
-        service = TimeCalculationService()
+        assert august_summary.carryover_in == AUGUST_CARRYOVER_IN
 
-        # Pass ALL entries to monthly_summary (both July and August)
-        all_entries = [july_entry, aug_entry]
-        summary = service.monthly_summary(all_entries, settings, 2025, 8)
-
-        # carryover_in for August = July's balance (3.6) + initial_offset (5.0) = 8.6
-        assert summary.carryover_in == Decimal("8.60")
-
-    @pytest.mark.unit
-    def test_monthly_summary_first_tracked_month_uses_initial_offset(self):
+    def test_monthly_summary_first_tracked_month_uses_initial_offset(self, calc_service, july_entry):
         """First tracked month uses only initial_hours_offset as carryover_in."""
         # July is the first tracked month
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday in July
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10 hours = +3.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=date(2025, 7, 1),
-            initial_hours_offset=Decimal("15.50"),
+        initial_offset = Decimal("15.50")
+        settings = quick_settings(
+            weekly_target_hours=WEEKLY_TARGET_HOURS,
+            tracking_start_date=JULY_TRACKING_START,
+            initial_hours_offset=initial_offset,
         )
-        service = TimeCalculationService()
 
-        summary = service.monthly_summary([july_entry], settings, 2025, 7)
+        summary = calc_service.monthly_summary([july_entry], settings, 2025, 7)
 
-        # carryover_in for first tracked month = initial_offset only (15.50)
-        assert summary.carryover_in == Decimal("15.50")
+        # carryover_in for first tracked month = initial_offset only
+        assert summary.carryover_in == initial_offset
 
-    @pytest.mark.unit
-    def test_monthly_summary_carryover_out_calculation(self):
+    def test_monthly_summary_carryover_out_calculation(self, august_summary):
         """carryover_out equals carryover_in plus period_balance."""
-        # July entry: +3.6 balance
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10 hours
-            break_minutes=0,
-        )
-        # August entry: +1.6 balance
-        aug_entry = TimeEntryFactory.build(
-            work_date=date(2025, 8, 4),  # Monday
-            start_time=time(7, 0),
-            end_time=time(15, 0),  # 8 hours
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=date(2025, 7, 1),
-            initial_hours_offset=Decimal("10.00"),
-        )
-        service = TimeCalculationService()
+        assert august_summary.carryover_out == august_summary.carryover_in + august_summary.period_balance
 
-        all_entries = [july_entry, aug_entry]
-        summary = service.monthly_summary(all_entries, settings, 2025, 8)
-
-        # carryover_in = July balance (3.6) + initial_offset (10.0) = 13.6
-        expected_carryover_in = Decimal("13.60")
-        assert summary.carryover_in == expected_carryover_in
-
-        # carryover_out = carryover_in + August period_balance
-        assert summary.carryover_out == summary.carryover_in + summary.period_balance
-
-    @pytest.mark.unit
-    def test_monthly_summary_multi_month_accumulation(self):
+    def test_monthly_summary_multi_month_accumulation(self, calc_service, july_august_entries, july_tracking_settings):
         """carryover accumulates correctly across multiple months."""
-        # July entry: Monday 10h = +3.6
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday
-            start_time=time(7, 0),
-            end_time=time(17, 0),
-            break_minutes=0,
-        )
-        # August entry: Monday 8h = +1.6
-        aug_entry = TimeEntryFactory.build(
-            work_date=date(2025, 8, 4),  # Monday
-            start_time=time(7, 0),
-            end_time=time(15, 0),
-            break_minutes=0,
-        )
         # September entry: Monday 4h = -2.4
-        sept_entry = TimeEntryFactory.build(
-            work_date=date(2025, 9, 1),  # Monday
-            start_time=time(7, 0),
-            end_time=time(11, 0),
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=date(2025, 7, 1),
-            initial_hours_offset=Decimal("5.00"),
-        )
-        service = TimeCalculationService()
+        sept_entry = _worked(date(2025, 9, 1), 7, 11, 0)  # Monday
 
         # Get September summary with all historical entries
-        all_entries = [july_entry, aug_entry, sept_entry]
-        summary = service.monthly_summary(all_entries, settings, 2025, 9)
+        all_entries = [*july_august_entries, sept_entry]
+        summary = calc_service.monthly_summary(all_entries, july_tracking_settings, 2025, 9)
 
         # carryover_in for September = July balance (3.6) + August balance (1.6) + initial_offset (5.0) = 10.2
         assert summary.carryover_in == Decimal("10.20")
 
-    @pytest.mark.unit
-    def test_monthly_summary_calculates_carryover_from_historical_data(self):
-        """Carryover calculation uses historical data, not static field."""
-        # July entry: +3.6 balance
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday
-            start_time=time(7, 0),
-            end_time=time(17, 0),
-            break_minutes=0,
-        )
-        # August entry: +1.6 balance
-        aug_entry = TimeEntryFactory.build(
-            work_date=date(2025, 8, 4),  # Monday
-            start_time=time(7, 0),
-            end_time=time(15, 0),
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=date(2025, 7, 1),
-            initial_hours_offset=Decimal("5.00"),
-        )
-        service = TimeCalculationService()
-
-        all_entries = [july_entry, aug_entry]
-        summary = service.monthly_summary(all_entries, settings, 2025, 8)
-
-        # carryover_in should be calculated from historical data
-        # July balance (3.6) + initial_offset (5.0) = 8.6
-        assert summary.carryover_in == Decimal("8.60")
-
-    @pytest.mark.unit
-    def test_monthly_summary_no_tracking_start_returns_zero_carryover(self):
+    def test_monthly_summary_no_tracking_start_returns_zero_carryover(self, calc_service, default_settings, july_entry):
         """When tracking_start_date is None, carryover_in should be 0."""
-        entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday
-            start_time=time(7, 0),
-            end_time=time(17, 0),
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=None,  # No tracking start
-            initial_hours_offset=None,
-        )
-        service = TimeCalculationService()
-
-        summary = service.monthly_summary([entry], settings, 2025, 7)
+        # default_settings has no tracking start and no initial offset
+        summary = calc_service.monthly_summary([july_entry], default_settings, 2025, 7)
 
         # No tracking_start_date means carryover_in = 0
-        assert summary.carryover_in == Decimal("0.00")
+        assert summary.carryover_in == ZERO_HOURS
 
-    @pytest.mark.unit
-    def test_monthly_summary_first_month_mid_month_tracking_start(self):
+    def test_monthly_summary_first_month_mid_month_tracking_start(self, calc_service):
         """First tracked month with mid-month tracking_start uses initial_offset."""
         # Tracking starts July 15, entry on July 20
-        entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 20),  # Monday after tracking start
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10h = +3.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
+        entry = _worked(date(2025, 7, 20), 7, 17, 0)  # Monday after tracking start; 10h = +3.6
+        initial_offset = Decimal("12.00")
+        settings = quick_settings(
+            weekly_target_hours=WEEKLY_TARGET_HOURS,
             tracking_start_date=date(2025, 7, 15),  # Mid-month
-            initial_hours_offset=Decimal("12.00"),
+            initial_hours_offset=initial_offset,
         )
-        service = TimeCalculationService()
 
-        summary = service.monthly_summary([entry], settings, 2025, 7)
+        summary = calc_service.monthly_summary([entry], settings, 2025, 7)
 
         # First tracked month: carryover_in = initial_offset only
-        assert summary.carryover_in == Decimal("12.00")
+        assert summary.carryover_in == initial_offset
 
-    @pytest.mark.unit
-    def test_monthly_summary_second_month_after_mid_month_start(self):
+    def test_monthly_summary_second_month_after_mid_month_start(self, calc_service, august_entry):
         """Second month after mid-month tracking_start calculates from historical data."""
         # July tracking starts mid-month
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 21),  # Monday after July 15 start
-            start_time=time(7, 0),
-            end_time=time(17, 0),  # 10h = +3.6
-            break_minutes=0,
-        )
-        # August entry
-        aug_entry = TimeEntryFactory.build(
-            work_date=date(2025, 8, 4),  # Monday
-            start_time=time(7, 0),
-            end_time=time(15, 0),  # 8h = +1.6
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
+        july_entry = _worked(date(2025, 7, 21), 7, 17, 0)  # Monday after July 15 start; 10h = +3.6
+        settings = quick_settings(
+            weekly_target_hours=WEEKLY_TARGET_HOURS,
             tracking_start_date=date(2025, 7, 15),  # Mid-July
             initial_hours_offset=Decimal("8.00"),
         )
-        service = TimeCalculationService()
 
-        all_entries = [july_entry, aug_entry]
-        summary = service.monthly_summary(all_entries, settings, 2025, 8)
+        all_entries = [july_entry, august_entry]
+        summary = calc_service.monthly_summary(all_entries, settings, 2025, 8)
 
         # carryover_in for August = July balance (3.6) + initial_offset (8.0) = 11.6
         assert summary.carryover_in == Decimal("11.60")
 
-    @pytest.mark.unit
-    def test_monthly_summary_negative_historical_balance(self):
+    def test_monthly_summary_negative_historical_balance(self, calc_service, august_entry):
         """carryover_in can be negative if historical balance is negative."""
         # July entry: 4h worked = -2.4 balance
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday
-            start_time=time(7, 0),
-            end_time=time(11, 0),  # 4 hours
-            break_minutes=0,
-        )
-        # August entry
-        aug_entry = TimeEntryFactory.build(
-            work_date=date(2025, 8, 4),  # Monday
-            start_time=time(7, 0),
-            end_time=time(15, 0),
-            break_minutes=0,
+        july_entry = _worked(date(2025, 7, 7), 7, 11, 0)  # Monday; 4 hours
+        settings = quick_settings(
+            weekly_target_hours=WEEKLY_TARGET_HOURS,
+            tracking_start_date=JULY_TRACKING_START,
+            initial_hours_offset=ZERO_HOURS,
         )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=date(2025, 7, 1),
-            initial_hours_offset=Decimal("0.00"),
-        )
-        service = TimeCalculationService()
 
-        all_entries = [july_entry, aug_entry]
-        summary = service.monthly_summary(all_entries, settings, 2025, 8)
+        all_entries = [july_entry, august_entry]
+        summary = calc_service.monthly_summary(all_entries, settings, 2025, 8)
 
         # carryover_in for August = July balance (-2.4) + initial_offset (0.0) = -2.4
         assert summary.carryover_in == Decimal("-2.40")
 
-    @pytest.mark.unit
-    def test_monthly_summary_entries_parameter_must_include_all_historical(self):
+    def test_monthly_summary_entries_parameter_must_include_all_historical(
+        self, calc_service, july_august_entries, july_tracking_settings, august_summary
+    ):
         """Entries parameter must contain ALL historical entries, not just current month.
 
         This test documents the API requirement that callers must pass all entries
         from tracking_start_date onward, not just the current month's entries.
         """
-        # July entry: +3.6 balance
-        july_entry = TimeEntryFactory.build(
-            work_date=date(2025, 7, 7),  # Monday
-            start_time=time(7, 0),
-            end_time=time(17, 0),
-            break_minutes=0,
-        )
-        # August entry: +1.6 balance
-        aug_entry = TimeEntryFactory.build(
-            work_date=date(2025, 8, 4),  # Monday
-            start_time=time(7, 0),
-            end_time=time(15, 0),
-            break_minutes=0,
-        )
-        settings = UserSettingsFactory.build(
-            weekly_target_hours=Decimal("32.00"),
-            tracking_start_date=date(2025, 7, 1),
-            initial_hours_offset=Decimal("5.00"),
-        )
-        service = TimeCalculationService()
-
-        # CORRECT: Pass all historical entries
-        all_entries = [july_entry, aug_entry]
-        summary_with_history = service.monthly_summary(all_entries, settings, 2025, 8)
-        # carryover_in includes July's balance
-        assert summary_with_history.carryover_in == Decimal("8.60")
+        # CORRECT: Pass all historical entries; carryover_in includes July's balance
+        assert august_summary.carryover_in == AUGUST_CARRYOVER_IN
 
         # INCORRECT: Pass only August entries (demonstrates API contract)
-        august_only = [aug_entry]
-        summary_without_history = service.monthly_summary(august_only, settings, 2025, 8)
+        august_only = july_august_entries[1:]
+        summary_without_history = calc_service.monthly_summary(august_only, july_tracking_settings, 2025, 8)
         # carryover_in would only include initial_offset, missing July's balance
         # This demonstrates that callers MUST pass all historical entries
-        assert summary_without_history.carryover_in == Decimal("5.00")  # Just initial_offset
+        assert summary_without_history.carryover_in == july_tracking_settings.initial_hours_offset
+
+    def test_monthly_summary_incremental_matches_bulk(
+        self, calc_service, july_tracking_settings, second_half_2025_entries_by_month
+    ):
+        """Chaining month-only summaries gives the same carryovers as passing full history."""
+        all_entries = [entry for entries in second_half_2025_entries_by_month.values() for entry in entries]
+        chained = _chained_carryovers(calc_service, second_half_2025_entries_by_month, july_tracking_settings, 2025)
+
+        for month, carryovers in chained.items():
+            bulk = calc_service.monthly_summary(all_entries, july_tracking_settings, 2025, month)
+            assert carryovers == (bulk.carryover_in, bulk.carryover_out)
@@ -25,80 +25,88 @@ from source.services.vacation_calculation import (
 from tests.factories import TimeEntryFactory, UserSettingsFactory, VacationEntryFactory
 
 
-class TestCountVacationDays:
-    """Tests for VacationCalculationService.count_vacation_days method."""
+@pytest.fixture(scope="module")
+def service():
+    """One VacationCalculationService for the module; it holds no state between calls."""
+    return VacationCalculationService()
 
-    @pytest.mark.unit
-    def test_count_vacation_days_empty_list(self):
-        """Empty entry list returns 0 vacation days."""
-        service = VacationCalculationService()
-        start = date(2026, 1, 1)
-        end = date(2026, 1, 31)
-
-        result = service.count_vacation_days([], start, end)
 
-        assert result == Decimal("0")
+class TestCountVacationDays:
+    """Tests for VacationCalculationService.count_vacation_days method."""
 
+    # Entries are (work_date, absence_type) pairs counted over January 2026
     @pytest.mark.unit
-    def test_count_vacation_days_no_vacation_entries(self):
-        """List with only work entries returns 0 vacation days."""
-        entries = [
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 13),
-                absence_type=AbsenceType.NONE,
+    @pytest.mark.parametrize(
+        ("entries_spec", "expected"),
+        [
+            pytest.param([], Decimal("0"), id="empty_list"),
+            pytest.param(
+                [(date(2026, 1, 13), AbsenceType.NONE), (date(2026, 1, 14), AbsenceType.SICK)],
+                Decimal("0"),
+                id="no_vacation_entries",
             ),
-            TimeEntryFactory.build(
-                work_date=date(2026, 1, 14),
-                absence_type=AbsenceType.SICK,
+            pytest.param([(date(2026, 1, 13), AbsenceType.VACATION)], Decimal("1"), id="single_vacation"),
+            pytest.param(
+                [
+                    (date(2026, 1, 13), AbsenceType.VACATION),
+                    (date(2026, 1, 14), AbsenceType.VACATION),
+                    (date(2026, 1, 15), AbsenceType.VACATION),
+                ],
+                Decimal("3"),
+                id="multiple_vacations",
             ),
-        ]
-        service = VacationCalculationService()
-        start = date(2026, 1, 1)
-        end = date(2026, 1, 31)
-
-        result = service.count_vacation_days(entries, start, end)
-
-        assert result == Decimal("0")
-
-    @pytest.mark.unit
-    def test_count_vacation_days_single_vacation(self):
-        """Single vacation entry returns 1 day."""
-        entries = [
-            VacationEntryFactory.build(work_date=date(2026, 1, 13)),
-        ]
-        service = VacationCalculationService()
-        start = date(2026, 1, 1)
-        end = date(2026, 1, 31)
-
-        result = service.count_vacation_days(entries, start, end)
-
-        assert result == Decimal("1")
-
-    @pytest.mark.unit
-    def test_count_vacation_days_multiple_vacations(self):
-        """Multiple vacation entries return correct count."""
+            pytest.param(
+                [
+                    (date(2025, 12, 30), AbsenceType.VACATION),  # Before range
+                    (date(2026, 1, 13), AbsenceType.VACATION),
+                    (date(2026, 1, 14), AbsenceType.VACATION),
+                    (date(2026, 2, 1), AbsenceType.VACATION),  # After range
+                ],
+                Decimal("2"),
+                id="respects_date_range",
+            ),
+            pytest.param(
+                [
+                    (date(2026, 1, 13), AbsenceType.VACATION),
+                    (date(2026, 1, 14), AbsenceType.SICK),
+                    (date(2026, 1, 15), AbsenceType.HOLIDAY),
+                    (date(2026, 1, 16), AbsenceType.FLEX_TIME),
+                ],
+                Decimal("1"),
+                id="ignores_other_absence_types",
+            ),
+            pytest.param(
+                [
+                    (date(2026, 1, 16), AbsenceType.VACATION),  # Friday
+                    (date(2026, 1, 17), AbsenceType.VACATION),  # Saturday
+                    (date(2026, 1, 18), AbsenceType.VACATION),  # Sunday
+                ],
+                Decimal("1"),
+                id="ignores_weekends",
+            ),
+        ],
+    )
+    def test_count_vacation_days(self, service, entries_spec, expected):
+        """Only weekday VACATION entries within the range are counted, one day each."""
         entries = [
-            VacationEntryFactory.build(work_date=date(2026, 1, 13)),
-            VacationEntryFactory.build(work_date=date(2026, 1, 14)),
-            VacationEntryFactory.build(work_date=date(2026, 1, 15)),
+            (VacationEntryFactory if absence_type == AbsenceType.VACATION else TimeEntryFactory).build(
+                work_date=work_date, absence_type=absence_type
+            )
+            for work_date, absence_type in entries_spec
         ]
-        service = VacationCalculationService()
-        start = date(2026, 1, 1)
-        end = date(2026, 1, 31)
 
-        result = service.count_vacation_days(entries, start, end)
+        result = service.count_vacation_days(entries, date(2026, 1, 1), date(2026, 1, 31))
 
-        assert result == Decimal("3")
+        assert result == expected
 
     @pytest.mark.unit
-    def test_count_vacation_days_uses_fractional_vacation_days(self):
+    def test_count_vacation_days_uses_fractional_vacation_days(self, service):
         """Vacation entries consume their configured decimal vacation_days."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 1, 13), vacation_days=Decimal("0.50")),
             VacationEntryFactory.build(work_date=date(2026, 1, 14), vacation_days=Decimal("0.25")),
             VacationEntryFactory.build(work_date=date(2026, 1, 15), vacation_days=None),  # Legacy row
         ]
-        service = VacationCalculationService()
         start = date(2026, 1, 1)
         end = date(2026, 1, 31)
 
@@ -107,63 +115,12 @@ class TestCountVacationDays:
         assert result == Decimal("1.75")
 
     @pytest.mark.unit
-    def test_count_vacation_days_respects_date_range(self):
-        """Only counts vacation days within date range."""
-        entries = [
-            VacationEntryFactory.build(work_date=date(2025, 12, 30)),  # Before range
-            VacationEntryFactory.build(work_date=date(2026, 1, 13)),  # In range
-            VacationEntryFactory.build(work_date=date(2026, 1, 14)),  # In range
-            VacationEntryFactory.build(work_date=date(2026, 2, 1)),  # After range
-        ]
-        service = VacationCalculationService()
-        start = date(2026, 1, 1)
-        end = date(2026, 1, 31)
-
-        result = service.count_vacation_days(entries, start, end)
-
-        assert result == Decimal("2")
-
-    @pytest.mark.unit
-    def test_count_vacation_days_ignores_other_absence_types(self):
-        """Only counts VACATION absence type, not sick/holiday."""
-        entries = [
-            VacationEntryFactory.build(work_date=date(2026, 1, 13)),
-            TimeEntryFactory.build(work_date=date(2026, 1, 14), absence_type=AbsenceType.SICK),
-            TimeEntryFactory.build(work_date=date(2026, 1, 15), absence_type=AbsenceType.HOLIDAY),
-            TimeEntryFactory.build(work_date=date(2026, 1, 16), absence_type=AbsenceType.FLEX_TIME),
-        ]
-        service = VacationCalculationService()
-        start = date(2026, 1, 1)
-        end = date(2026, 1, 31)
-
-        result = service.count_vacation_days(entries, start, end)
-
-        assert result == Decimal("1")
-
-    @pytest.mark.unit
-    def test_count_vacation_days_ignores_weekends(self):
-        """Weekend vacation entries do not consume vacation days."""
-        entries = [
-            VacationEntryFactory.build(work_date=date(2026, 1, 16)),  # Friday
-            VacationEntryFactory.build(work_date=date(2026, 1, 17)),  # Saturday
-            VacationEntryFactory.build(work_date=date(2026, 1, 18)),  # Sunday
-        ]
-        service = VacationCalculationService()
-        start = date(2026, 1, 1)
-        end = date(2026, 1, 31)
-
-        result = service.count_vacation_days(entries, start, end)
-
-        assert result == Decimal("1")
-
-    @pytest.mark.unit
-    def test_count_vacation_days_ignores_german_public_holidays(self):
+    def test_count_vacation_days_ignores_german_public_holidays(self, service):
         """Vacation entries on known German public holidays do not consume vacation days."""
         entries = [
             VacationEntryFactory.build(work_date=date(2025, 10, 2)),  # Thursday
             VacationEntryFactory.build(work_date=date(2025, 10, 3)),  # German Unity Day
         ]
-        service = VacationCalculationService()
         start = date(2025, 10, 1)
         end = date(2025, 10, 31)
 
@@ -172,14 +129,13 @@ class TestCountVacationDays:
         assert result == Decimal("1")
 
     @pytest.mark.unit
-    def test_count_vacation_days_ignores_bundesland_holidays_from_settings(self):
+    def test_count_vacation_days_ignores_bundesland_holidays_from_settings(self, service):
         """Vacation entries on Bundesland holidays do not consume vacation days."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 6, 3)),  # Wednesday
             VacationEntryFactory.build(work_date=date(2026, 6, 4)),  # Fronleichnam in NRW
         ]
         settings = UserSettingsFactory.build(holiday_state="NW")
-        service = VacationCalculationService()
         start = date(2026, 6, 1)
         end = date(2026, 6, 30)
 
@@ -188,7 +144,7 @@ class TestCountVacationDays:
         assert result == Decimal("1.00")
 
     @pytest.mark.unit
-    def test_count_vacation_days_ignores_non_vacation_company_closures(self):
+    def test_count_vacation_days_ignores_non_vacation_company_closures(self, service):
         """Vacation entries on non-vacation company closures do not consume days."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 12, 23)),
@@ -208,7 +164,6 @@ class TestCountVacationDays:
                 }
             }
         )
-        service = VacationCalculationService()
         start = date(2026, 12, 1)
         end = date(2026, 12, 31)
 
@@ -221,14 +176,13 @@ class TestCalculateBalance:
     """Tests for VacationCalculationService.calculate_balance method."""
 
     @pytest.mark.unit
-    def test_calculate_balance_no_settings_returns_zero(self):
+    def test_calculate_balance_no_settings_returns_zero(self, service):
         """No settings provided returns balance with all zeros."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 1, 13)),
         ]
         # Note: UserSettings will need vacation fields added
         settings = UserSettingsFactory.build(tracking_start_date=None)
-        service = VacationCalculationService()
         as_of = date(2026, 1, 30)
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -240,7 +194,7 @@ class TestCalculateBalance:
         assert balance.carryover_expires is None
 
     @pytest.mark.unit
-    def test_calculate_balance_initial_only(self):
+    def test_calculate_balance_initial_only(self, service):
         """Balance with only initial days, no usage."""
         entries = []
         settings = UserSettingsFactory.build(
@@ -250,7 +204,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=None,
             tracking_start_date=date(2026, 1, 1),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 1, 30)
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -262,7 +215,7 @@ class TestCalculateBalance:
         assert balance.carryover_expires is None
 
     @pytest.mark.unit
-    def test_calculate_balance_with_usage(self):
+    def test_calculate_balance_with_usage(self, service):
         """Balance calculation with vacation days used."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 1, 13)),
@@ -276,7 +229,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=None,
             tracking_start_date=date(2026, 1, 1),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 1, 30)
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -286,7 +238,7 @@ class TestCalculateBalance:
         assert balance.days_remaining == Decimal("17.0")
 
     @pytest.mark.unit
-    def test_calculate_balance_annual_entitlement_adds_per_year(self):
+    def test_calculate_balance_annual_entitlement_adds_per_year(self, service):
         """Annual entitlement replaces the opening balance in later vacation years."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 6, 15)),
@@ -298,7 +250,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=None,
             tracking_start_date=date(2025, 1, 1),  # Started tracking over 1 year ago
         )
-        service = VacationCalculationService()
         as_of = date(2026, 6, 30)
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -308,7 +259,7 @@ class TestCalculateBalance:
         assert balance.days_remaining == Decimal("29.0")
 
     @pytest.mark.unit
-    def test_calculate_balance_opening_balance_and_next_year_entitlement(self):
+    def test_calculate_balance_opening_balance_and_next_year_entitlement(self, service):
         """A mid-year opening balance is exhausted in year one and annual entitlement starts Jan 1."""
         vacation_dates_2025 = [
             date(2025, 7, 4),
@@ -339,7 +290,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=None,
             tracking_start_date=date(2025, 7, 1),
         )
-        service = VacationCalculationService()
 
         opening_balance = service.calculate_balance(entries, settings, date(2025, 7, 1))
         end_of_2025_balance = service.calculate_balance(entries, settings, date(2025, 12, 31))
@@ -352,7 +302,7 @@ class TestCalculateBalance:
         assert start_of_2026_balance.days_remaining == Decimal("30.0")
 
     @pytest.mark.unit
-    def test_calculate_balance_does_not_automatically_carry_unused_opening_balance(self):
+    def test_calculate_balance_does_not_automatically_carry_unused_opening_balance(self, service):
         """Unused opening balance expires at year boundary unless explicit carryover is configured."""
         entries = [
             VacationEntryFactory.build(work_date=date(2025, 7, 4)),
@@ -365,7 +315,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=None,
             tracking_start_date=date(2025, 7, 1),
         )
-        service = VacationCalculationService()
 
         balance = service.calculate_balance(entries, settings, date(2026, 1, 1))
 
@@ -374,7 +323,7 @@ class TestCalculateBalance:
         assert balance.days_remaining == Decimal("30.0")
 
     @pytest.mark.unit
-    def test_carryover_valid_before_march_31(self):
+    def test_carryover_valid_before_march_31(self, service):
         """Carryover days are valid before March 31."""
         entries = []
         settings = UserSettingsFactory.build(
@@ -384,7 +333,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=date(2026, 3, 31),
             tracking_start_date=date(2026, 1, 1),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 2, 15)  # Before March 31
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -394,7 +342,7 @@ class TestCalculateBalance:
         assert balance.carryover_expires == date(2026, 3, 31)
 
     @pytest.mark.unit
-    def test_carryover_expires_after_march_31(self):
+    def test_carryover_expires_after_march_31(self, service):
         """Carryover days expire after March 31."""
         entries = []
         settings = UserSettingsFactory.build(
@@ -404,7 +352,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=date(2026, 3, 31),
             tracking_start_date=date(2026, 1, 1),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 4, 1)  # After March 31
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -415,7 +362,7 @@ class TestCalculateBalance:
         assert balance.carryover_expires == date(2026, 3, 31)
 
     @pytest.mark.unit
-    def test_used_carryover_does_not_reduce_base_entitlement_after_expiry(self):
+    def test_used_carryover_does_not_reduce_base_entitlement_after_expiry(self, service):
         """Vacation taken before carryover expiry consumes carryover before annual entitlement."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 1, 5)),
@@ -431,7 +378,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=date(2026, 3, 31),
             tracking_start_date=date(2026, 1, 1),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 4, 1)
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -441,7 +387,7 @@ class TestCalculateBalance:
         assert balance.days_remaining == Decimal("30.0")
 
     @pytest.mark.unit
-    def test_carryover_exactly_on_march_31_still_valid(self):
+    def test_carryover_exactly_on_march_31_still_valid(self, service):
         """Carryover is valid on March 31 exactly (inclusive)."""
         entries = []
         settings = UserSettingsFactory.build(
@@ -451,7 +397,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=date(2026, 3, 31),
             tracking_start_date=date(2026, 1, 1),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 3, 31)  # Exactly on expiry date
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -461,7 +406,7 @@ class TestCalculateBalance:
         assert balance.carryover_expires == date(2026, 3, 31)
 
     @pytest.mark.unit
-    def test_carryover_days_reflect_remaining_expiring_days(self):
+    def test_carryover_days_reflect_remaining_expiring_days(self, service):
         """Returned carryover_days subtracts vacation already allocated to carryover."""
         entries = [
             VacationEntryFactory.build(work_date=date(2026, 1, 5)),
@@ -474,7 +419,6 @@ class TestCalculateBalance:
             vacation_carryover_expires=date(2026, 3, 31),
             tracking_start_date=date(2026, 1, 1),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 3, 15)
 
         balance = service.calculate_balance(entries, settings, as_of)
@@ -491,7 +435,7 @@ class TestGetExpiryWarning:
     """Tests for VacationCalculationService.get_expiry_warning method."""
 
     @pytest.mark.unit
-    def test_no_warning_when_no_carryover(self):
+    def test_no_warning_when_no_carryover(self, service):
         """No warning when carryover_days is 0."""
         balance = VacationBalance(
             total_entitlement=Decimal("30.0"),
@@ -500,7 +444,6 @@ class TestGetExpiryWarning:
             carryover_days=Decimal("0"),
             carryover_expires=date(2026, 3, 31),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 3, 15)
 
         warning = service.get_expiry_warning(balance, as_of)
@@ -508,7 +451,7 @@ class TestGetExpiryWarning:
         assert warning is None
 
     @pytest.mark.unit
-    def test_no_warning_when_over_30_days_to_march(self):
+    def test_no_warning_when_over_30_days_to_march(self, service):
         """No warning when more than 30 days until March 31."""
         balance = VacationBalance(
             total_entitlement=Decimal("30.0"),
@@ -517,7 +460,6 @@ class TestGetExpiryWarning:
             carryover_days=Decimal("5.0"),
             carryover_expires=date(2026, 3, 31),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 1, 15)  # 76 days until March 31
 
         warning = service.get_expiry_warning(balance, as_of)
@@ -525,69 +467,35 @@ class TestGetExpiryWarning:
         assert warning is None
 
     @pytest.mark.unit
-    def test_info_warning_15_to_30_days(self):
-        """Info warning when 15-30 days until expiry."""
+    @pytest.mark.parametrize(
+        ("as_of", "carryover", "expected_severity"),
+        [
+            pytest.param(date(2026, 3, 15), Decimal("5.0"), "info", id="info_15_to_30_days"),  # 16 days left
+            pytest.param(date(2026, 3, 24), Decimal("8.5"), "warning", id="warning_7_to_14_days"),  # 7 days left
+            pytest.param(date(2026, 3, 28), Decimal("3.0"), "critical", id="critical_under_7_days"),  # 3 days left
+        ],
+    )
+    def test_expiry_warning_severity(self, service, as_of, carryover, expected_severity):
+        """Severity escalates from info to warning to critical as March 31 approaches."""
         balance = VacationBalance(
             total_entitlement=Decimal("30.0"),
             days_used=Decimal("0"),
             days_remaining=Decimal("30.0"),
-            carryover_days=Decimal("5.0"),
+            carryover_days=carryover,
             carryover_expires=date(2026, 3, 31),
         )
-        service = VacationCalculationService()
-        as_of = date(2026, 3, 15)  # 16 days until March 31
 
         warning = service.get_expiry_warning(balance, as_of)
 
         assert warning is not None
-        assert warning.severity == "info"
-        assert warning.days_expiring == Decimal("5.0")
+        assert warning.severity == expected_severity
+        assert warning.days_expiring == carryover
         assert warning.expiry_date == date(2026, 3, 31)
-        assert "5.0" in warning.message
+        assert str(carryover) in warning.message
         assert "2026-03-31" in warning.message
 
     @pytest.mark.unit
-    def test_warning_7_to_14_days(self):
-        """Warning severity when 7-14 days until expiry."""
-        balance = VacationBalance(
-            total_entitlement=Decimal("30.0"),
-            days_used=Decimal("0"),
-            days_remaining=Decimal("30.0"),
-            carryover_days=Decimal("8.5"),
-            carryover_expires=date(2026, 3, 31),
-        )
-        service = VacationCalculationService()
-        as_of = date(2026, 3, 24)  # 7 days until March 31
-
-        warning = service.get_expiry_warning(balance, as_of)
-
-        assert warning is not None
-        assert warning.severity == "warning"
-        assert warning.days_expiring == Decimal("8.5")
-        assert warning.expiry_date == date(2026, 3, 31)
-
-    @pytest.mark.unit
-    def test_critical_warning_under_7_days(self):
-        """Critical warning when 7 or fewer days until expiry."""
-        balance = VacationBalance(
-            total_entitlement=Decimal("30.0"),
-            days_used=Decimal("0"),
-            days_remaining=Decimal("30.0"),
-            carryover_days=Decimal("3.0"),
-            carryover_expires=date(2026, 3, 31),
-        )
-        service = VacationCalculationService()
-        as_of = date(2026, 3, 28)  # 3 days until March 31
-
-        warning = service.get_expiry_warning(balance, as_of)
-
-        assert warning is not None
-        assert warning.severity == "critical"
-        assert warning.days_expiring == Decimal("3.0")
-        assert warning.expiry_date == date(2026, 3, 31)
-
-    @pytest.mark.unit
-    def test_no_warning_after_march_31(self):
+    def test_no_warning_after_march_31(self, service):
         """No warning after March 31 (carryover expired)."""
         balance = VacationBalance(
             total_entitlement=Decimal("25.0"),
@@ -596,7 +504,6 @@ class TestGetExpiryWarning:
             carryover_days=Decimal("0"),  # Expired
             carryover_expires=date(2026, 3, 31),
         )
-        service = VacationCalculationService()
         as_of = date(2026, 4, 15)
 
         warning = service.get_expiry_warning(balance, as_of)
@@ -657,27 +564,14 @@ class TestVacationWarningDataclass:
         assert warning.expiry_date == date(2026, 3, 31)
 
     @pytest.mark.unit
-    def test_vacation_warning_severity_levels(self):
+    @pytest.mark.parametrize("severity", ["info", "warning", "critical"])
+    def test_vacation_warning_severity_levels(self, severity):
         """VacationWarning supports info, warning, critical severities."""
-        info = VacationWarning(
-            severity="info",
-            message="Info message",
-            days_expiring=Decimal("5.0"),
-            expiry_date=date(2026, 3, 31),
-        )
         warning = VacationWarning(
-            severity="warning",
-            message="Warning message",
-            days_expiring=Decimal("5.0"),
-            expiry_date=date(2026, 3, 31),
-        )
-        critical = VacationWarning(
-            severity="critical",
-            message="Critical message",
+            severity=severity,
+            message=f"{severity.capitalize()} message",
             days_expiring=Decimal("5.0"),
             expiry_date=date(2026, 3, 31),
         )
 
-        assert info.severity == "info"
-        assert warning.severity == "warning"
-        assert critical.severity == "critical"
+        assert warning.severity == severity
@@ -32,7 +32,7 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -54,7 +54,7 @@ class TestVacationKPIDisplay:
             vacation_carryover_expires=None,
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -71,16 +71,14 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Create 5 vacation entries
-        for day_offset in range(5):
-            entry = VacationEntryFactory.build(
-                user_id=1,
-                work_date=date(2026, 1, 10) + timedelta(days=day_offset),
-            )
-            db_session.add(entry)
-        db_session.commit()
+        db_session.add_all(
+            VacationEntryFactory.build(user_id=1, work_date=date(2026, 1, 10) + timedelta(days=day_offset))
+            for day_offset in range(5)
+        )
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -104,7 +102,7 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -128,7 +126,7 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -148,7 +146,7 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # GET /time-entries -> should show 30 remaining
         response = client.get("/time-entries")
@@ -181,16 +179,14 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         # Use all 3 vacation days
-        for day_offset in range(3):
-            entry = VacationEntryFactory.build(
-                user_id=1,
-                work_date=date(2026, 1, 10) + timedelta(days=day_offset),
-            )
-            db_session.add(entry)
-        db_session.commit()
+        db_session.add_all(
+            VacationEntryFactory.build(user_id=1, work_date=date(2026, 1, 10) + timedelta(days=day_offset))
+            for day_offset in range(3)
+        )
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -216,7 +212,7 @@ class TestVacationKPIDisplay:
                 vacation_days=Decimal("0.50"),
             )
         )
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -236,7 +232,7 @@ class TestVacationKPIDisplay:
         db_session.add(settings)
         db_session.add(VacationEntryFactory.build(user_id=1, work_date=date(2026, 1, 15)))
         db_session.add(VacationEntryFactory.build(user_id=1, work_date=date(2026, 2, 2)))
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries?month=1&year=2026")
 
@@ -263,8 +259,7 @@ class TestVacationKPIDisplay:
         """PATCH to vacation stores 1.00 vacation_days when the value is blank."""
         entry = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 15))
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -287,8 +282,7 @@ class TestVacationKPIDisplay:
             vacation_days=Decimal("0.50"),
         )
         db_session.add(entry)
-        db_session.commit()
-        db_session.refresh(entry)
+        db_session.flush()
 
         response = client.patch(
             f"/time-entries/{entry.id}",
@@ -334,9 +328,10 @@ class TestVacationKPIDisplay:
             date(2025, 12, 29),
             date(2025, 12, 30),
         ]
-        for work_date in vacation_dates_2025:
-            db_session.add(VacationEntryFactory.build(user_id=1, work_date=work_date))
-        db_session.commit()
+        db_session.add_all(
+            VacationEntryFactory.build(user_id=1, work_date=work_date) for work_date in vacation_dates_2025
+        )
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -355,7 +350,7 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries")
 
@@ -378,7 +373,7 @@ class TestVacationKPIDisplay:
             tracking_start_date=date(2026, 1, 1),
         )
         db_session.add(settings)
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/time-entries")
 
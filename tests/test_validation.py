@@ -7,113 +7,66 @@ import pytest
 from source.services.validation import VALIDATION_ERRORS, validate_time_entry
 from tests.factories import TimeEntryFactory
 
+# Expected messages, looked up once per module
+ERR_END_BEFORE_START = VALIDATION_ERRORS["end_before_start"]
+ERR_BREAK_EXCEEDS_DURATION = VALIDATION_ERRORS["break_exceeds_duration"]
+ERR_DUPLICATE_ENTRY = VALIDATION_ERRORS["duplicate_entry"]
+ERR_FUTURE_DATE = VALIDATION_ERRORS["future_date"]
+ERR_MISSING_END_TIME = VALIDATION_ERRORS["missing_end_time"]
+ERR_MISSING_START_TIME = VALIDATION_ERRORS["missing_start_time"]
+
+# Valid Wednesday entry that each case overrides; 7:00-15:00 without a break
+BASE_ENTRY_DATA = {
+    "user_id": 1,
+    "work_date": date(2026, 1, 14),
+    "start_time": time(7, 0),
+    "end_time": time(15, 0),
+    "break_minutes": 0,
+}
+FUTURE_DATE = date.today() + timedelta(days=7)
+
 
 class TestTimeEntryValidation:
     """Tests for validate_time_entry function."""
 
     @pytest.mark.unit
-    def test_valid_entry_passes(self):
+    @pytest.mark.parametrize(
+        ("overrides", "allow_future"),
+        [
+            pytest.param({"break_minutes": 30}, False, id="valid_entry"),
+            pytest.param({"work_date": FUTURE_DATE}, True, id="future_date_allowed"),
+        ],
+    )
+    def test_valid_entry_passes(self, overrides, allow_future):
         """Valid entry data returns empty error list."""
-        entry_data = {
-            "user_id": 1,
-            "work_date": date(2026, 1, 14),
-            "start_time": time(7, 0),
-            "end_time": time(15, 0),
-            "break_minutes": 30,
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[])
+        entry_data = {**BASE_ENTRY_DATA, **overrides}
+        errors = validate_time_entry(entry_data, existing_entries=[], allow_future=allow_future)
         assert errors == []
 
+    # existing_dates are work dates of entries the user already has
     @pytest.mark.unit
-    def test_end_before_start_fails(self):
-        """End time before start time is rejected."""
-        entry_data = {
-            "user_id": 1,
-            "work_date": date(2026, 1, 14),
-            "start_time": time(15, 0),
-            "end_time": time(7, 0),  # Before start
-            "break_minutes": 0,
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[])
-        assert VALIDATION_ERRORS["end_before_start"] in errors
-
-    @pytest.mark.unit
-    def test_break_exceeds_duration_fails(self):
-        """Break longer than work period is rejected."""
-        entry_data = {
-            "user_id": 1,
-            "work_date": date(2026, 1, 14),
-            "start_time": time(9, 0),
-            "end_time": time(10, 0),  # 1 hour
-            "break_minutes": 90,  # 1.5 hours
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[])
-        assert VALIDATION_ERRORS["break_exceeds_duration"] in errors
-
-    @pytest.mark.unit
-    def test_duplicate_date_fails(self):
-        """Two entries for same user and date is rejected."""
-        existing = TimeEntryFactory.build(user_id=1, work_date=date(2026, 1, 14))
-        entry_data = {
-            "user_id": 1,
-            "work_date": date(2026, 1, 14),  # Same date
-            "start_time": time(7, 0),
-            "end_time": time(15, 0),
-            "break_minutes": 0,
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[existing])
-        assert VALIDATION_ERRORS["duplicate_entry"] in errors
-
-    @pytest.mark.unit
-    def test_future_date_fails(self):
-        """Future date is rejected by default."""
-        future_date = date.today() + timedelta(days=7)
-        entry_data = {
-            "user_id": 1,
-            "work_date": future_date,
-            "start_time": time(7, 0),
-            "end_time": time(15, 0),
-            "break_minutes": 0,
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[], allow_future=False)
-        assert VALIDATION_ERRORS["future_date"] in errors
-
-    @pytest.mark.unit
-    def test_future_date_allowed(self):
-        """Future date passes when allow_future=True."""
-        future_date = date.today() + timedelta(days=7)
-        entry_data = {
-            "user_id": 1,
-            "work_date": future_date,
-            "start_time": time(7, 0),
-            "end_time": time(15, 0),
-            "break_minutes": 0,
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[], allow_future=True)
-        assert VALIDATION_ERRORS["future_date"] not in errors
-
-    @pytest.mark.unit
-    def test_missing_end_time_fails(self):
-        """Start time without end time is rejected."""
-        entry_data = {
-            "user_id": 1,
-            "work_date": date(2026, 1, 14),
-            "start_time": time(7, 0),
-            "end_time": None,  # Missing
-            "break_minutes": 0,
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[])
-        assert VALIDATION_ERRORS["missing_end_time"] in errors
-
-    @pytest.mark.unit
-    def test_missing_start_time_fails(self):
-        """End time without start time is rejected."""
-        entry_data = {
-            "user_id": 1,
-            "work_date": date(2026, 1, 14),
-            "start_time": None,  # Missing
-            "end_time": time(15, 0),
-            "break_minutes": 0,
-        }
-        errors = validate_time_entry(entry_data, existing_entries=[])
-        assert VALIDATION_ERRORS["missing_start_time"] in errors
+    @pytest.mark.parametrize(
+        ("overrides", "existing_dates", "expected_error"),
+        [
+            pytest.param(
+                {"start_time": time(15, 0), "end_time": time(7, 0)}, [], ERR_END_BEFORE_START, id="end_before_start"
+            ),
+            pytest.param(
+                # 1 hour worked, 1.5 hour break
+                {"start_time": time(9, 0), "end_time": time(10, 0), "break_minutes": 90},
+                [],
+                ERR_BREAK_EXCEEDS_DURATION,
+                id="break_exceeds_duration",
+            ),
+            pytest.param({}, [date(2026, 1, 14)], ERR_DUPLICATE_ENTRY, id="duplicate_date"),
+            pytest.param({"work_date": FUTURE_DATE}, [], ERR_FUTURE_DATE, id="future_date"),
+            pytest.param({"end_time": None}, [], ERR_MISSING_END_TIME, id="missing_end_time"),
+            pytest.param({"start_time": None}, [], ERR_MISSING_START_TIME, id="missing_start_time"),
+        ],
+    )
+    def test_invalid_entry_fails(self, overrides, existing_dates, expected_error):
+        """Each invalid entry is rejected with its specific message; future dates are rejected by default."""
+        entry_data = {**BASE_ENTRY_DATA, **overrides}
+        existing = [TimeEntryFactory.build(user_id=1, work_date=work_date) for work_date in existing_dates]
+        errors = validate_time_entry(entry_data, existing_entries=existing)
+        assert expected_error in errors